@@ -0,0 +1,128 @@
+"""
+HCM 테스트 도구용 OpenMetrics 엔드포인트
+Embedded OpenMetrics (Prometheus) exporter for HCM test scripts
+
+벤치마크/안정성 시뮬레이션과 같은 이벤트 루프에서 aiohttp로 /metrics를 제공한다.
+수집기(collector)는 스크랩 시점에만 호출되어 집계기의 현재 값을 읽으므로,
+요청 경로에는 아무 작업도 추가되지 않는다.
+
+사용 예:
+    async with OpenMetricsExporter(port=9464) as exporter:
+        exporter.register(lambda: [gauge('hcm_example', '예시', [({}, 1.0)])])
+        ...
+    curl http://127.0.0.1:9464/metrics
+"""
+
+import math
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from aiohttp import web
+
+CONTENT_TYPE = 'application/openmetrics-text; version=1.0.0; charset=utf-8'
+
+# (레이블, 값)
+Sample = Tuple[Dict[str, str], float]
+
+@dataclass
+class MetricFamily:
+    name: str
+    type: str  # counter, gauge, histogram
+    help: str
+    # (이름 접미사, 레이블, 값) - 예: ('_total', {'test': 'x'}, 10)
+    samples: List[Tuple[str, Dict[str, str], float]] = field(default_factory=list)
+
+def counter(name: str, help: str, samples: Iterable[Sample]) -> MetricFamily:
+    return MetricFamily(name, 'counter', help, [('_total', labels, value) for labels, value in samples])
+
+def gauge(name: str, help: str, samples: Iterable[Sample]) -> MetricFamily:
+    return MetricFamily(name, 'gauge', help, [('', labels, value) for labels, value in samples])
+
+def histogram(name: str, help: str,
+              series: Iterable[Tuple[Dict[str, str], Sequence[Tuple[float, float]], float, float]]) -> MetricFamily:
+    """series: (레이블, [(상한 le, 누적 개수)...], 전체 개수, 합계), +Inf 버킷은 자동 추가"""
+    family = MetricFamily(name, 'histogram', help)
+    for labels, buckets, count, total in series:
+        for upper, cumulative in buckets:
+            family.samples.append(('_bucket', {**labels, 'le': f'{upper:.6g}'}, cumulative))
+        family.samples.append(('_bucket', {**labels, 'le': '+Inf'}, count))
+        family.samples.append(('_count', labels, count))
+        family.samples.append(('_sum', labels, total))
+    return family
+
+def format_value(value: float) -> str:
+    if value is None or (isinstance(value, float) and math.isnan(value)):
+        return 'NaN'
+    if math.isinf(value):
+        return '+Inf' if value > 0 else '-Inf'
+    if float(value).is_integer() and abs(value) < 1e15:
+        return str(int(value))
+    return repr(float(value))
+
+def _escape(value: str) -> str:
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+def render(families: Iterable[MetricFamily]) -> str:
+    """OpenMetrics 텍스트 형식으로 직렬화 (# EOF로 끝남)"""
+    lines = []
+    for family in families:
+        lines.append(f"# TYPE {family.name} {family.type}")
+        lines.append(f"# HELP {family.name} {_escape(family.help)}")
+        for suffix, labels, value in family.samples:
+            label_text = ','.join(f'{key}="{_escape(val)}"' for key, val in labels.items())
+            lines.append(f"{family.name}{suffix}{{{label_text}}} {format_value(value)}" if label_text
+                         else f"{family.name}{suffix} {format_value(value)}")
+    lines.append('# EOF')
+    return '\n'.join(lines) + '\n'
+
+class OpenMetricsExporter:
+    """현재 이벤트 루프에서 /metrics를 제공하는 내장 HTTP 서버"""
+
+    def __init__(self, port: int = 9464, host: str = '127.0.0.1'):
+        self.port = port
+        self.host = host
+        self.collectors: List[Callable[[], Iterable[MetricFamily]]] = []
+        self.scrapes = 0
+        self._runner: Optional[web.AppRunner] = None
+
+    def register(self, collector: Callable[[], Iterable[MetricFamily]]):
+        self.collectors.append(collector)
+
+    def collect(self) -> List[MetricFamily]:
+        families: Dict[str, MetricFamily] = {}
+        for collector in self.collectors:
+            for family in collector():
+                # 같은 이름의 family는 하나로 합침 (OpenMetrics는 중복 family를 허용하지 않음)
+                existing = families.get(family.name)
+                if existing is None:
+                    families[family.name] = family
+                else:
+                    existing.samples.extend(family.samples)
+        return list(families.values())
+
+    async def handle_metrics(self, request: web.Request) -> web.Response:
+        self.scrapes += 1
+        return web.Response(text=render(self.collect()), headers={'Content-Type': CONTENT_TYPE})
+
+    async def start(self) -> 'OpenMetricsExporter':
+        app = web.Application()
+        app.router.add_get('/metrics', self.handle_metrics)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self.host, self.port)
+        await site.start()
+        # port=0이면 실제로 할당된 포트로 갱신
+        self.port = self._runner.addresses[0][1]
+        print(f"📡 OpenMetrics 엔드포인트: http://{self.host}:{self.port}/metrics")
+        return self
+
+    async def stop(self):
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def __aenter__(self) -> 'OpenMetricsExporter':
+        return await self.start()
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.stop()
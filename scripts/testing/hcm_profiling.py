@@ -0,0 +1,210 @@
+"""
+HCM 테스트 도구용 프로파일링 훅
+Opt-in profiling hooks for HCM test scripts (sampling / cProfile / tracemalloc / phase timers)
+
+- sample: 별도 스레드가 일정 간격으로 대상 스레드의 스택을 읽어 collapsed-stack
+  파일(flamegraph.pl, speedscope, inferno 입력 형식)로 저장. 측정 대상 코드는 계측하지 않음
+  (샘플은 GIL을 얻는 시점에 찍히므로 I/O 위주 이벤트 루프에서는 소켓 write/select 비중이 부풀려짐)
+- cprofile: cProfile로 함수별 호출 수/누적 시간을 .prof(pstats) 파일로 저장
+- allocations: tracemalloc 스냅샷 차이를 코드 위치별로 저장
+- phase(): 데이터 생성, 점수 계산, 정렬, DataFrame 생성, I/O 등 구간별 경과 시간 누적
+
+사용 예:
+    profiler = Profiler(ProfileOptions(mode='sample', allocations=True))
+    with profiler.profile('matching'):
+        with profiler.phase('scoring'):
+            ...
+    profiler.report()
+"""
+
+import contextlib
+import cProfile
+import json
+import os
+import pstats
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional
+
+@dataclass
+class ProfileOptions:
+    mode: Optional[str] = None  # None, 'sample', 'cprofile'
+    interval: float = 0.005  # 샘플링 간격 (초)
+    allocations: bool = False  # tracemalloc 스냅샷 비교
+    output_dir: str = './test-results'
+    top: int = 15  # 콘솔에 출력할 상위 항목 수
+
+class StackSampler:
+    """대상 스레드의 호출 스택을 주기적으로 읽어 collapsed stack 별 횟수를 세는 샘플링 프로파일러"""
+
+    def __init__(self, interval: float = 0.005, thread_id: Optional[int] = None):
+        self.interval = interval
+        self.thread_id = thread_id or threading.get_ident()
+        self.stacks: Counter = Counter()
+        self.samples = 0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @staticmethod
+    def _frame_name(frame) -> str:
+        code = frame.f_code
+        return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None:
+                continue
+            names = []
+            while frame is not None:
+                names.append(self._frame_name(frame))
+                frame = frame.f_back
+            self.stacks[';'.join(reversed(names))] += 1
+            self.samples += 1
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name='hcm-stack-sampler', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def write_collapsed(self, path: str):
+        with open(path, 'w', encoding='utf-8') as f:
+            for stack, count in self.stacks.most_common():
+                f.write(f"{stack} {count}\n")
+
+    def top_functions(self, limit: int) -> List[tuple]:
+        """스택 맨 위(실제로 실행 중이던) 함수별 샘플 수"""
+        leaves = Counter()
+        for stack, count in self.stacks.items():
+            leaves[stack.rsplit(';', 1)[-1]] += count
+        return leaves.most_common(limit)
+
+class Profiler:
+    """profile() 구간마다 프로파일 파일을 남기고, phase() 구간 시간을 누적"""
+
+    def __init__(self, options: Optional[ProfileOptions] = None):
+        self.options = options or ProfileOptions()
+        self.phase_seconds: Dict[str, float] = {}
+        self.phase_calls: Dict[str, int] = {}
+        self.outputs: List[str] = []
+        self._active = False
+        self._timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        # 같은 라벨이 한 실행에서 여러 번 프로파일링되면 파일명에 순번을 붙여 덮어쓰지 않음
+        self._label_counts: Dict[str, int] = {}
+
+    @property
+    def enabled(self) -> bool:
+        return self.options.mode is not None or self.options.allocations
+
+    @contextlib.contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """구간 경과 시간 누적 (중첩 가능, 바깥 구간은 안쪽 시간을 포함)"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phase_seconds[name] = self.phase_seconds.get(name, 0.0) + time.perf_counter() - started
+            self.phase_calls[name] = self.phase_calls.get(name, 0) + 1
+
+    def _path(self, label: str, suffix: str) -> str:
+        safe = ''.join(c if c.isalnum() or c in '-_' else '_' for c in label).strip('_')
+        os.makedirs(self.options.output_dir, exist_ok=True)
+        return os.path.join(self.options.output_dir, f"profile_{safe}_{self._timestamp}{suffix}")
+
+    @contextlib.contextmanager
+    def profile(self, label: str) -> Iterator[None]:
+        """구간 전체를 선택한 방식으로 프로파일링 (mode가 없고 allocations도 꺼져 있으면 아무것도 안 함)"""
+        # 이미 프로파일링 중이면(중첩/동시 실행 코루틴) 바깥 구간에 포함시킴
+        if not self.enabled or self._active:
+            yield
+            return
+        self._active = True
+        count = self._label_counts[label] = self._label_counts.get(label, 0) + 1
+        if count > 1:
+            label = f"{label}_{count}"
+
+        sampler = profile = snapshot = None
+        started_tracing = False
+        if self.options.allocations:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start(10)
+                started_tracing = True
+            snapshot = tracemalloc.take_snapshot()
+        if self.options.mode == 'sample':
+            sampler = StackSampler(self.options.interval)
+            sampler.start()
+        elif self.options.mode == 'cprofile':
+            profile = cProfile.Profile()
+            profile.enable()
+
+        try:
+            yield
+        finally:
+            self._active = False
+            if profile is not None:
+                profile.disable()
+                self._save_cprofile(label, profile)
+            if sampler is not None:
+                sampler.stop()
+                self._save_samples(label, sampler)
+            if snapshot is not None:
+                self._save_allocations(label, snapshot, tracemalloc.take_snapshot())
+                if started_tracing:
+                    tracemalloc.stop()
+
+    def _save_samples(self, label: str, sampler: StackSampler):
+        path = self._path(label, '.collapsed')
+        sampler.write_collapsed(path)
+        self.outputs.append(path)
+        print(f"🔬 [{label}] 샘플 {sampler.samples}개 ({self.options.interval * 1000:.0f}ms 간격) → {path}")
+        for name, count in sampler.top_functions(self.options.top):
+            print(f"   {count / max(sampler.samples, 1):6.1%}  {name}")
+
+    def _save_cprofile(self, label: str, profile: cProfile.Profile):
+        path = self._path(label, '.prof')
+        profile.dump_stats(path)
+        self.outputs.append(path)
+        print(f"🔬 [{label}] cProfile → {path} (상위 {self.options.top}개, 누적 시간순)")
+        pstats.Stats(profile, stream=sys.stdout).strip_dirs().sort_stats('cumulative').print_stats(self.options.top)
+
+    def _save_allocations(self, label: str, before: 'tracemalloc.Snapshot', after: 'tracemalloc.Snapshot'):
+        path = self._path(label, '.alloc.txt')
+        # 샘플러 스레드와 tracemalloc 자체의 할당은 제외
+        ignore = [tracemalloc.Filter(False, __file__), tracemalloc.Filter(False, tracemalloc.__file__),
+                  tracemalloc.Filter(False, threading.__file__)]
+        stats = after.filter_traces(ignore).compare_to(before.filter_traces(ignore), 'lineno')
+        current, peak = tracemalloc.get_traced_memory()
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(f"# traced current {current / 1024 / 1024:.2f} MB, peak {peak / 1024 / 1024:.2f} MB\n")
+            for stat in stats:
+                f.write(f"{stat}\n")
+        self.outputs.append(path)
+        print(f"🧠 [{label}] 메모리 할당 변화 (최대 {peak / 1024 / 1024:.1f}MB) → {path}")
+        for stat in stats[:self.options.top]:
+            frame = stat.traceback[0]
+            print(f"   {stat.size_diff / 1024:+10.1f}KB {stat.count_diff:+8d}개  "
+                  f"{os.path.basename(frame.filename)}:{frame.lineno}")
+
+    def report(self, label: str = 'phases') -> Optional[str]:
+        """구간별 시간 표 출력 및 JSON 저장"""
+        if not self.phase_seconds:
+            return None
+        print("\n⏱️ 구간별 시간:")
+        for name, seconds in sorted(self.phase_seconds.items(), key=lambda item: -item[1]):
+            print(f"   {name:24} {seconds:9.3f}s  ({self.phase_calls[name]}회)")
+
+        path = self._path(label, '.json')
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({name: {'seconds': seconds, 'calls': self.phase_calls[name]}
+                       for name, seconds in self.phase_seconds.items()}, f, indent=2, ensure_ascii=False)
+        self.outputs.append(path)
+        return path
@@ -0,0 +1,399 @@
+"""
+HCM 테스트 결과 보고서 공유 모듈
+Shared report rendering pipeline for HCM test scripts
+
+performance-benchmark.py, reliability-simulation.py, mathematical-verification.py가
+결과를 컬럼 단위(이름 → numpy 배열)로 넘기면, 그래프는 백그라운드 프로세스 풀에서
+Agg 백엔드로 렌더링한다. 화면 출력(show)이 필요한 경우에만 메인 프로세스에서 그린다.
+
+하이픈이 들어간 스크립트와 달리 프로세스 풀 작업자가 import할 수 있도록
+모듈 이름을 hcm_reports로 둔다.
+
+사용 예:
+    renderer = ReportRenderer(ReportOptions(quick=True, html=True))
+    renderer.submit(ReportFigure('reliability', columns, './test-results/reliability_analysis.png',
+                                 labels={'service': names}, summary=metrics))
+    renderer.finish('HCM 시스템 안정성 분석', html_file='./test-results/reliability_report.html')
+"""
+
+import base64
+import html
+import os
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+# 기본 해상도와 빠른 보고서(--quick-report) 해상도
+FULL_DPI = 300
+QUICK_DPI = 72
+# 빠른 보고서에서 산점도에 그릴 최대 점 수
+QUICK_SCATTER_POINTS = 5000
+
+@dataclass
+class ReportOptions:
+    show: bool = False  # True면 메인 프로세스에서 그리고 화면에 표시
+    quick: bool = False  # True면 낮은 해상도로 빠르게 렌더링
+    html: bool = False  # True면 그래프와 요약을 담은 HTML 보고서도 생성
+    max_workers: int = 2
+
+    @property
+    def dpi(self) -> int:
+        return QUICK_DPI if self.quick else FULL_DPI
+
+@dataclass
+class ReportFigure:
+    kind: str  # FIGURES의 키
+    columns: Dict[str, np.ndarray]
+    path: str
+    # 정수 코드 컬럼의 이름표 (예: {'service': ['hcm-api-gateway', ...]})
+    labels: Dict[str, List[str]] = field(default_factory=dict)
+    summary: Dict[str, Any] = field(default_factory=dict)
+
+def load_pyplot(headless: bool = False):
+    """matplotlib 지연 로드 (headless면 화면 없이 Agg 백엔드 사용)"""
+    import matplotlib
+    if headless:
+        matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    plt.style.use('default')
+
+    # 한글 폰트 설정
+    plt.rcParams['font.family'] = ['Malgun Gothic', 'DejaVu Sans']
+    plt.rcParams['axes.unicode_minus'] = False
+    return plt
+
+def group_mean(codes: np.ndarray, values: np.ndarray, size: int) -> np.ndarray:
+    """정수 코드별 평균 (값이 없는 그룹은 NaN)"""
+    counts = np.bincount(codes, minlength=size).astype(float)
+    sums = np.bincount(codes, weights=values, minlength=size)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return sums / counts
+
+def present_groups(codes: np.ndarray, names: List[str]) -> Tuple[np.ndarray, List[str]]:
+    """데이터가 있는 그룹 코드를 이름순으로 정렬해 반환"""
+    present = np.flatnonzero(np.bincount(codes, minlength=len(names)))
+    order = sorted(present, key=lambda code: names[code])
+    return np.array(order, dtype=int), [names[code] for code in order]
+
+def _bar_panel(ax, labels: List[str], values, title: str, ylabel: str, color='skyblue'):
+    ax.bar(range(len(labels)), values, color=color, alpha=0.7)
+    ax.set_title(title)
+    ax.set_xlabel('테스트')
+    ax.set_ylabel(ylabel)
+    ax.set_xticks(range(len(labels)))
+    ax.set_xticklabels(labels, rotation=45, ha='right')
+
+def plot_performance(plt, figure: ReportFigure, quick: bool):
+    """성능 벤치마크 6분할 그래프"""
+    cols = figure.columns
+    fig, axes = plt.subplots(2, 3, figsize=(20, 12))
+    fig.suptitle('HCM 시스템 성능 벤치마킹 결과', fontsize=16, fontweight='bold')
+
+    short_names = [name.split(' - ')[0] for name in figure.labels['test_name']]
+    success_rates = cols['successful_requests'] / np.maximum(cols['total_requests'], 1) * 100
+
+    # 1-2. 평균 응답 시간, 처리량
+    _bar_panel(axes[0, 0], short_names, cols['avg_response_time'], '평균 응답 시간 (ms)', '응답 시간 (ms)')
+    _bar_panel(axes[0, 1], short_names, cols['requests_per_second'], '처리량 (Requests/sec)',
+               'Requests/sec', color='green')
+
+    # 3. 성공률
+    colors = np.where(success_rates < 95, 'red', np.where(success_rates < 99, 'orange', 'green'))
+    _bar_panel(axes[0, 2], short_names, success_rates, '성공률 (%)', '성공률 (%)', color=colors)
+    axes[0, 2].set_ylim(0, 105)
+
+    # 4. 95th vs 99th Percentile 비교
+    x = np.arange(len(short_names))
+    width = 0.35
+    axes[1, 0].bar(x - width/2, cols['percentile_95'], width, label='95th Percentile', color='orange', alpha=0.7)
+    axes[1, 0].bar(x + width/2, cols['percentile_99'], width, label='99th Percentile', color='red', alpha=0.7)
+    axes[1, 0].set_title('응답 시간 백분위수 (ms)')
+    axes[1, 0].set_xlabel('테스트')
+    axes[1, 0].set_ylabel('응답 시간 (ms)')
+    axes[1, 0].set_xticks(x)
+    axes[1, 0].set_xticklabels(short_names, rotation=45, ha='right')
+    axes[1, 0].legend()
+
+    # 5-6. 에러율, 데이터 처리량
+    _bar_panel(axes[1, 1], short_names, cols['error_rate'], '에러율 (%)', '에러율 (%)', color='red')
+    _bar_panel(axes[1, 2], short_names, cols['throughput_mb_per_sec'], '데이터 처리량 (MB/s)',
+               '처리량 (MB/s)', color='purple')
+    return fig
+
+def plot_reliability(plt, figure: ReportFigure, quick: bool):
+    """안정성 시뮬레이션 6분할 그래프 (timestamp는 epoch 초, service/status는 정수 코드)"""
+    cols = figure.columns
+    service_names = figure.labels['service']
+    status_names = figure.labels['status']
+    metrics = figure.summary
+
+    fig, axes = plt.subplots(3, 2, figsize=(20, 15))
+    fig.suptitle('HCM 시스템 안정성 분석', fontsize=16, fontweight='bold')
+
+    # 1. 시간별 전체 시스템 가용성 (5분 구간 평균)
+    buckets = (cols['timestamp'] // 300).astype(np.int64)
+    bucket_ids, bucket_codes = np.unique(buckets, return_inverse=True)
+    time_availability = group_mean(bucket_codes, cols['availability'], len(bucket_ids))
+    bucket_times = (bucket_ids * 300).astype('datetime64[s]')
+    axes[0, 0].plot(bucket_times, time_availability, linewidth=2, color='blue')
+    axes[0, 0].set_title('시간별 시스템 가용성')
+    axes[0, 0].set_ylabel('가용성 (%)')
+    axes[0, 0].set_ylim(0, 1.05)
+    axes[0, 0].grid(True, alpha=0.3)
+    axes[0, 0].axhline(y=0.995, color='red', linestyle='--', alpha=0.7, label='SLA 목표 (99.5%)')
+    axes[0, 0].legend()
+
+    # 2. 서비스별 가용성
+    services = cols['service']
+    codes, names = present_groups(services, service_names)
+    short_names = [name.replace('hcm-', '') for name in names]
+    service_availability = group_mean(services, cols['availability'], len(service_names))[codes]
+    axes[0, 1].bar(range(len(codes)), service_availability,
+                   color=np.where(service_availability < 0.99, 'red',
+                                  np.where(service_availability < 0.995, 'orange', 'green')), alpha=0.7)
+    axes[0, 1].set_title('서비스별 평균 가용성')
+    axes[0, 1].set_ylabel('가용성')
+    axes[0, 1].set_xticks(range(len(codes)))
+    axes[0, 1].set_xticklabels(short_names, rotation=45, ha='right')
+    axes[0, 1].axhline(y=0.995, color='red', linestyle='--', alpha=0.7)
+    axes[0, 1].set_ylim(0, 1.05)
+
+    # 3. 응답시간 분포 (히스토그램은 미리 집계해서 막대로 그림)
+    response_times = cols['response_time'][cols['response_time'] > 0]
+    if len(response_times) > 0:
+        counts, edges = np.histogram(response_times, bins=30)
+        axes[1, 0].stairs(counts, edges, fill=True, alpha=0.7, color='skyblue', edgecolor='black')
+        axes[1, 0].set_title('응답시간 분포')
+        axes[1, 0].set_xlabel('응답시간 (ms)')
+        axes[1, 0].set_ylabel('빈도')
+        axes[1, 0].axvline(response_times.mean(), color='red', linestyle='--',
+                           label=f'평균: {response_times.mean():.1f}ms')
+        axes[1, 0].legend()
+
+    # 4. 리소스 사용률
+    avg_cpu = group_mean(services, cols['cpu_usage'], len(service_names))[codes]
+    avg_memory = group_mean(services, cols['memory_usage'], len(service_names))[codes]
+    x = np.arange(len(codes))
+    width = 0.35
+    axes[1, 1].bar(x - width/2, avg_cpu, width, label='CPU 사용률', alpha=0.7, color='orange')
+    axes[1, 1].bar(x + width/2, avg_memory, width, label='메모리 사용률', alpha=0.7, color='purple')
+    axes[1, 1].set_title('서비스별 평균 리소스 사용률')
+    axes[1, 1].set_ylabel('사용률 (%)')
+    axes[1, 1].set_xticks(x)
+    axes[1, 1].set_xticklabels(short_names, rotation=45, ha='right')
+    axes[1, 1].legend()
+
+    # 5. 서비스 상태 분포
+    status_counts = np.bincount(cols['status'], minlength=len(status_names))
+    present = np.flatnonzero(status_counts)
+    order = present[np.argsort(-status_counts[present], kind='stable')]
+    colors = {'healthy': 'green', 'degraded': 'orange', 'failed': 'red', 'recovering': 'blue'}
+    axes[2, 0].pie(status_counts[order], labels=[status_names[code] for code in order], autopct='%1.1f%%',
+                   colors=[colors.get(status_names[code], 'gray') for code in order], startangle=90)
+    axes[2, 0].set_title('전체 측정 기간 서비스 상태 분포')
+
+    # 6. 안정성 지표 요약
+    def optional(value, spec: str, unit: str) -> str:
+        return f"{value:{spec}}{unit}" if value is not None else "N/A"
+
+    table_data = [
+        ('전체 가용성', f"{metrics.get('overall_availability', 0)*100:.2f}%"),
+        ('평균 응답시간', f"{metrics.get('avg_response_time', 0):.1f}ms"),
+        ('안정성 점수', f"{metrics.get('reliability_score', 0):.1f}/100"),
+        ('MTTR', optional(metrics.get('mttr_minutes'), '.1f', '분')),
+        ('MTBF', optional(metrics.get('mtbf_hours'), '.1f', '시간')),
+    ]
+    axes[2, 1].axis('off')
+    table = axes[2, 1].table(cellText=table_data, colLabels=['지표', '값'], cellLoc='center', loc='center')
+    table.auto_set_font_size(False)
+    table.set_fontsize(12)
+    table.scale(1.2, 1.5)
+    axes[2, 1].set_title('안정성 지표 요약')
+    return fig
+
+def plot_matching(plt, figure: ReportFigure, quick: bool):
+    """매칭 알고리즘 검증 6분할 그래프"""
+    cols = figure.columns
+    fig, axes = plt.subplots(2, 3, figsize=(18, 12))
+    fig.suptitle('HCM 매칭 알고리즘 성능 분석', fontsize=16, fontweight='bold')
+    match_score = cols['match_score']
+
+    # 1. 매칭 점수 분포
+    counts, edges = np.histogram(match_score, bins=30)
+    axes[0, 0].stairs(counts, edges, fill=True, alpha=0.7, color='skyblue', edgecolor='black')
+    axes[0, 0].set_title('매칭 점수 분포')
+    axes[0, 0].set_xlabel('매칭 점수')
+    axes[0, 0].set_ylabel('빈도')
+    axes[0, 0].axvline(match_score.mean(), color='red', linestyle='--', label=f'평균: {match_score.mean():.3f}')
+    axes[0, 0].legend()
+
+    # 2. 신뢰도 vs 매칭 점수 (빠른 보고서에서는 표본만 그림)
+    confidence = cols['confidence']
+    points = np.arange(len(confidence))
+    if quick and len(points) > QUICK_SCATTER_POINTS:
+        points = np.random.default_rng(0).choice(points, QUICK_SCATTER_POINTS, replace=False)
+    axes[0, 1].scatter(confidence[points], match_score[points], alpha=0.6, color='green')
+    axes[0, 1].set_title('신뢰도 vs 매칭 점수')
+    axes[0, 1].set_xlabel('신뢰도')
+    axes[0, 1].set_ylabel('매칭 점수')
+
+    # 회귀선 추가 (양 끝점만 그리면 충분)
+    slope, intercept = np.polyfit(confidence, match_score, 1)
+    line_x = np.array([confidence.min(), confidence.max()])
+    axes[0, 1].plot(line_x, slope * line_x + intercept, "r--", alpha=0.8)
+
+    # 3. 태스크 복잡도별 매칭 성능 (동일 폭 5구간)
+    complexity = cols['task_complexity']
+    edges = np.linspace(complexity.min(), complexity.max(), 6)
+    complexity_bins = np.searchsorted(edges[1:-1], complexity, side='left')
+    complexity_scores = group_mean(complexity_bins, match_score, 5)
+    complexity_labels = ['Very Low', 'Low', 'Medium', 'High', 'Very High']
+    axes[0, 2].bar(range(5), complexity_scores, color='orange', alpha=0.7)
+    axes[0, 2].set_title('태스크 복잡도별 평균 매칭 점수')
+    axes[0, 2].set_xlabel('복잡도')
+    axes[0, 2].set_ylabel('평균 매칭 점수')
+    axes[0, 2].set_xticks(range(5))
+    axes[0, 2].set_xticklabels(complexity_labels, rotation=45)
+
+    # 4. 우선순위별 성능
+    priorities, priority_codes = np.unique(cols['task_priority'], return_inverse=True)
+    priority_scores = group_mean(priority_codes, match_score, len(priorities))
+    axes[1, 0].plot(priorities, priority_scores, marker='o', linewidth=2, markersize=6, color='purple')
+    axes[1, 0].set_title('태스크 우선순위별 평균 매칭 점수')
+    axes[1, 0].set_xlabel('우선순위')
+    axes[1, 0].set_ylabel('평균 매칭 점수')
+    axes[1, 0].grid(True, alpha=0.3)
+
+    # 5. 각 요소별 기여도
+    factors = ['skill_score', 'availability_score', 'experience_score', 'priority_score']
+    factor_labels = ['스킬', '가용성', '경험', '우선순위']
+    axes[1, 1].bar(factor_labels, [cols[factor].mean() for factor in factors],
+                   color=['red', 'blue', 'green', 'orange'], alpha=0.7)
+    axes[1, 1].set_title('매칭 요소별 평균 점수')
+    axes[1, 1].set_ylabel('평균 점수')
+    axes[1, 1].tick_params(axis='x', rotation=45)
+
+    # 6. 순위별 점수 분포
+    ranks, rank_codes = np.unique(cols['rank'], return_inverse=True)
+    axes[1, 2].bar(ranks, group_mean(rank_codes, match_score, len(ranks)), color='teal', alpha=0.7)
+    axes[1, 2].set_title('순위별 평균 매칭 점수')
+    axes[1, 2].set_xlabel('순위')
+    axes[1, 2].set_ylabel('평균 매칭 점수')
+    return fig
+
+FIGURES: Dict[str, Callable] = {
+    'performance': plot_performance,
+    'reliability': plot_reliability,
+    'matching': plot_matching,
+}
+
+def render_figure(figure: ReportFigure, dpi: int, quick: bool = False, show: bool = False) -> Tuple[str, float]:
+    """그래프 1장을 그려 PNG로 저장 (프로세스 풀 작업자에서도 실행), (경로, 소요 시간) 반환"""
+    started = time.perf_counter()
+    plt = load_pyplot(headless=not show)
+    fig = FIGURES[figure.kind](plt, figure, quick)
+    fig.tight_layout()
+    # 빠른 보고서는 tight bbox 계산(추가 렌더링 1회)을 생략
+    fig.savefig(figure.path, dpi=dpi, bbox_inches=None if quick else 'tight')
+    if show:
+        plt.show()
+    plt.close(fig)
+    return figure.path, time.perf_counter() - started
+
+def _summary_rows(summary: Dict[str, Any], prefix: str = '') -> List[Tuple[str, str]]:
+    """중첩 dict를 (키 경로, 값) 행으로 펼침 (리스트는 건수만 표시)"""
+    rows = []
+    for key, value in summary.items():
+        name = f"{prefix}{key}"
+        if isinstance(value, dict):
+            rows.extend(_summary_rows(value, f"{name}."))
+        elif isinstance(value, (list, tuple)):
+            rows.append((name, f"{len(value)}건"))
+        elif isinstance(value, float):
+            rows.append((name, f"{value:,.4g}"))
+        else:
+            rows.append((name, str(value)))
+    return rows
+
+def write_html_report(path: str, title: str, images: List[str], summary: Optional[Dict[str, Any]] = None) -> str:
+    """그래프(PNG 내장)와 요약 표를 담은 단일 HTML 보고서 작성"""
+    parts = [
+        '<!DOCTYPE html>',
+        '<html lang="ko"><head><meta charset="utf-8">',
+        f'<title>{html.escape(title)}</title>',
+        '<style>body{font-family:sans-serif;margin:2em}img{max-width:100%}'
+        'table{border-collapse:collapse}td,th{border:1px solid #ccc;padding:4px 8px;text-align:left}</style>',
+        '</head><body>',
+        f'<h1>{html.escape(title)}</h1>',
+        f'<p>생성 시각: {datetime.now().isoformat(timespec="seconds")}</p>',
+    ]
+    for image in images:
+        with open(image, 'rb') as f:
+            encoded = base64.b64encode(f.read()).decode('ascii')
+        parts.append(f'<h2>{html.escape(os.path.basename(image))}</h2>')
+        parts.append(f'<img src="data:image/png;base64,{encoded}" alt="{html.escape(os.path.basename(image))}">')
+    if summary:
+        parts.append('<h2>요약</h2><table><tr><th>지표</th><th>값</th></tr>')
+        parts.extend(f'<tr><td>{html.escape(name)}</td><td>{html.escape(value)}</td></tr>'
+                     for name, value in _summary_rows(summary))
+        parts.append('</table>')
+    parts.append('</body></html>')
+
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('\n'.join(parts))
+    return path
+
+class ReportRenderer:
+    """그래프 렌더링 작업을 백그라운드 프로세스 풀로 보내고 finish()에서 모아 보고서 완성"""
+
+    def __init__(self, options: Optional[ReportOptions] = None):
+        self.options = options or ReportOptions()
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._pending: List[Future] = []
+        self.images: List[str] = []
+
+    def _get_pool(self) -> Optional[ProcessPoolExecutor]:
+        if self._pool is None:
+            try:
+                self._pool = ProcessPoolExecutor(max_workers=self.options.max_workers)
+            except (OSError, NotImplementedError) as e:
+                # 세마포어를 만들 수 없는 환경 등에서는 메인 프로세스에서 렌더링
+                print(f"⚠️ 보고서 프로세스 풀을 만들 수 없어 직접 렌더링합니다: {e}")
+                self.options.max_workers = 0
+        return self._pool
+
+    def submit(self, figure: ReportFigure):
+        """그래프 렌더링 예약 (show 모드이거나 풀을 쓸 수 없으면 즉시 렌더링)"""
+        pool = None if self.options.show or self.options.max_workers <= 0 else self._get_pool()
+        if pool is None:
+            path, seconds = render_figure(figure, self.options.dpi, self.options.quick, self.options.show)
+            self.images.append(path)
+            print(f"📊 그래프 저장: {path} ({seconds:.1f}초)")
+            return
+        self._pending.append(pool.submit(render_figure, figure, self.options.dpi, self.options.quick))
+
+    def finish(self, title: str, html_file: Optional[str] = None,
+               summary: Optional[Dict[str, Any]] = None) -> List[str]:
+        """예약된 렌더링이 끝나기를 기다린 뒤 (옵션이면) HTML 보고서 작성, 생성된 파일 목록 반환"""
+        for future in self._pending:
+            try:
+                path, seconds = future.result()
+            except Exception as e:
+                print(f"❌ 그래프 렌더링 실패: {e}")
+                continue
+            self.images.append(path)
+            print(f"📊 그래프 저장: {path} ({seconds:.1f}초, 백그라운드)")
+        self._pending.clear()
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+        files = list(self.images)
+        if self.options.html and html_file:
+            files.append(write_html_report(html_file, title, self.images, summary))
+            print(f"🌐 HTML 보고서 저장: {html_file}")
+        return files
@@ -0,0 +1,309 @@
+#!/usr/bin/env python3
+"""
+HCM 장애 중 부하 실험
+Load-under-fault experiment for HCM System
+
+performance-benchmark.py 의 부하 드라이버로 사용자 트래픽을 계속 흘리면서
+reliability-simulation.py 의 타임라인대로 장애를 주입/복구하고,
+단계(baseline / fault:... / recovery:...)별 goodput, 에러율, 지연 백분위와
+복구 후 처리량이 기준선으로 돌아오기까지 걸린 시간을 보고한다.
+
+사용 예:
+    python load-under-fault.py --timeline scenarios/fault-timeline.json --rate 100
+    python load-under-fault.py --load scenarios/fault-load-mix.json --non-interactive
+"""
+
+import argparse
+import asyncio
+import importlib.util
+import json
+import os
+import random
+import sys
+import time
+from datetime import datetime
+from typing import List, Dict, Any, Optional, Callable
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_LOAD_FILE = os.path.join(SCRIPT_DIR, 'scenarios', 'fault-load-mix.json')
+
+def load_script(filename: str, module_name: str):
+    """하이픈이 들어간 스크립트 파일을 모듈로 로드"""
+    spec = importlib.util.spec_from_file_location(module_name, os.path.join(SCRIPT_DIR, filename))
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+    return module
+
+benchmark_module = load_script('performance-benchmark.py', 'hcm_performance_benchmark')
+reliability_module = load_script('reliability-simulation.py', 'hcm_reliability_simulation')
+
+class FaultLoadDriver:
+    """장애 실험 동안 고정 도착률(open-loop)로 트래픽을 보내고 단계별로 집계
+
+    시뮬레이터의 load_controller로 등록되어 타임라인의 load 단계
+    ({"rate": 요청/초} 또는 {"rate_multiplier": 배수})로 도착률을 바꾼다.
+    도착률 0은 트래픽 중단으로, 다음 load 단계까지 요청을 보내지 않는다.
+    """
+
+    def __init__(self, benchmark, targets: List[Dict[str, Any]], rate: float,
+                 phase_source: Callable[[], str], base_url_source: Optional[Callable[[], str]] = None,
+                 max_in_flight: int = 1000):
+        self.benchmark = benchmark
+        self.rate = self._check_rate(rate)
+        # load 단계가 반영될 때 set (도착률 0으로 멈춘 run()을 깨움)
+        self._rate_changed = asyncio.Event()
+        self.phase_source = phase_source
+        # 장애 프록시가 게이트웨이 앞에 있으면 사용자 트래픽도 프록시를 거치도록 요청마다 주소 확인
+        self.base_url_source = base_url_source
+        self.max_in_flight = max_in_flight
+        self.targets = [
+            {
+                'endpoint': entry['endpoint'],
+                'method': entry.get('method', 'GET').upper(),
+                'payloads': benchmark_module.PayloadPool(entry.get('payload', entry.get('data')))
+            }
+            for entry in targets
+        ]
+        self.weights = [float(entry.get('weight', 1)) for entry in targets]
+        # 단계별 집계기, 단계 구간 (이름, 시작 초, 끝 초), 초 단위 (성공, 실패) 수
+        self.accumulators: Dict[str, Any] = {}
+        self.segments: List[list] = []
+        self.per_second: Dict[int, List[int]] = {}
+        self._started_at = 0.0
+
+    @staticmethod
+    def _check_rate(rate: float) -> float:
+        rate = float(rate)
+        if not rate >= 0:
+            raise ValueError(f"도착률은 0 이상이어야 합니다: {rate}")
+        return rate
+
+    async def apply(self, settings: Dict[str, Any]):
+        """타임라인 load 단계 반영 (음수 도착률은 ValueError)"""
+        if 'rate' in settings:
+            self.rate = self._check_rate(settings['rate'])
+        elif 'rate_multiplier' in settings:
+            self.rate = self._check_rate(self.rate * float(settings['rate_multiplier']))
+        self._rate_changed.set()
+        if self.rate == 0:
+            print("   ⏸️ 부하 중단 (다음 load 단계까지)")
+        else:
+            print(f"   📈 부하 변경: {self.rate:.1f} req/s")
+
+    def _current_accumulator(self, now: float):
+        phase = self.phase_source() or 'baseline'
+        if not self.segments or self.segments[-1][0] != phase:
+            if self.segments:
+                self.segments[-1][2] = now
+            self.segments.append([phase, now, now])
+        accumulator = self.accumulators.get(phase)
+        if accumulator is None:
+            accumulator = self.accumulators[phase] = benchmark_module.ResultAccumulator(phase)
+        return accumulator
+
+    async def _send(self, session, target: Dict[str, Any], accumulator):
+        if self.base_url_source is not None:
+            self.benchmark.base_url = self.base_url_source()
+        result = await self.benchmark.single_request(session, target['endpoint'], target['method'],
+                                                     target['payloads'].next())
+        accumulator.add(result)
+        second = int(time.perf_counter() - self._started_at)
+        counts = self.per_second.setdefault(second, [0, 0])
+        counts[0 if result['success'] else 1] += 1
+
+    async def run(self, duration_seconds: float):
+        """duration_seconds 동안 현재 도착률로 요청 발사 (응답을 기다리지 않음)"""
+        in_flight = set()
+        async with self.benchmark.create_session(self.max_in_flight) as session:
+            self._started_at = time.perf_counter()
+            next_arrival = self._started_at
+
+            while True:
+                now = time.perf_counter()
+                elapsed = now - self._started_at
+                if elapsed >= duration_seconds:
+                    break
+                if self.rate == 0:
+                    # 다음 load 단계(또는 실험 종료)까지 대기 후 그 시점부터 새로 스케줄
+                    self._rate_changed.clear()
+                    try:
+                        await asyncio.wait_for(self._rate_changed.wait(), duration_seconds - elapsed)
+                    except asyncio.TimeoutError:
+                        pass
+                    next_arrival = time.perf_counter()
+                    continue
+                accumulator = self._current_accumulator(elapsed)
+
+                if len(in_flight) >= self.max_in_flight:
+                    # 클라이언트 동시 요청 한도 초과 = 포화 상태로 간주
+                    accumulator.add({'success': False, 'response_time': 0, 'status_code': 0,
+                                     'response_size': 0, 'error': 'in-flight limit exceeded'})
+                    self.per_second.setdefault(int(elapsed), [0, 0])[1] += 1
+                else:
+                    target = random.choices(self.targets, weights=self.weights)[0]
+                    task = asyncio.create_task(self._send(session, target, accumulator))
+                    in_flight.add(task)
+                    task.add_done_callback(in_flight.discard)
+
+                # 도착률이 중간에 바뀌어도 다음 도착 시각만 새 간격으로 계산
+                next_arrival += 1.0 / self.rate
+                delay = next_arrival - time.perf_counter()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                else:
+                    # 스케줄보다 늦어도 이벤트 루프에 양보해야 이미 만든 요청이 실행되고 완료됨
+                    await asyncio.sleep(0)
+
+            if in_flight:
+                await asyncio.gather(*in_flight)
+            if self.segments:
+                self.segments[-1][2] = time.perf_counter() - self._started_at
+
+    def phase_results(self) -> List[Any]:
+        """단계별 BenchmarkResult (goodput = 단계 구간 동안의 초당 성공 요청 수)"""
+        results = []
+        for phase, accumulator in self.accumulators.items():
+            accumulator.elapsed_seconds = sum(end - start for name, start, end in self.segments if name == phase)
+            results.append(accumulator.to_result(phase))
+        return results
+
+    def goodput_series(self) -> List[tuple]:
+        """(초, 성공 수, 실패 수) 시계열"""
+        if not self.per_second:
+            return []
+        last = max(self.per_second)
+        return [(second, *self.per_second.get(second, [0, 0])) for second in range(last + 1)]
+
+    def time_to_baseline(self, threshold: float = 0.95, window: int = 5) -> Dict[str, Optional[float]]:
+        """복구 단계 시작부터 goodput이 기준선의 threshold 배로 돌아올 때까지 걸린 초
+
+        기준선은 baseline 단계의 평균 초당 성공 수이며, window초 이동 평균으로 판정한다.
+        실험이 끝날 때까지 돌아오지 않으면 None.
+        """
+        series = self.goodput_series()
+        successes = [ok for _, ok, _ in series]
+        baseline_seconds = [
+            second for name, start, end in self.segments if name == 'baseline'
+            for second in range(int(start) + 1, int(end))  # 경계 초는 부분 구간이라 제외
+        ]
+        if not baseline_seconds:
+            return {}
+        baseline = sum(successes[s] for s in baseline_seconds if s < len(successes)) / len(baseline_seconds)
+
+        recovered = {}
+        for name, start, _ in self.segments:
+            if not name.startswith('recovery:'):
+                continue
+            recovered[name] = None
+            for second in range(int(start), len(successes) - window + 1):
+                if sum(successes[second:second + window]) / window >= threshold * baseline:
+                    recovered[name] = max(0.0, second - start)
+                    break
+        return recovered
+
+async def run_load_under_fault(base_url: str, timeline_file: str, load_file: str,
+                               rate: Optional[float] = None, monitor_interval: Optional[float] = None,
+                               assume_yes: bool = False):
+    """장애 타임라인과 부하를 동시에 실행하고 단계별 결과 보고"""
+    timeline = reliability_module.load_timeline(timeline_file)
+    load = benchmark_module.load_scenario_file(load_file)[0]
+    targets = load.get('requests') or [load]
+    rate = rate or float(load.get('rate', 50))
+
+    print("🔬 HCM 장애 중 부하 실험을 시작합니다...")
+    print(f"📅 타임라인: {timeline.name} ({timeline.duration_seconds / 60:.1f}분)")
+    print(f"📈 부하: {load.get('name', os.path.basename(load_file))} - {rate:.1f} req/s, 엔드포인트 {len(targets)}개")
+    print("⚠️  주의: 이 실험은 실제 서비스에 장애를 주입합니다! 프로덕션 환경에서는 실행하지 마세요.")
+
+    response = 'y' if assume_yes else input("\n계속하시겠습니까? (y/N): ")
+    if response.lower() != 'y':
+        print("실험이 취소되었습니다.")
+        return None
+
+    simulator = reliability_module.HCMReliabilitySimulator(
+        base_url, monitor_interval=monitor_interval or timeline.monitor_interval or 30.0)
+    benchmark = benchmark_module.HCMPerformanceBenchmark(base_url)
+    driver = FaultLoadDriver(benchmark, targets, rate, lambda: simulator.current_phase,
+                             lambda: simulator.endpoint_overrides.get('hcm-api-gateway', base_url))
+    simulator.load_controller = driver
+
+    try:
+        await asyncio.gather(simulator.run_timeline(timeline), driver.run(timeline.duration_seconds))
+    finally:
+        await simulator.close()
+
+    # 단계별 결과
+    print("\n📊 단계별 사용자 트래픽 결과:")
+    print("=" * 90)
+    print(f"{'단계':<40} {'요청':>8} {'goodput':>10} {'에러율':>8} {'p50':>8} {'p95':>8} {'p99':>8}")
+    results = driver.phase_results()
+    for result in results:
+        p50 = driver.accumulators[result.test_name].histogram.percentile(50)
+        print(f"{result.test_name:<40} {result.total_requests:>8} {result.requests_per_second:>8.1f}/s "
+              f"{result.error_rate:>7.2f}% {p50:>6.1f}ms {result.percentile_95:>6.1f}ms {result.percentile_99:>6.1f}ms")
+
+    recovery = driver.time_to_baseline()
+    if recovery:
+        print("\n⏱️ 복구 후 기준선 처리량 회복 시간:")
+        for phase, seconds in recovery.items():
+            label = f"{seconds:.0f}초" if seconds is not None else "실험 종료까지 회복하지 못함"
+            print(f"  {phase}: {label}")
+
+    # 결과 저장
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    summary_file = f"./test-results/load_under_fault_{timestamp}.json"
+    with open(summary_file, 'w', encoding='utf-8') as f:
+        json.dump({
+            'timeline': timeline.name,
+            'rate': rate,
+            'phases': [
+                {
+                    'phase': result.test_name,
+                    'requests': result.total_requests,
+                    'goodput_rps': result.requests_per_second,
+                    'error_rate': result.error_rate,
+                    'p50_ms': driver.accumulators[result.test_name].histogram.percentile(50),
+                    'p95_ms': result.percentile_95,
+                    'p99_ms': result.percentile_99
+                }
+                for result in results
+            ],
+            'segments': [{'phase': name, 'start_s': start, 'end_s': end} for name, start, end in driver.segments],
+            'time_to_baseline_seconds': recovery,
+            'goodput_timeline': [
+                {'second': second, 'successes': ok, 'failures': failed}
+                for second, ok, failed in driver.goodput_series()
+            ]
+        }, f, indent=2, ensure_ascii=False, default=float)
+    print(f"\n✅ 결과 저장: {summary_file}")
+
+    return driver
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="HCM 장애 중 부하 실험")
+    parser.add_argument("--base-url", default="http://localhost:3001", help="API 게이트웨이 주소")
+    parser.add_argument("--timeline", default=reliability_module.DEFAULT_TIMELINE_FILE,
+                        help="장애 주입 타임라인 파일 (JSON/YAML)")
+    parser.add_argument("--load", default=DEFAULT_LOAD_FILE,
+                        help="부하 시나리오 파일 (requests 목록과 weight, 선택적으로 rate)")
+    parser.add_argument("--rate", type=float, help="초당 요청 수 (기본값은 부하 시나리오의 rate)")
+    parser.add_argument("--interval", type=float,
+                        help="헬스 체크 샘플링 간격 (초, 기본값은 타임라인 설정 또는 30초)")
+    parser.add_argument("--yes", "-y", action="store_true", help="확인 입력 없이 바로 실행")
+    parser.add_argument("--non-interactive", action="store_true", help="확인 입력 없이 실행 (CI용)")
+    args = parser.parse_args()
+
+    # 결과 디렉토리 생성
+    os.makedirs("./test-results", exist_ok=True)
+
+    try:
+        asyncio.run(run_load_under_fault(args.base_url, args.timeline, args.load, rate=args.rate,
+                                         monitor_interval=args.interval,
+                                         assume_yes=args.yes or args.non_interactive))
+        print("\n🎉 장애 중 부하 실험 완료!")
+    except KeyboardInterrupt:
+        print("\n⏹️ 사용자에 의해 중단되었습니다.")
+    except Exception as e:
+        print(f"\n❌ 장애 중 부하 실험 중 오류 발생: {e}")
+        sys.exit(1)
@@ -7,17 +7,33 @@ Performance Benchmarking and Load Simulation for HCM System
 import asyncio
 import aiohttp
 import time
-import statistics
+import importlib
 import json
+import random
+import re
+import uuid
+import argparse
+import itertools
+import math
+import os
+import socket
+import sqlite3
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
 from datetime import datetime
-from typing import List, Dict, Any
-import matplotlib.pyplot as plt
-import pandas as pd
-import numpy as np
-from dataclasses import dataclass
+from typing import List, Dict, Any, Optional, Callable, TYPE_CHECKING
+from dataclasses import dataclass, field, asdict
 import concurrent.futures
+import contextlib
 import threading
 
+# 분석/시각화 패키지(numpy, pandas, matplotlib)는 필요한 시점에 지연 로드
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+
 @dataclass
 class BenchmarkResult:
     test_name: str
@@ -32,44 +48,883 @@ class BenchmarkResult:
     requests_per_second: float
     error_rate: float
     throughput_mb_per_sec: float
+    # 요청 단계별 {'avg', 'p50', 'p99'} (ms) 및 연결 재사용 비율 (트레이싱 사용 시)
+    phase_percentiles: Dict[str, Dict[str, float]] = field(default_factory=dict)
+    connection_reuse_ratio: Optional[float] = None
+    # 서버 측 리소스 효율 (리소스 샘플링 사용 시)
+    cpu_seconds: Optional[float] = None
+    requests_per_cpu_second: Optional[float] = None
+    peak_memory_mb: Optional[float] = None
+    memory_per_connection_mb: Optional[float] = None
+
+@dataclass
+class SLOTarget:
+    p99_ms: float = 200.0
+    max_error_rate: float = 0.1  # %
+
+@dataclass
+class CapacityPoint:
+    target_rps: float
+    achieved_rps: float
+    avg_response_time: float
+    percentile_99: float
+    error_rate: float
+    passed: bool
+
+@dataclass
+class CapacityResult:
+    endpoint: str
+    method: str
+    slo: SLOTarget
+    max_sustainable_rps: float
+    knee_rps: Optional[float]
+    curve: List[CapacityPoint] = field(default_factory=list)
+
+@dataclass
+class ConnectorSettings:
+    limit: Optional[int] = None  # None이면 테스트 기본값 사용, 0이면 무제한
+    limit_per_host: int = 0  # 0이면 무제한
+    keepalive_timeout: float = 15.0  # 초
+    force_close: bool = False  # True면 요청마다 새 연결 (keep-alive 미사용)
+    
+    def label(self) -> str:
+        pool = 'default' if self.limit is None else self.limit
+        mode = 'close' if self.force_close else f'keepalive={self.keepalive_timeout:g}s'
+        return f"pool={pool}, per_host={self.limit_per_host}, {mode}"
+
+@dataclass
+class RegressionFinding:
+    test_name: str
+    metric: str
+    baseline: float
+    candidate: float
+    change_pct: float
+    p_value: Optional[float]
+    ci_low_pct: Optional[float]
+    ci_high_pct: Optional[float]
+    regression: bool
+
+# 시나리오 파일 기본 위치
+SCENARIO_DIR = Path(__file__).resolve().parent / "scenarios"
+DEFAULT_SCENARIO_FILE = SCENARIO_DIR / "comprehensive.json"
+DEFAULT_BASELINE_DB = "./test-results/benchmark_baselines.db"
+STUB_GATEWAY_SCRIPT = Path(__file__).resolve().parent / "stub-gateway.py"
+
+# 페이로드 템플릿 플레이스홀더: ${name} 또는 ${name:args}
+_PLACEHOLDER = re.compile(r"\$\{(\w+)(?::([^}]*))?\}")
+
+_FIRST_NAMES = ['Minjun', 'Seoyeon', 'Jiho', 'Hayoon', 'Alex', 'Jordan', 'Taylor', 'Sam']
+_LAST_NAMES = ['Kim', 'Lee', 'Park', 'Choi', 'Smith', 'Garcia', 'Chen', 'Nguyen']
+
+def load_scenario_file(path) -> List[Dict[str, Any]]:
+    """시나리오 파일(JSON/YAML) 로드"""
+    path = Path(path)
+    text = path.read_text(encoding='utf-8')
+
+    if path.suffix.lower() in ('.yaml', '.yml'):
+        try:
+            import yaml
+        except ImportError:
+            raise RuntimeError("YAML 시나리오를 사용하려면 PyYAML이 필요합니다: pip install pyyaml")
+        document = yaml.safe_load(text)
+    else:
+        document = json.loads(text)
+
+    # 단일 시나리오 또는 {"scenarios": [...]} 형식 모두 지원
+    if isinstance(document, dict) and 'scenarios' in document:
+        scenarios = document['scenarios']
+    elif isinstance(document, list):
+        scenarios = document
+    else:
+        scenarios = [document]
+
+    for scenario in scenarios:
+        if 'requests' not in scenario and 'endpoint' not in scenario:
+            raise ValueError(f"{path}: 시나리오 '{scenario.get('name', '?')}'에 endpoint 또는 requests가 없습니다")
+        scenario.setdefault('name', path.stem)
+
+    return scenarios
+
+def _render_placeholder(name: str, args: Optional[str], seq: int) -> Any:
+    """플레이스홀더 하나를 랜덤 값으로 치환"""
+    if name == 'uuid':
+        return str(uuid.uuid4())
+    if name == 'seq':
+        return seq
+    if name == 'int':
+        low, high = (int(v) for v in args.split(':'))
+        return random.randint(low, high)
+    if name == 'float':
+        low, high = (float(v) for v in args.split(':'))
+        return random.uniform(low, high)
+    if name == 'choice':
+        return random.choice(args.split('|'))
+    if name == 'first_name':
+        return random.choice(_FIRST_NAMES)
+    if name == 'last_name':
+        return random.choice(_LAST_NAMES)
+    if name == 'email':
+        return f"user{seq}.{uuid.uuid4().hex[:8]}@example.com"
+    raise ValueError(f"알 수 없는 템플릿 필드: ${{{name}}}")
+
+def render_payload(template: Any, seq: int = 0) -> Any:
+    """페이로드 템플릿의 랜덤 필드 치환 (재귀)"""
+    if isinstance(template, dict):
+        return {key: render_payload(value, seq) for key, value in template.items()}
+    if isinstance(template, list):
+        return [render_payload(value, seq) for value in template]
+    if isinstance(template, str):
+        whole = _PLACEHOLDER.fullmatch(template)
+        if whole:
+            # 문자열 전체가 플레이스홀더면 원래 타입(int/float) 유지
+            return _render_placeholder(whole.group(1), whole.group(2), seq)
+        return _PLACEHOLDER.sub(
+            lambda m: str(_render_placeholder(m.group(1), m.group(2), seq)), template
+        )
+    return template
+
+def _has_placeholders(template: Any) -> bool:
+    if isinstance(template, dict):
+        return any(_has_placeholders(value) for value in template.values())
+    if isinstance(template, list):
+        return any(_has_placeholders(value) for value in template)
+    return isinstance(template, str) and _PLACEHOLDER.search(template) is not None
+
+class PayloadPool:
+    """요청 본문을 미리 JSON bytes로 직렬화해 두고 재사용하는 풀"""
+    
+    DEFAULT_VARIANTS = 256
+    
+    def __init__(self, template: Any, variants: int = DEFAULT_VARIANTS):
+        if template is None:
+            self.bodies: List[bytes] = []
+        elif _has_placeholders(template):
+            # 랜덤 필드가 있으면 변형본을 미리 여러 개 만들어 순환 사용
+            self.bodies = [json.dumps(render_payload(template, seq)).encode('utf-8')
+                           for seq in range(1, variants + 1)]
+        else:
+            self.bodies = [json.dumps(template).encode('utf-8')]
+        self._index = 0
+    
+    def next(self) -> Optional[bytes]:
+        if not self.bodies:
+            return None
+        body = self.bodies[self._index]
+        self._index = (self._index + 1) % len(self.bodies)
+        return body
+
+JSON_HEADERS = {'Content-Type': 'application/json'}
+
+# 요청 단계: 연결 풀 대기, DNS, TCP(+TLS) 연결, 첫 바이트까지, 본문 수신
+REQUEST_PHASES = ('pool_wait', 'dns', 'connect', 'ttfb', 'body')
+_PHASE_SPANS = {
+    'pool_wait': ('queued_start', 'queued_end'),
+    'dns': ('dns_start', 'dns_end'),
+    'connect': ('connect_start', 'connect_end'),
+    'ttfb': ('headers_sent', 'response_start'),
+    'body': ('response_start', 'end'),
+}
+
+def build_phase_trace_config() -> aiohttp.TraceConfig:
+    """aiohttp 트레이스 훅으로 요청 단계별 시각(perf_counter_ns) 기록"""
+    trace_config = aiohttp.TraceConfig()
+    
+    def mark(name: str):
+        async def handler(session, trace_config_ctx, params):
+            timings = trace_config_ctx.trace_request_ctx
+            if timings is not None:
+                timings[name] = time.perf_counter_ns()
+        return handler
+    
+    async def on_reuse(session, trace_config_ctx, params):
+        timings = trace_config_ctx.trace_request_ctx
+        if timings is not None:
+            timings['reused'] = True
+    
+    trace_config.on_connection_queued_start.append(mark('queued_start'))
+    trace_config.on_connection_queued_end.append(mark('queued_end'))
+    trace_config.on_dns_resolvehost_start.append(mark('dns_start'))
+    trace_config.on_dns_resolvehost_end.append(mark('dns_end'))
+    # aiohttp는 TCP 연결과 TLS 핸드셰이크를 따로 알리지 않으므로 connect에 TLS 포함
+    trace_config.on_connection_create_start.append(mark('connect_start'))
+    trace_config.on_connection_create_end.append(mark('connect_end'))
+    trace_config.on_connection_reuseconn.append(on_reuse)
+    trace_config.on_request_headers_sent.append(mark('headers_sent'))
+    # on_request_end 는 응답 헤더 수신 시점 (본문 읽기 전)
+    trace_config.on_request_end.append(mark('response_start'))
+    return trace_config
+
+def request_phases(timings: Dict[str, Any]) -> Dict[str, float]:
+    """트레이스 시각에서 단계별 소요시간(ms) 계산"""
+    phases = {}
+    for phase, (start, end) in _PHASE_SPANS.items():
+        if start in timings and end in timings:
+            phases[phase] = (timings[end] - timings[start]) / 1e6
+    return phases
+
+def think_time_sampler(spec: Any) -> Callable[[], float]:
+    """think time 설정(초)을 샘플러 함수로 변환"""
+    if not spec:
+        return lambda: 0.0
+    if isinstance(spec, (int, float)):
+        return lambda: float(spec)
+    if 'mean' in spec:
+        mean = float(spec['mean'])
+        return lambda: random.expovariate(1.0 / mean) if mean > 0 else 0.0
+    low, high = float(spec.get('min', 0)), float(spec.get('max', 0))
+    return lambda: random.uniform(low, high)
+
+def stage_user_target(stages: List[Dict[str, Any]], elapsed: float) -> Optional[int]:
+    """경과 시간 기준 목표 가상 사용자 수 (단계 사이는 선형 ramp, 종료 시 None)"""
+    previous_users = 0
+    stage_start = 0.0
+    for stage in stages:
+        duration = float(stage['duration'])
+        users = int(stage['users'])
+        if elapsed < stage_start + duration:
+            progress = (elapsed - stage_start) / duration if duration > 0 else 1.0
+            return round(previous_users + (users - previous_users) * progress)
+        previous_users = users
+        stage_start += duration
+    return None
+
+class LatencyHistogram:
+    """로그 스케일 버킷 응답시간 히스토그램 (상대 오차 ~growth/2)"""
+    
+    def __init__(self, growth: float = 1.05, min_ms: float = 0.01):
+        self.growth = growth
+        self.min_ms = min_ms
+        self._log_growth = math.log(growth)
+        self.counts: Dict[int, int] = {}
+        self.total = 0
+    
+    def bucket(self, value_ms: float) -> int:
+        if value_ms <= self.min_ms:
+            return 0
+        return int(math.log(value_ms / self.min_ms) / self._log_growth) + 1
+    
+    def bucket_value(self, index: int) -> float:
+        """버킷 대표값 (기하 중간값)"""
+        if index == 0:
+            return self.min_ms
+        return self.min_ms * self.growth ** (index - 0.5)
+    
+    def record(self, value_ms: float, count: int = 1):
+        index = self.bucket(value_ms)
+        self.counts[index] = self.counts.get(index, 0) + count
+        self.total += count
+    
+    def percentile(self, q: float) -> float:
+        if self.total == 0:
+            return 0.0
+        rank = q / 100.0 * self.total
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= rank:
+                return self.bucket_value(index)
+        return self.bucket_value(max(self.counts))
+    
+    def cumulative_buckets(self, max_ms: float = 60000.0, factor: float = 2.0) -> List[tuple]:
+        """약 factor배 간격의 네이티브 버킷 경계별 누적 개수 [(상한 ms, 누적 개수)] (OpenMetrics 노출용)"""
+        step = max(1, round(math.log(factor) / self._log_growth))
+        counts = sorted(self.counts.items())
+        buckets = []
+        seen = position = index = 0
+        while True:
+            # 버킷 index 이하에는 min_ms * growth^index 미만의 값만 들어 있음
+            upper = self.min_ms * self.growth ** index
+            while position < len(counts) and counts[position][0] <= index:
+                seen += counts[position][1]
+                position += 1
+            buckets.append((upper, seen))
+            if upper >= max_ms:
+                return buckets
+            index += step
+    
+    @classmethod
+    def from_samples(cls, samples: List[float], **kwargs) -> 'LatencyHistogram':
+        histogram = cls(**kwargs)
+        for value in samples:
+            histogram.record(value)
+        return histogram
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {'growth': self.growth, 'min_ms': self.min_ms,
+                'counts': {str(index): count for index, count in sorted(self.counts.items())}}
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'LatencyHistogram':
+        histogram = cls(growth=data['growth'], min_ms=data['min_ms'])
+        for index, count in data['counts'].items():
+            histogram.counts[int(index)] = count
+            histogram.total += count
+        return histogram
+
+class ResultAccumulator:
+    """요청 결과 단일 패스 집계기 (요청별 객체를 보관하지 않음, 메모리 O(버킷 수))"""
+    
+    # 기준선 저장/유의성 검정용 응답시간 reservoir 샘플 크기
+    RESERVOIR_SIZE = 5000
+    
+    def __init__(self, test_name: str = ""):
+        self.test_name = test_name
+        self.total_requests = 0
+        self.successful_requests = 0
+        self.total_bytes = 0
+        self.min_response_size: Optional[int] = None
+        self.max_response_size: Optional[int] = None
+        self.latency_sum = 0.0
+        self.min_latency = math.inf
+        self.max_latency = 0.0
+        # 백분위 상대 오차 ~1%
+        self.histogram = LatencyHistogram(growth=1.02)
+        self.reservoir: List[float] = []
+        self.phase_histograms: Dict[str, LatencyHistogram] = {}
+        self.phase_sums: Dict[str, float] = {}
+        self.traced_requests = 0
+        self.reused_connections = 0
+        self.elapsed_seconds = 0.0
+        # 리소스 모니터가 샘플링 간격마다 가져가는 구간 히스토그램
+        self.window: Optional[LatencyHistogram] = None
+        self._started_at: Optional[float] = None
+    
+    def start(self):
+        self._started_at = time.perf_counter()
+    
+    def stop(self):
+        if self._started_at is not None:
+            self.elapsed_seconds = time.perf_counter() - self._started_at
+    
+    def add(self, result: Dict[str, Any]):
+        """요청 1건 반영"""
+        self.total_requests += 1
+        if not result['success']:
+            return
+        
+        self.successful_requests += 1
+        latency = result['response_time']
+        self.latency_sum += latency
+        if latency < self.min_latency:
+            self.min_latency = latency
+        if latency > self.max_latency:
+            self.max_latency = latency
+        self.histogram.record(latency)
+        if self.window is not None:
+            self.window.record(latency)
+        
+        # reservoir sampling (Algorithm R)
+        if len(self.reservoir) < self.RESERVOIR_SIZE:
+            self.reservoir.append(latency)
+        else:
+            slot = random.randrange(self.successful_requests)
+            if slot < self.RESERVOIR_SIZE:
+                self.reservoir[slot] = latency
+        
+        size = result['response_size']
+        self.total_bytes += size
+        if self.min_response_size is None or size < self.min_response_size:
+            self.min_response_size = size
+        if self.max_response_size is None or size > self.max_response_size:
+            self.max_response_size = size
+        
+        phases = result.get('phases')
+        if phases is not None:
+            self.traced_requests += 1
+            if result['connection_reused']:
+                self.reused_connections += 1
+            for phase, duration in phases.items():
+                histogram = self.phase_histograms.get(phase)
+                if histogram is None:
+                    histogram = self.phase_histograms[phase] = LatencyHistogram(growth=1.02, min_ms=0.001)
+                    self.phase_sums[phase] = 0.0
+                histogram.record(duration)
+                self.phase_sums[phase] += duration
+    
+    def take_window(self) -> tuple:
+        """직전 호출 이후 성공 요청 수와 p99, 구간 히스토그램 초기화"""
+        window = self.window
+        self.window = LatencyHistogram(growth=1.02)
+        if window is None or window.total == 0:
+            return 0, None
+        return window.total, window.percentile(99)
+    
+    def to_result(self, test_name: Optional[str] = None) -> BenchmarkResult:
+        """집계값으로 결과 생성 (요청 수와 무관하게 O(버킷 수))"""
+        total = self.total_requests
+        successful = self.successful_requests
+        elapsed = self.elapsed_seconds
+        
+        phase_percentiles = {
+            phase: {
+                'avg': self.phase_sums[phase] / self.phase_histograms[phase].total,
+                'p50': self.phase_histograms[phase].percentile(50),
+                'p99': self.phase_histograms[phase].percentile(99)
+            }
+            for phase in REQUEST_PHASES if phase in self.phase_histograms
+        }
+        
+        return BenchmarkResult(
+            test_name=test_name or self.test_name,
+            total_requests=total,
+            successful_requests=successful,
+            failed_requests=total - successful,
+            avg_response_time=self.latency_sum / successful if successful else 0,
+            min_response_time=self.min_latency if successful else 0,
+            max_response_time=self.max_latency,
+            percentile_95=self.histogram.percentile(95),
+            percentile_99=self.histogram.percentile(99),
+            requests_per_second=successful / elapsed if elapsed > 0 else 0,
+            error_rate=(total - successful) / total * 100 if total > 0 else 0,
+            throughput_mb_per_sec=(self.total_bytes / (1024 * 1024)) / elapsed if elapsed > 0 else 0,
+            phase_percentiles=phase_percentiles,
+            connection_reuse_ratio=self.reused_connections / self.traced_requests if self.traced_requests else None
+        )
+
+def current_git_revision() -> str:
+    """현재 저장소의 git 리비전 (없으면 'unknown')"""
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'],
+            capture_output=True, text=True, check=True,
+            cwd=Path(__file__).resolve().parent
+        ).stdout.strip()
+    except Exception:
+        return 'unknown'
+
+class BaselineStore:
+    """시나리오 x git 리비전별 벤치마크 결과 저장소 (SQLite)"""
+    
+    # 유의성 검정용으로 보관하는 응답시간 샘플 최대 개수
+    MAX_SAMPLES = 5000
+    
+    def __init__(self, db_path: str = DEFAULT_BASELINE_DB):
+        self.db_path = db_path
+        self.conn = sqlite3.connect(db_path)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS benchmark_runs (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                test_name TEXT NOT NULL,
+                revision TEXT NOT NULL,
+                recorded_at TEXT NOT NULL,
+                base_url TEXT,
+                summary TEXT NOT NULL,
+                histogram TEXT NOT NULL,
+                samples BLOB NOT NULL
+            )
+        """)
+        self.conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_runs_name_rev ON benchmark_runs (test_name, revision, recorded_at)"
+        )
+        self.conn.commit()
+    
+    def record(self, result: BenchmarkResult, samples: List[float], revision: str, base_url: str = None,
+               histogram: Optional[LatencyHistogram] = None):
+        """벤치마크 결과 1건 저장 (샘플이 많으면 무작위 추출)"""
+        import numpy as np
+        
+        histogram = histogram or LatencyHistogram.from_samples(samples)
+        if len(samples) > self.MAX_SAMPLES:
+            kept = random.sample(samples, self.MAX_SAMPLES)
+        else:
+            kept = list(samples)
+        
+        summary = {key: float(value) if isinstance(value, (int, float, np.number)) else value
+                   for key, value in asdict(result).items()}
+        self.conn.execute(
+            "INSERT INTO benchmark_runs (test_name, revision, recorded_at, base_url, summary, histogram, samples) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (result.test_name, revision, datetime.now().isoformat(), base_url,
+             json.dumps(summary), json.dumps(histogram.to_dict()),
+             np.asarray(kept, dtype=np.float32).tobytes())
+        )
+        self.conn.commit()
+    
+    def load(self, revision: str) -> Dict[str, Dict[str, Any]]:
+        """리비전의 테스트별 최신 결과 조회"""
+        import numpy as np
+        
+        rows = self.conn.execute(
+            "SELECT test_name, summary, histogram, samples FROM benchmark_runs "
+            "WHERE revision = ? ORDER BY recorded_at",
+            (revision,)
+        ).fetchall()
+        
+        runs = {}
+        for test_name, summary, histogram, samples in rows:
+            runs[test_name] = {
+                'summary': json.loads(summary),
+                'histogram': LatencyHistogram.from_dict(json.loads(histogram)),
+                'samples': np.frombuffer(samples, dtype=np.float32).astype(float)
+            }
+        return runs
+    
+    def revisions(self) -> List[str]:
+        rows = self.conn.execute(
+            "SELECT revision, MAX(recorded_at) AS last FROM benchmark_runs GROUP BY revision ORDER BY last"
+        ).fetchall()
+        return [row[0] for row in rows]
+    
+    def close(self):
+        self.conn.close()
+
+def bootstrap_change_ci(baseline: 'np.ndarray', candidate: 'np.ndarray', statistic: Callable,
+                        iterations: int = 1000, confidence: float = 0.95) -> tuple:
+    """통계량 상대 변화율(%)의 부트스트랩 신뢰구간"""
+    import numpy as np
+    
+    rng = np.random.default_rng()
+    base_idx = rng.integers(0, len(baseline), size=(iterations, len(baseline)))
+    cand_idx = rng.integers(0, len(candidate), size=(iterations, len(candidate)))
+    base_stat = statistic(baseline[base_idx], axis=1)
+    cand_stat = statistic(candidate[cand_idx], axis=1)
+    changes = (cand_stat - base_stat) / np.maximum(base_stat, 1e-9) * 100
+    
+    alpha = (1 - confidence) / 2
+    return float(np.quantile(changes, alpha)), float(np.quantile(changes, 1 - alpha))
+
+def compare_runs(baseline_runs: Dict[str, Dict[str, Any]], candidate_runs: Dict[str, Dict[str, Any]],
+                 latency_threshold_pct: float = 10.0, throughput_threshold_pct: float = 10.0,
+                 error_threshold_pct: float = 1.0, alpha: float = 0.01) -> List[RegressionFinding]:
+    """기준 결과 대비 후보 결과의 회귀 여부 판정"""
+    import numpy as np
+    from scipy.stats import mannwhitneyu
+    
+    findings = []
+    for test_name in sorted(set(baseline_runs) & set(candidate_runs)):
+        base, cand = baseline_runs[test_name], candidate_runs[test_name]
+        base_samples, cand_samples = base['samples'], cand['samples']
+        
+        # 응답시간: Mann-Whitney U (후보가 더 느린지 단측 검정) + 부트스트랩 CI
+        if len(base_samples) >= 20 and len(cand_samples) >= 20:
+            p_value = float(mannwhitneyu(cand_samples, base_samples, alternative='greater').pvalue)
+            
+            for metric, statistic in (('p50', np.median),
+                                      ('p99', lambda a, axis: np.percentile(a, 99, axis=axis))):
+                base_value = float(statistic(base_samples, axis=0))
+                cand_value = float(statistic(cand_samples, axis=0))
+                change = (cand_value - base_value) / max(base_value, 1e-9) * 100
+                ci_low, ci_high = bootstrap_change_ci(base_samples, cand_samples, statistic)
+                
+                findings.append(RegressionFinding(
+                    test_name=test_name,
+                    metric=f'latency_{metric}_ms',
+                    baseline=base_value,
+                    candidate=cand_value,
+                    change_pct=change,
+                    p_value=p_value,
+                    ci_low_pct=ci_low,
+                    ci_high_pct=ci_high,
+                    # 유의하게 느려졌고 신뢰구간 하한도 임계값을 넘을 때만 회귀
+                    regression=p_value < alpha and ci_low > latency_threshold_pct
+                ))
+        
+        # 처리량
+        base_rps = base['summary']['requests_per_second']
+        cand_rps = cand['summary']['requests_per_second']
+        rps_change = (cand_rps - base_rps) / max(base_rps, 1e-9) * 100
+        findings.append(RegressionFinding(
+            test_name=test_name,
+            metric='requests_per_second',
+            baseline=base_rps,
+            candidate=cand_rps,
+            change_pct=rps_change,
+            p_value=None,
+            ci_low_pct=None,
+            ci_high_pct=None,
+            regression=rps_change < -throughput_threshold_pct
+        ))
+        
+        # 에러율 (%p 증가)
+        base_err = base['summary']['error_rate']
+        cand_err = cand['summary']['error_rate']
+        findings.append(RegressionFinding(
+            test_name=test_name,
+            metric='error_rate',
+            baseline=base_err,
+            candidate=cand_err,
+            change_pct=cand_err - base_err,
+            p_value=None,
+            ci_low_pct=None,
+            ci_high_pct=None,
+            regression=cand_err - base_err > error_threshold_pct
+        ))
+    
+    return findings
+
+def print_regression_report(findings: List[RegressionFinding], baseline_rev: str, candidate_rev: str) -> bool:
+    """회귀 비교 결과 출력, 회귀가 있으면 True"""
+    print(f"\n📐 회귀 비교: {baseline_rev} (기준) → {candidate_rev} (후보)")
+    print("=" * 50)
+    
+    if not findings:
+        print("⚠️ 두 리비전에 공통된 테스트가 없습니다.")
+        return False
+    
+    for finding in findings:
+        mark = "🔴" if finding.regression else "🟢"
+        detail = ""
+        if finding.p_value is not None:
+            detail = f" (p={finding.p_value:.4f}, 95% CI {finding.ci_low_pct:+.1f}%~{finding.ci_high_pct:+.1f}%)"
+        unit = "%p" if finding.metric == 'error_rate' else "%"
+        print(f"{mark} {finding.test_name} / {finding.metric}: "
+              f"{finding.baseline:.2f} → {finding.candidate:.2f} ({finding.change_pct:+.1f}{unit}){detail}")
+    
+    regressions = [f for f in findings if f.regression]
+    if regressions:
+        print(f"\n❌ 성능 회귀 {len(regressions)}건 감지")
+    else:
+        print("\n✅ 성능 회귀 없음")
+    return bool(regressions)
+
+class ProcResourceSource:
+    """로컬 프로세스 리소스 조회 (/proc, docker 없이 사용)"""
+    
+    def __init__(self, pids: Dict[str, int]):
+        self.pids = pids
+        self._clock_ticks = os.sysconf('SC_CLK_TCK')
+        self._page_size = os.sysconf('SC_PAGE_SIZE')
+    
+    @staticmethod
+    def find_pids(pattern: str) -> Dict[str, int]:
+        """명령줄에 pattern 이 포함된 프로세스 검색"""
+        pids = {}
+        for entry in Path('/proc').iterdir():
+            if not entry.name.isdigit() or int(entry.name) == os.getpid():
+                continue
+            try:
+                cmdline = (entry / 'cmdline').read_bytes().replace(b'\0', b' ').decode(errors='ignore')
+            except OSError:
+                continue
+            if pattern in cmdline:
+                pids[f"{pattern}[{entry.name}]"] = int(entry.name)
+        return pids
+    
+    def sample(self) -> Dict[str, tuple]:
+        """대상별 (누적 CPU 초, 메모리 bytes)"""
+        readings = {}
+        for name, pid in self.pids.items():
+            try:
+                stat = Path(f'/proc/{pid}/stat').read_text()
+                # 프로세스 이름에 공백이 있을 수 있으므로 마지막 ')' 이후부터 파싱
+                fields = stat[stat.rindex(')') + 2:].split()
+                utime, stime = int(fields[11]), int(fields[12])
+                rss_pages = int(Path(f'/proc/{pid}/statm').read_text().split()[1])
+                readings[name] = ((utime + stime) / self._clock_ticks, rss_pages * self._page_size)
+            except (OSError, ValueError, IndexError):
+                continue
+        return readings
+
+class DockerResourceSource:
+    """Docker 컨테이너 리소스 조회"""
+    
+    def __init__(self, container_names: List[str]):
+        import docker
+        self.client = docker.from_env()
+        self.container_names = container_names
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=max(1, len(container_names)))
+    
+    def _sample_container(self, name: str) -> Optional[tuple]:
+        try:
+            container = self.client.containers.get(name)
+            try:
+                # one_shot: precpu 수집을 위한 1초 대기 생략 (누적값만 필요)
+                stats = container.stats(stream=False, one_shot=True)
+            except TypeError:
+                stats = container.stats(stream=False)
+            cpu_seconds = stats['cpu_stats']['cpu_usage']['total_usage'] / 1e9
+            return cpu_seconds, stats['memory_stats'].get('usage', 0)
+        except Exception:
+            return None
+    
+    def sample(self) -> Dict[str, tuple]:
+        readings = self._executor.map(self._sample_container, self.container_names)
+        return {name: reading for name, reading in zip(self.container_names, readings) if reading}
+
+class ResourceMonitor:
+    """부하 테스트 동안 고정 간격으로 서버 측 리소스 샘플링"""
+    
+    def __init__(self, source=None, interval: float = 1.0,
+                 accumulator: Optional[ResultAccumulator] = None):
+        self.source = source
+        self.interval = interval
+        # 샘플 시점마다 이 집계기의 구간 처리량/p99를 함께 기록 (지연 타임라인 정렬)
+        self.accumulator = accumulator
+        # (perf_counter 초, {대상: (누적 CPU 초, 메모리 bytes)}, 구간 성공 요청 수, 구간 p99)
+        self.samples: List[tuple] = []
+        self._task: Optional[asyncio.Task] = None
+    
+    async def _take_sample(self):
+        timestamp = time.perf_counter()
+        window_requests, window_p99 = self.accumulator.take_window() if self.accumulator else (0, None)
+        readings = await asyncio.to_thread(self.source.sample)
+        self.samples.append((timestamp, readings, window_requests, window_p99))
+    
+    async def _run(self):
+        while True:
+            started = time.perf_counter()
+            await self._take_sample()
+            # 샘플링 소요시간만큼 보정해 간격이 밀리지 않도록 함
+            await asyncio.sleep(max(0.0, self.interval - (time.perf_counter() - started)))
+    
+    async def __aenter__(self) -> 'ResourceMonitor':
+        if self.source is not None:
+            self.samples = []
+            await self._take_sample()
+            self._task = asyncio.create_task(self._run())
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            await self._take_sample()
+            self._task = None
+    
+    def efficiency(self, connections: int) -> tuple:
+        """리소스 샘플과 구간별 지연을 합쳐 효율 지표와 타임라인 계산"""
+        if len(self.samples) < 2:
+            return {}, []
+        
+        timestamps = [sample[0] for sample in self.samples]
+        cpu_totals = [sum(cpu for cpu, _ in sample[1].values()) for sample in self.samples]
+        memory_totals = [sum(memory for _, memory in sample[1].values()) for sample in self.samples]
+        
+        timeline = []
+        for i in range(1, len(self.samples)):
+            window = timestamps[i] - timestamps[i - 1]
+            _, _, requests, p99 = self.samples[i]
+            timeline.append({
+                'elapsed_s': timestamps[i] - timestamps[0],
+                'requests': requests,
+                'requests_per_second': requests / window if window > 0 else 0,
+                'p99_ms': p99,
+                'cpu_percent': (cpu_totals[i] - cpu_totals[i - 1]) / window * 100 if window > 0 else 0,
+                'memory_mb': memory_totals[i] / (1024 * 1024)
+            })
+        
+        successful = sum(sample[2] for sample in self.samples)
+        cpu_seconds = cpu_totals[-1] - cpu_totals[0]
+        peak_memory = max(memory_totals)
+        metrics = {
+            'cpu_seconds': cpu_seconds,
+            'requests_per_cpu_second': successful / cpu_seconds if cpu_seconds > 0 else None,
+            'peak_memory_mb': peak_memory / (1024 * 1024),
+            # 부하 전 유휴 메모리 대비 증가분을 동시 연결 수로 나눈 값
+            'memory_per_connection_mb': max(0, peak_memory - memory_totals[0]) / (1024 * 1024) / max(connections, 1)
+        }
+        return metrics, timeline
+
+def load_shared_module(module_name: str):
+    """같은 디렉토리의 공유 모듈(hcm_reports, hcm_openmetrics) 지연 로드
+    
+    프로세스 풀 작업자도 import할 수 있도록 모듈 경로를 sys.path에 등록한다.
+    """
+    script_dir = str(Path(__file__).resolve().parent)
+    if script_dir not in sys.path:
+        sys.path.insert(0, script_dir)
+    return importlib.import_module(module_name)
 
 class HCMPerformanceBenchmark:
     """HCM 시스템 성능 벤치마킹"""
     
-    def __init__(self, base_url: str = "http://localhost:3001"):
+    def __init__(self, base_url: str = "http://localhost:3001", validate_responses: bool = False,
+                 trace_phases: bool = True):
         self.base_url = base_url
+        # True면 응답 본문 전체를 읽어 JSON 유효성까지 확인 (기본은 바이트 수만 집계)
+        self.validate_responses = validate_responses
+        # True면 DNS/연결/TTFB/본문 단계별 시간 기록
+        self.trace_phases = trace_phases
+        # HTTP 연결 풀 설정 (connector matrix 실행 시 교체)
+        self.connector_settings = ConnectorSettings()
+        # 서버 측 리소스 샘플링 (ProcResourceSource / DockerResourceSource, None이면 사용 안 함)
+        self.resource_source = None
+        self.resource_interval = 1.0
+        # 테스트별 리소스/지연 타임라인
+        self.resource_timelines: Dict[str, List[Dict[str, Any]]] = {}
         self.results: List[BenchmarkResult] = []
+        # 테스트별 성공 요청 응답시간 reservoir 샘플과 히스토그램 (기준선 저장/회귀 비교용)
+        self.latency_samples: Dict[str, List[float]] = {}
+        self.latency_histograms: Dict[str, LatencyHistogram] = {}
+        # OpenMetrics 스크랩 시점에 읽는 테스트별 집계기 (요청 경로에는 추가 작업 없음)
+        self.live_accumulators: Dict[str, ResultAccumulator] = {}
+        # hcm_profiling.Profiler (None이면 프로파일링/구간 측정 생략)
+        self.profiler = None
+        
+    def phase(self, name: str):
+        """프로파일러가 있으면 구간 시간 측정"""
+        return self.profiler.phase(name) if self.profiler else contextlib.nullcontext()
+    
+    def profiled(self, label: str):
+        """프로파일러가 있으면 구간 전체를 프로파일링"""
+        return self.profiler.profile(label) if self.profiler else contextlib.nullcontext()
+    
+    def track(self, accumulator: ResultAccumulator, label: str):
+        """실행 중인 집계기를 실시간 지표 노출 대상으로 등록"""
+        self.live_accumulators[label] = accumulator
+    
+    def create_session(self, connection_limit: int = 200) -> aiohttp.ClientSession:
+        """부하 테스트용 HTTP 세션 생성"""
+        settings = self.connector_settings
+        if settings.force_close:
+            connector = aiohttp.TCPConnector(
+                limit=connection_limit if settings.limit is None else settings.limit,
+                limit_per_host=settings.limit_per_host,
+                force_close=True
+            )
+        else:
+            connector = aiohttp.TCPConnector(
+                limit=connection_limit if settings.limit is None else settings.limit,
+                limit_per_host=settings.limit_per_host,
+                keepalive_timeout=settings.keepalive_timeout
+            )
+        return aiohttp.ClientSession(
+            timeout=aiohttp.ClientTimeout(total=30),
+            connector=connector,
+            trace_configs=[build_phase_trace_config()] if self.trace_phases else None
+        )
         
     async def single_request(self, session: aiohttp.ClientSession, endpoint: str, 
-                           method: str = "GET", data: Dict = None) -> Dict[str, Any]:
-        """단일 요청 실행"""
-        start_time = time.time()
+                           method: str = "GET", body: Optional[bytes] = None) -> Dict[str, Any]:
+        """단일 요청 실행 (body는 미리 직렬화된 JSON bytes)"""
+        timings = {} if self.trace_phases else None
+        start_time = time.perf_counter_ns()
         try:
             url = f"{self.base_url}{endpoint}"
+            headers = JSON_HEADERS if body is not None else None
             
-            if method.upper() == "GET":
-                async with session.get(url) as response:
-                    response_data = await response.text()
-                    status = response.status
-            elif method.upper() == "POST":
-                async with session.post(url, json=data) as response:
-                    response_data = await response.text()
-                    status = response.status
+            async with session.request(method, url, data=body, headers=headers,
+                                       trace_request_ctx=timings) as response:
+                status = response.status
+                if self.validate_responses:
+                    payload = await response.read()
+                    response_size = len(payload)
+                    json.loads(payload)
+                else:
+                    # 디코딩/보관 없이 수신한 바이트 수만 집계
+                    response_size = 0
+                    async for chunk in response.content.iter_any():
+                        response_size += len(chunk)
             
-            end_time = time.time()
+            end_time = time.perf_counter_ns()
             
-            return {
-                'success': status == 200,
-                'response_time': (end_time - start_time) * 1000,  # ms
+            result = {
+                'success': 200 <= status < 300,
+                'response_time': (end_time - start_time) / 1e6,  # ms
                 'status_code': status,
-                'response_size': len(response_data.encode('utf-8'))
+                'response_size': response_size
             }
+            if timings is not None:
+                timings['end'] = end_time
+                result['phases'] = request_phases(timings)
+                result['connection_reused'] = timings.get('reused', False)
+            return result
             
         except Exception as e:
-            end_time = time.time()
+            end_time = time.perf_counter_ns()
             return {
                 'success': False,
-                'response_time': (end_time - start_time) * 1000,
+                'response_time': (end_time - start_time) / 1e6,
                 'status_code': 0,
                 'response_size': 0,
                 'error': str(e)
@@ -77,314 +932,516 @@ class HCMPerformanceBenchmark:
     
     async def load_test(self, endpoint: str, concurrent_users: int, 
                        total_requests: int, method: str = "GET", 
-                       data: Dict = None) -> List[Dict[str, Any]]:
-        """부하 테스트 실행"""
+                       data: Dict = None,
+                       accumulator: Optional[ResultAccumulator] = None) -> ResultAccumulator:
+        """부하 테스트 실행 (동시 사용자 수만큼의 워커가 요청을 나눠 처리하며 즉시 집계)"""
+        accumulator = accumulator or ResultAccumulator()
+        payloads = PayloadPool(data)
+        method = method.upper()
+        remaining = total_requests
         
-        semaphore = asyncio.Semaphore(concurrent_users)
+        async def worker(session):
+            nonlocal remaining
+            while remaining > 0:
+                remaining -= 1
+                accumulator.add(await self.single_request(session, endpoint, method, payloads.next()))
         
-        async def limited_request(session):
-            async with semaphore:
-                return await self.single_request(session, endpoint, method, data)
+        label = accumulator.test_name or f"{method} {endpoint}"
+        self.track(accumulator, label)
+        with self.profiled(f"load_test {label}"), self.phase('load_generation'):
+            async with self.create_session() as session:
+                accumulator.start()
+                await asyncio.gather(*(worker(session) for _ in range(min(concurrent_users, total_requests))))
+                accumulator.stop()
         
-        async with aiohttp.ClientSession(
-            timeout=aiohttp.ClientTimeout(total=30),
-            connector=aiohttp.TCPConnector(limit=200)
-        ) as session:
+        return accumulator
+    
+    async def mixed_load_test(self, scenario: Dict[str, Any],
+                              total: Optional[ResultAccumulator] = None) -> Dict[str, ResultAccumulator]:
+        """가중치 혼합 워크로드 실행 (가상 사용자 + think time + stage ramp)"""
+        mix = []
+        for entry in scenario['requests']:
+            method = entry.get('method', 'GET').upper()
+            mix.append({
+                'name': entry.get('name', f"{method} {entry['endpoint']}"),
+                'endpoint': entry['endpoint'],
+                'method': method,
+                'payloads': PayloadPool(entry.get('payload'),
+                                        scenario.get('payload_variants', PayloadPool.DEFAULT_VARIANTS))
+            })
+        weights = [float(entry.get('weight', 1)) for entry in scenario['requests']]
+        
+        stages = scenario.get('stages') or [{
+            'duration': scenario.get('duration_seconds', 60),
+            'users': scenario.get('concurrent_users', 10)
+        }]
+        # stages 없이 concurrent_users만 주어진 경우 ramp 없이 바로 시작
+        if 'stages' not in scenario:
+            stages = [{'duration': 0, 'users': stages[0]['users']}] + stages
+        max_users = max(int(stage['users']) for stage in stages)
+        max_requests = scenario.get('total_requests')
+        think_time = think_time_sampler(scenario.get('think_time'))
+        
+        accumulators = {item['name']: ResultAccumulator(item['name']) for item in mix}
+        total = total or ResultAccumulator(f"{scenario['name']} - 전체")
+        for label, accumulator in accumulators.items():
+            self.track(accumulator, f"{scenario['name']} - {label}")
+        self.track(total, total.test_name)
+        state = {'target': 0, 'issued': 0}
+        stop = asyncio.Event()
+        
+        async def virtual_user(user_id: int, session: aiohttp.ClientSession):
+            while not stop.is_set():
+                # 현재 단계 목표치보다 번호가 크면 대기
+                if user_id >= state['target']:
+                    await asyncio.sleep(0.1)
+                    continue
+                if max_requests is not None and state['issued'] >= max_requests:
+                    stop.set()
+                    break
+                
+                state['issued'] += 1
+                item = random.choices(mix, weights=weights)[0]
+                
+                result = await self.single_request(session, item['endpoint'], item['method'],
+                                                   item['payloads'].next())
+                accumulators[item['name']].add(result)
+                total.add(result)
+                
+                pause = think_time()
+                if pause > 0:
+                    await asyncio.sleep(pause)
+        
+        async with self.create_session(max(200, max_users)) as session:
             
-            start_time = time.time()
+            start_time = time.perf_counter()
+            for accumulator in (*accumulators.values(), total):
+                accumulator.start()
+            users = [asyncio.create_task(virtual_user(i, session)) for i in range(max_users)]
             
-            # 요청 생성
-            tasks = [limited_request(session) for _ in range(total_requests)]
+            # stage 프로파일에 따라 목표 사용자 수 갱신
+            while not stop.is_set():
+                target = stage_user_target(stages, time.perf_counter() - start_time)
+                if target is None:
+                    break
+                state['target'] = target
+                await asyncio.sleep(0.1)
             
-            # 동시 실행
-            results = await asyncio.gather(*tasks, return_exceptions=True)
+            stop.set()
+            await asyncio.gather(*users, return_exceptions=True)
             
-            end_time = time.time()
+            for accumulator in (*accumulators.values(), total):
+                accumulator.stop()
+        
+        return accumulators
+    
+    async def constant_rate_test(self, endpoint: str, rate: float, duration_seconds: float,
+                                 method: str = "GET", data: Dict = None,
+                                 max_in_flight: int = 1000) -> ResultAccumulator:
+        """고정 도착률(open-loop) 부하 테스트"""
+        total_requests = max(1, int(rate * duration_seconds))
+        interval = 1.0 / rate
+        accumulator = ResultAccumulator(f"{method.upper()} {endpoint} @ {rate:.1f} req/s")
+        self.track(accumulator, accumulator.test_name)
+        payloads = PayloadPool(data)
+        method = method.upper()
+        in_flight = set()
+        
+        async def tracked_request(session):
+            accumulator.add(await self.single_request(session, endpoint, method, payloads.next()))
+        
+        async with self.create_session(max_in_flight) as session:
             
-            # 예외 처리
-            valid_results = []
-            for result in results:
-                if isinstance(result, Exception):
-                    valid_results.append({
-                        'success': False,
-                        'response_time': 0,
-                        'status_code': 0,
-                        'response_size': 0,
-                        'error': str(result)
-                    })
-                else:
-                    valid_results.append(result)
+            accumulator.start()
+            start = time.perf_counter()
             
-            # 전체 실행 시간 추가
-            total_time = end_time - start_time
-            for result in valid_results:
-                result['total_test_time'] = total_time
+            for seq in range(total_requests):
+                # 도착 시각 스케줄에 맞춰 발사 (응답을 기다리지 않음)
+                delay = start + seq * interval - time.perf_counter()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                else:
+                    # 스케줄보다 늦어도 이벤트 루프에 양보해야 이미 만든 요청이 실행되고 완료됨
+                    await asyncio.sleep(0)
+                
+                if len(in_flight) >= max_in_flight:
+                    # 클라이언트 동시 요청 한도 초과 = 포화 상태로 간주
+                    accumulator.add({'success': False, 'response_time': 0, 'status_code': 0,
+                                     'response_size': 0, 'error': 'in-flight limit exceeded'})
+                    continue
+                
+                task = asyncio.create_task(tracked_request(session))
+                in_flight.add(task)
+                task.add_done_callback(in_flight.discard)
             
-            return valid_results
-    
-    def analyze_results(self, results: List[Dict[str, Any]], test_name: str) -> BenchmarkResult:
-        """결과 분석"""
-        if not results:
-            return BenchmarkResult(
-                test_name=test_name,
-                total_requests=0,
-                successful_requests=0,
-                failed_requests=0,
-                avg_response_time=0,
-                min_response_time=0,
-                max_response_time=0,
-                percentile_95=0,
-                percentile_99=0,
-                requests_per_second=0,
-                error_rate=0,
-                throughput_mb_per_sec=0
-            )
+            if in_flight:
+                await asyncio.gather(*in_flight)
+            accumulator.stop()
         
-        successful_results = [r for r in results if r['success']]
-        response_times = [r['response_time'] for r in successful_results]
+        return accumulator
+    
+    async def measure_capacity_point(self, target: Dict[str, Any], rate: float, slo: SLOTarget,
+                                     step_seconds: float, max_in_flight: int) -> CapacityPoint:
+        """특정 도착률에서 SLO 충족 여부 측정"""
+        accumulator = await self.constant_rate_test(
+            endpoint=target['endpoint'],
+            rate=rate,
+            duration_seconds=step_seconds,
+            method=target.get('method', 'GET'),
+            data=target.get('data'),
+            max_in_flight=max_in_flight
+        )
+        result = accumulator.to_result(f"{target['endpoint']} @ {rate:.1f} req/s")
         
-        total_requests = len(results)
-        successful_requests = len(successful_results)
-        failed_requests = total_requests - successful_requests
+        passed = bool(result.percentile_99 < slo.p99_ms and result.error_rate < slo.max_error_rate)
+        point = CapacityPoint(
+            target_rps=rate,
+            achieved_rps=result.requests_per_second,
+            avg_response_time=result.avg_response_time,
+            percentile_99=float(result.percentile_99),
+            error_rate=result.error_rate,
+            passed=passed
+        )
         
-        if response_times:
-            avg_response_time = statistics.mean(response_times)
-            min_response_time = min(response_times)
-            max_response_time = max(response_times)
-            percentile_95 = np.percentile(response_times, 95)
-            percentile_99 = np.percentile(response_times, 99)
-        else:
-            avg_response_time = min_response_time = max_response_time = 0
-            percentile_95 = percentile_99 = 0
+        mark = "✅" if passed else "❌"
+        print(f"   {mark} {rate:8.1f} req/s → 달성 {point.achieved_rps:8.1f} req/s, "
+              f"p99 {point.percentile_99:7.1f}ms, 에러율 {point.error_rate:.2f}%")
+        return point
+    
+    @staticmethod
+    def find_knee(curve: List[CapacityPoint]) -> Optional[float]:
+        """포화 곡선의 knee point (p99 급증 또는 처리량이 목표를 못 따라가기 시작하는 지점)"""
+        points = sorted(curve, key=lambda p: p.target_rps)
+        if len(points) < 2:
+            return None
         
-        # 처리량 계산
-        total_time = results[0].get('total_test_time', 1)
-        requests_per_second = successful_requests / total_time if total_time > 0 else 0
+        baseline_p99 = points[0].percentile_99
+        for point in points[1:]:
+            if point.achieved_rps < point.target_rps * 0.95 or \
+                    (baseline_p99 > 0 and point.percentile_99 > baseline_p99 * 2):
+                return point.target_rps
+        return None
+    
+    async def capacity_search(self, target: Dict[str, Any], slo: SLOTarget,
+                              start_rate: float = 10.0, max_rate: float = 5000.0,
+                              step_factor: float = 2.0, tolerance: float = 0.05,
+                              step_seconds: float = 10.0, cooldown_seconds: float = 3.0,
+                              max_in_flight: int = 1000) -> CapacityResult:
+        """SLO를 만족하는 최대 지속 처리량 탐색 (step-up 후 이진 탐색)"""
+        method = target.get('method', 'GET').upper()
+        print(f"\n🔎 용량 탐색: {method} {target['endpoint']} "
+              f"(SLO: p99 < {slo.p99_ms}ms, 에러율 < {slo.max_error_rate}%)")
         
-        # 에러율
-        error_rate = (failed_requests / total_requests) * 100 if total_requests > 0 else 0
+        curve: List[CapacityPoint] = []
+        last_good = 0.0
+        first_bad = None
         
-        # 데이터 처리량 (MB/s)
-        total_bytes = sum(r.get('response_size', 0) for r in successful_results)
-        throughput_mb_per_sec = (total_bytes / (1024 * 1024)) / total_time if total_time > 0 else 0
+        # 1단계: 도착률을 step_factor 배씩 증가시키며 SLO 위반 지점 탐색
+        rate = start_rate
+        while rate <= max_rate:
+            point = await self.measure_capacity_point(target, rate, slo, step_seconds, max_in_flight)
+            curve.append(point)
+            await asyncio.sleep(cooldown_seconds)
+            if not point.passed:
+                first_bad = rate
+                break
+            last_good = rate
+            rate *= step_factor
         
-        return BenchmarkResult(
-            test_name=test_name,
-            total_requests=total_requests,
-            successful_requests=successful_requests,
-            failed_requests=failed_requests,
-            avg_response_time=avg_response_time,
-            min_response_time=min_response_time,
-            max_response_time=max_response_time,
-            percentile_95=percentile_95,
-            percentile_99=percentile_99,
-            requests_per_second=requests_per_second,
-            error_rate=error_rate,
-            throughput_mb_per_sec=throughput_mb_per_sec
+        # 2단계: 마지막 통과 지점과 첫 위반 지점 사이 이진 탐색
+        if first_bad is not None:
+            low, high = last_good, first_bad
+            while high - low > max(high * tolerance, 1.0):
+                mid = (low + high) / 2
+                point = await self.measure_capacity_point(target, mid, slo, step_seconds, max_in_flight)
+                curve.append(point)
+                await asyncio.sleep(cooldown_seconds)
+                if point.passed:
+                    low = mid
+                else:
+                    high = mid
+            last_good = low
+        
+        curve.sort(key=lambda p: p.target_rps)
+        result = CapacityResult(
+            endpoint=target['endpoint'],
+            method=method,
+            slo=slo,
+            max_sustainable_rps=last_good,
+            knee_rps=self.find_knee(curve),
+            curve=curve
         )
+        
+        knee = f"{result.knee_rps:.1f} req/s" if result.knee_rps else "미도달"
+        print(f"   🎯 최대 지속 처리량: {result.max_sustainable_rps:.1f} req/s, knee point: {knee}")
+        return result
+    
+    def analyze_results(self, accumulator: ResultAccumulator, test_name: str) -> BenchmarkResult:
+        """결과 분석 (집계기에서 요약 생성, 기준선 비교용 샘플 보관)"""
+        self.latency_samples[test_name] = accumulator.reservoir
+        self.latency_histograms[test_name] = accumulator.histogram
+        return accumulator.to_result(test_name)
     
-    async def run_comprehensive_benchmark(self):
+    async def run_comprehensive_benchmark(self, scenarios: Optional[List[Dict[str, Any]]] = None):
         """종합 벤치마크 실행"""
         print("🚀 HCM 시스템 성능 벤치마킹 시작...")
         
-        # 테스트 시나리오 정의
-        test_scenarios = [
-            {
-                'name': 'Health Check - Light Load',
-                'endpoint': '/health',
-                'method': 'GET',
-                'concurrent_users': 10,
-                'total_requests': 100
-            },
-            {
-                'name': 'Health Check - Medium Load',
-                'endpoint': '/health',
-                'method': 'GET',
-                'concurrent_users': 50,
-                'total_requests': 500
-            },
-            {
-                'name': 'Health Check - Heavy Load',
-                'endpoint': '/health',
-                'method': 'GET',
-                'concurrent_users': 100,
-                'total_requests': 1000
-            },
-            {
-                'name': 'Service Registry - Light Load',
-                'endpoint': '/services',
-                'method': 'GET',
-                'concurrent_users': 10,
-                'total_requests': 100
-            },
-            {
-                'name': 'Service Registry - Heavy Load',
-                'endpoint': '/services',
-                'method': 'GET',
-                'concurrent_users': 50,
-                'total_requests': 500
-            },
-            {
-                'name': 'Analytics Overview - Medium Load',
-                'endpoint': '/analytics/overview',
-                'method': 'GET',
-                'concurrent_users': 20,
-                'total_requests': 200
-            },
-            {
-                'name': 'Employee Onboarding - Workflow',
-                'endpoint': '/workflows/employee-onboarding',
-                'method': 'POST',
-                'concurrent_users': 5,
-                'total_requests': 25,
-                'data': {
-                    'firstName': 'Test',
-                    'lastName': 'Employee',
-                    'email': 'test@example.com',
-                    'department': 'IT',
-                    'skills': [{'name': 'JavaScript', 'level': 8}]
-                }
-            }
-        ]
+        # 테스트 시나리오 로드 (기본: scenarios/comprehensive.json)
+        test_scenarios = scenarios if scenarios is not None else load_scenario_file(DEFAULT_SCENARIO_FILE)
         
         # 각 시나리오 실행
         for scenario in test_scenarios:
             print(f"\n📊 실행 중: {scenario['name']}")
-            print(f"   동시 사용자: {scenario['concurrent_users']}")
-            print(f"   총 요청 수: {scenario['total_requests']}")
             
-            # 테스트 실행
-            results = await self.load_test(
-                endpoint=scenario['endpoint'],
-                concurrent_users=scenario['concurrent_users'],
-                total_requests=scenario['total_requests'],
-                method=scenario['method'],
-                data=scenario.get('data')
-            )
-            
-            # 결과 분석
-            benchmark_result = self.analyze_results(results, scenario['name'])
-            self.results.append(benchmark_result)
+            if 'requests' in scenario:
+                scenario_results = await self.run_mixed_scenario(scenario)
+            else:
+                scenario_results = [await self.run_single_endpoint_scenario(scenario)]
             
             # 실시간 결과 출력
-            print(f"   ✅ 완료 - 성공률: {(benchmark_result.successful_requests/benchmark_result.total_requests)*100:.1f}%")
-            print(f"   ⚡ 평균 응답시간: {benchmark_result.avg_response_time:.1f}ms")
-            print(f"   🔥 처리량: {benchmark_result.requests_per_second:.1f} req/s")
+            for benchmark_result in scenario_results:
+                self.results.append(benchmark_result)
+                success_rate = (benchmark_result.successful_requests / benchmark_result.total_requests) * 100 \
+                    if benchmark_result.total_requests > 0 else 0
+                print(f"   ✅ {benchmark_result.test_name} - 성공률: {success_rate:.1f}%")
+                print(f"   ⚡ 평균 응답시간: {benchmark_result.avg_response_time:.1f}ms")
+                print(f"   🔥 처리량: {benchmark_result.requests_per_second:.1f} req/s")
             
             # 각 테스트 사이에 잠시 대기
             await asyncio.sleep(2)
     
-    def generate_performance_report(self) -> pd.DataFrame:
+    async def run_single_endpoint_scenario(self, scenario: Dict[str, Any]) -> BenchmarkResult:
+        """단일 엔드포인트 시나리오 실행"""
+        print(f"   동시 사용자: {scenario['concurrent_users']}")
+        print(f"   총 요청 수: {scenario['total_requests']}")
+        
+        accumulator = ResultAccumulator(scenario['name'])
+        async with ResourceMonitor(self.resource_source, self.resource_interval, accumulator) as monitor:
+            await self.load_test(
+                endpoint=scenario['endpoint'],
+                concurrent_users=scenario['concurrent_users'],
+                total_requests=scenario['total_requests'],
+                method=scenario.get('method', 'GET'),
+                data=scenario.get('data'),
+                accumulator=accumulator
+            )
+        
+        with self.phase('analysis'):
+            benchmark_result = self.analyze_results(accumulator, scenario['name'])
+        self.attach_resource_metrics(benchmark_result, monitor, scenario['concurrent_users'])
+        return benchmark_result
+    
+    async def run_mixed_scenario(self, scenario: Dict[str, Any]) -> List[BenchmarkResult]:
+        """혼합 워크로드 시나리오 실행 (엔드포인트별 + 전체 결과)"""
+        total_weight = sum(float(entry.get('weight', 1)) for entry in scenario['requests'])
+        for entry in scenario['requests']:
+            share = float(entry.get('weight', 1)) / total_weight * 100
+            print(f"   - {entry.get('method', 'GET').upper()} {entry['endpoint']}: {share:.0f}%")
+        if scenario.get('stages'):
+            profile = ' → '.join(f"{stage['users']}명/{stage['duration']}s" for stage in scenario['stages'])
+            print(f"   단계: {profile}")
+        
+        total = ResultAccumulator(f"{scenario['name']} - 전체")
+        async with ResourceMonitor(self.resource_source, self.resource_interval, total) as monitor:
+            with self.profiled(f"mixed_load_test {scenario['name']}"), self.phase('load_generation'):
+                accumulators = await self.mixed_load_test(scenario, total)
+        
+        with self.phase('analysis'):
+            scenario_results = [
+                self.analyze_results(accumulator, f"{scenario['name']} - {label}")
+                for label, accumulator in accumulators.items()
+            ]
+            total_result = self.analyze_results(total, total.test_name)
+        max_users = max([int(stage['users']) for stage in scenario.get('stages', [])] +
+                        [scenario.get('concurrent_users', 0)])
+        self.attach_resource_metrics(total_result, monitor, max_users)
+        scenario_results.append(total_result)
+        
+        return scenario_results
+    
+    def attach_resource_metrics(self, result: BenchmarkResult, monitor: ResourceMonitor, connections: int):
+        """리소스 샘플로 계산한 효율 지표를 결과에 추가"""
+        metrics, timeline = monitor.efficiency(connections)
+        if not metrics:
+            return
+        
+        result.cpu_seconds = metrics['cpu_seconds']
+        result.requests_per_cpu_second = metrics['requests_per_cpu_second']
+        result.peak_memory_mb = metrics['peak_memory_mb']
+        result.memory_per_connection_mb = metrics['memory_per_connection_mb']
+        self.resource_timelines[result.test_name] = timeline
+        
+        efficiency = f"{result.requests_per_cpu_second:.0f} req/CPU-s" if result.requests_per_cpu_second else "-"
+        print(f"   🖥️ 서버 CPU {result.cpu_seconds:.2f}s ({efficiency}), "
+              f"최대 메모리 {result.peak_memory_mb:.1f}MB, 연결당 {result.memory_per_connection_mb:.2f}MB")
+    
+    def result_columns(self) -> Dict[str, Any]:
+        """결과 목록을 필드별 numpy 배열로 변환 (보고서 표와 그래프가 같이 사용)"""
+        import numpy as np
+        
+        # 선택 지표(None)는 NaN으로 변환됨
+        columns = {
+            name: np.array([getattr(result, name) for result in self.results], dtype=float)
+            for name in ('total_requests', 'successful_requests', 'avg_response_time', 'percentile_95',
+                         'percentile_99', 'requests_per_second', 'error_rate', 'throughput_mb_per_sec',
+                         'connection_reuse_ratio', 'cpu_seconds', 'requests_per_cpu_second',
+                         'peak_memory_mb', 'memory_per_connection_mb')
+        }
+        for phase in REQUEST_PHASES:
+            columns[f'{phase}_p99'] = np.array(
+                [result.phase_percentiles.get(phase, {}).get('p99') for result in self.results], dtype=float)
+        return columns
+    
+    def generate_performance_report(self, columns: Optional[Dict[str, Any]] = None) -> 'pd.DataFrame':
         """성능 보고서 생성"""
-        data = []
-        for result in self.results:
-            data.append({
-                'Test Name': result.test_name,
-                'Total Requests': result.total_requests,
-                'Success Rate (%)': (result.successful_requests / result.total_requests) * 100,
-                'Avg Response Time (ms)': result.avg_response_time,
-                '95th Percentile (ms)': result.percentile_95,
-                '99th Percentile (ms)': result.percentile_99,
-                'Requests/sec': result.requests_per_second,
-                'Error Rate (%)': result.error_rate,
-                'Throughput (MB/s)': result.throughput_mb_per_sec
-            })
+        import numpy as np
+        import pandas as pd
         
-        return pd.DataFrame(data)
+        columns = columns if columns is not None else self.result_columns()
+        return pd.DataFrame({
+            'Test Name': [result.test_name for result in self.results],
+            'Total Requests': columns['total_requests'].astype(int),
+            'Success Rate (%)': columns['successful_requests'] / np.maximum(columns['total_requests'], 1) * 100,
+            'Avg Response Time (ms)': columns['avg_response_time'],
+            '95th Percentile (ms)': columns['percentile_95'],
+            '99th Percentile (ms)': columns['percentile_99'],
+            'Requests/sec': columns['requests_per_second'],
+            'Error Rate (%)': columns['error_rate'],
+            'Throughput (MB/s)': columns['throughput_mb_per_sec'],
+            'Connection Reuse (%)': columns['connection_reuse_ratio'] * 100,
+            **{f'{phase} p99 (ms)': columns[f'{phase}_p99'] for phase in REQUEST_PHASES},
+            'Server CPU (s)': columns['cpu_seconds'],
+            'Requests/CPU-sec': columns['requests_per_cpu_second'],
+            'Peak Memory (MB)': columns['peak_memory_mb'],
+            'Memory/Connection (MB)': columns['memory_per_connection_mb']
+        })
     
-    def create_performance_visualizations(self):
-        """성능 시각화 생성"""
+    def create_performance_visualizations(self, renderer, columns: Optional[Dict[str, Any]] = None):
+        """성능 시각화 예약 (renderer: hcm_reports.ReportRenderer, 렌더링은 백그라운드에서 진행)"""
         if not self.results:
             print("❌ 분석할 결과가 없습니다.")
             return
         
-        plt.rcParams['font.family'] = ['Malgun Gothic', 'DejaVu Sans']
-        plt.rcParams['axes.unicode_minus'] = False
-        
-        fig, axes = plt.subplots(2, 3, figsize=(20, 12))
-        fig.suptitle('HCM 시스템 성능 벤치마킹 결과', fontsize=16, fontweight='bold')
-        
-        test_names = [r.test_name for r in self.results]
-        short_names = [name.split(' - ')[0] for name in test_names]
-        
-        # 1. 평균 응답 시간
-        avg_times = [r.avg_response_time for r in self.results]
-        axes[0, 0].bar(range(len(short_names)), avg_times, color='skyblue', alpha=0.7)
-        axes[0, 0].set_title('평균 응답 시간 (ms)')
-        axes[0, 0].set_xlabel('테스트')
-        axes[0, 0].set_ylabel('응답 시간 (ms)')
-        axes[0, 0].set_xticks(range(len(short_names)))
-        axes[0, 0].set_xticklabels(short_names, rotation=45, ha='right')
-        
-        # 2. 처리량 (Requests/sec)
-        throughput = [r.requests_per_second for r in self.results]
-        axes[0, 1].bar(range(len(short_names)), throughput, color='green', alpha=0.7)
-        axes[0, 1].set_title('처리량 (Requests/sec)')
-        axes[0, 1].set_xlabel('테스트')
-        axes[0, 1].set_ylabel('Requests/sec')
-        axes[0, 1].set_xticks(range(len(short_names)))
-        axes[0, 1].set_xticklabels(short_names, rotation=45, ha='right')
-        
-        # 3. 성공률
-        success_rates = [(r.successful_requests / r.total_requests) * 100 for r in self.results]
-        colors = ['red' if rate < 95 else 'orange' if rate < 99 else 'green' for rate in success_rates]
-        axes[0, 2].bar(range(len(short_names)), success_rates, color=colors, alpha=0.7)
-        axes[0, 2].set_title('성공률 (%)')
-        axes[0, 2].set_xlabel('테스트')
-        axes[0, 2].set_ylabel('성공률 (%)')
-        axes[0, 2].set_xticks(range(len(short_names)))
-        axes[0, 2].set_xticklabels(short_names, rotation=45, ha='right')
-        axes[0, 2].set_ylim(0, 105)
-        
-        # 4. 95th vs 99th Percentile 비교
-        p95 = [r.percentile_95 for r in self.results]
-        p99 = [r.percentile_99 for r in self.results]
-        x = np.arange(len(short_names))
-        width = 0.35
-        
-        axes[1, 0].bar(x - width/2, p95, width, label='95th Percentile', color='orange', alpha=0.7)
-        axes[1, 0].bar(x + width/2, p99, width, label='99th Percentile', color='red', alpha=0.7)
-        axes[1, 0].set_title('응답 시간 백분위수 (ms)')
-        axes[1, 0].set_xlabel('테스트')
-        axes[1, 0].set_ylabel('응답 시간 (ms)')
-        axes[1, 0].set_xticks(x)
-        axes[1, 0].set_xticklabels(short_names, rotation=45, ha='right')
-        axes[1, 0].legend()
-        
-        # 5. 에러율
-        error_rates = [r.error_rate for r in self.results]
-        axes[1, 1].bar(range(len(short_names)), error_rates, color='red', alpha=0.7)
-        axes[1, 1].set_title('에러율 (%)')
-        axes[1, 1].set_xlabel('테스트')
-        axes[1, 1].set_ylabel('에러율 (%)')
-        axes[1, 1].set_xticks(range(len(short_names)))
-        axes[1, 1].set_xticklabels(short_names, rotation=45, ha='right')
-        
-        # 6. 데이터 처리량
-        data_throughput = [r.throughput_mb_per_sec for r in self.results]
-        axes[1, 2].bar(range(len(short_names)), data_throughput, color='purple', alpha=0.7)
-        axes[1, 2].set_title('데이터 처리량 (MB/s)')
-        axes[1, 2].set_xlabel('테스트')
-        axes[1, 2].set_ylabel('처리량 (MB/s)')
-        axes[1, 2].set_xticks(range(len(short_names)))
-        axes[1, 2].set_xticklabels(short_names, rotation=45, ha='right')
-        
-        plt.tight_layout()
-        
-        # 저장
+        hcm_reports = load_shared_module('hcm_reports')
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        plot_file = f"./test-results/performance_benchmark_{timestamp}.png"
-        plt.savefig(plot_file, dpi=300, bbox_inches='tight')
-        plt.show()
-        
-        print(f"📊 성능 시각화 저장: {plot_file}")
+        renderer.submit(hcm_reports.ReportFigure(
+            'performance', columns if columns is not None else self.result_columns(),
+            f"./test-results/performance_benchmark_{timestamp}.png",
+            labels={'test_name': [result.test_name for result in self.results]}
+        ))
+
+def benchmark_metric_families(benchmark: HCMPerformanceBenchmark) -> list:
+    """실행 중/완료된 테스트의 요청 카운터와 응답시간 히스토그램 (스크랩 시점에 집계기에서 읽음)"""
+    hcm_openmetrics = load_shared_module('hcm_openmetrics')
+    requests, failures, received, durations, phases = [], [], [], [], []
+    for label, accumulator in benchmark.live_accumulators.items():
+        labels = {'test': label}
+        requests.append((labels, accumulator.total_requests))
+        failures.append((labels, accumulator.total_requests - accumulator.successful_requests))
+        received.append((labels, accumulator.total_bytes))
+        histogram = accumulator.histogram
+        durations.append((labels, [(upper / 1000, count) for upper, count in histogram.cumulative_buckets()],
+                          histogram.total, accumulator.latency_sum / 1000))
+        for phase, phase_histogram in accumulator.phase_histograms.items():
+            phases.append(({**labels, 'phase': phase},
+                           [(upper / 1000, count) for upper, count in phase_histogram.cumulative_buckets()],
+                           phase_histogram.total, accumulator.phase_sums[phase] / 1000))
+    
+    return [
+        hcm_openmetrics.counter('hcm_benchmark_requests', '전송한 요청 수', requests),
+        hcm_openmetrics.counter('hcm_benchmark_request_failures', '실패한 요청 수', failures),
+        hcm_openmetrics.counter('hcm_benchmark_response_bytes', '수신한 응답 바이트', received),
+        hcm_openmetrics.histogram('hcm_benchmark_request_duration_seconds', '성공 요청 응답시간', durations),
+        hcm_openmetrics.histogram('hcm_benchmark_phase_duration_seconds', '요청 단계별 소요 시간', phases),
+    ]
+
+def serve_benchmark_metrics(benchmark: HCMPerformanceBenchmark, port: Optional[int], host: str = '127.0.0.1'):
+    """port가 주어지면 /metrics 엔드포인트를 여는 async 컨텍스트, 아니면 아무것도 하지 않음"""
+    if port is None:
+        return contextlib.nullcontext()
+    exporter = load_shared_module('hcm_openmetrics').OpenMetricsExporter(port, host)
+    exporter.register(lambda: benchmark_metric_families(benchmark))
+    return exporter
+
+def record_baseline(benchmark: HCMPerformanceBenchmark, revision: str,
+                    db_path: str = DEFAULT_BASELINE_DB):
+    """벤치마크 결과를 기준선 저장소에 기록"""
+    store = BaselineStore(db_path)
+    try:
+        for result in benchmark.results:
+            store.record(result, benchmark.latency_samples.get(result.test_name, []),
+                         revision, benchmark.base_url, benchmark.latency_histograms.get(result.test_name))
+    finally:
+        store.close()
+    print(f"💾 기준선 저장: {revision} ({len(benchmark.results)}개 테스트) → {db_path}")
+
+def compare_baselines(baseline_rev: str, candidate_rev: str, db_path: str = DEFAULT_BASELINE_DB,
+                      **thresholds) -> bool:
+    """저장된 두 리비전 비교, 회귀가 있으면 True"""
+    store = BaselineStore(db_path)
+    try:
+        baseline_runs = store.load(baseline_rev)
+        candidate_runs = store.load(candidate_rev)
+    finally:
+        store.close()
+    
+    if not baseline_runs:
+        raise ValueError(f"기준 리비전 '{baseline_rev}'의 저장된 결과가 없습니다")
+    if not candidate_runs:
+        raise ValueError(f"후보 리비전 '{candidate_rev}'의 저장된 결과가 없습니다")
+    
+    findings = compare_runs(baseline_runs, candidate_runs, **thresholds)
+    return print_regression_report(findings, baseline_rev, candidate_rev)
 
-async def run_performance_benchmark():
-    """성능 벤치마크 실행"""
-    benchmark = HCMPerformanceBenchmark()
+def build_resource_source(containers: Optional[List[str]] = None, pids: Optional[List[int]] = None,
+                          process_patterns: Optional[List[str]] = None):
+    """리소스 샘플링 대상 구성 (docker 사용 불가 시 /proc 프로세스 검색으로 대체)"""
+    if containers:
+        try:
+            return DockerResourceSource(containers)
+        except Exception as e:
+            print(f"⚠️ Docker 연결 실패, 로컬 프로세스로 대체: {e}")
+            # 로컬 개발 모드(pnpm dev:*)에서는 컨테이너 이름의 서비스 경로로 프로세스 검색
+            process_patterns = (process_patterns or []) + [name.replace('hcm-', '') for name in containers]
+    
+    targets = {f"pid[{pid}]": pid for pid in pids or []}
+    for pattern in process_patterns or []:
+        targets.update(ProcResourceSource.find_pids(pattern))
+    
+    if targets:
+        return ProcResourceSource(targets)
+    if containers or pids or process_patterns:
+        print("⚠️ 리소스 샘플링 대상을 찾지 못했습니다")
+    return None
+
+async def run_performance_benchmark(base_url: str = "http://localhost:3001",
+                                    scenario_files: Optional[List[str]] = None,
+                                    validate_responses: bool = False,
+                                    trace_phases: bool = True,
+                                    resource_source=None,
+                                    resource_interval: float = 1.0,
+                                    plots: bool = True,
+                                    show_plots: bool = True,
+                                    quick_report: bool = False,
+                                    html_report: bool = False,
+                                    metrics_port: Optional[int] = None,
+                                    metrics_host: str = '127.0.0.1',
+                                    profiler=None) -> HCMPerformanceBenchmark:
+    """성능 벤치마크 실행 (profiler: hcm_profiling.Profiler, 부하 생성 구간 프로파일링)"""
+    import pandas as pd
+    
+    benchmark = HCMPerformanceBenchmark(base_url, validate_responses, trace_phases)
+    benchmark.resource_source = resource_source
+    benchmark.resource_interval = resource_interval
+    benchmark.profiler = profiler
+    
+    scenarios = None
+    if scenario_files:
+        scenarios = [scenario for path in scenario_files for scenario in load_scenario_file(path)]
     
-    # 벤치마크 실행
-    await benchmark.run_comprehensive_benchmark()
+    # 벤치마크 실행 (metrics_port가 있으면 실행 중 /metrics로 실시간 지표 노출)
+    async with serve_benchmark_metrics(benchmark, metrics_port, metrics_host):
+        await benchmark.run_comprehensive_benchmark(scenarios)
     
     # 결과 분석
     print("\n📊 성능 벤치마킹 완료!")
@@ -393,41 +1450,449 @@ async def run_performance_benchmark():
     for result in benchmark.results:
         print(f"\n🎯 {result.test_name}")
         print(f"   총 요청: {result.total_requests:,}")
-        print(f"   성공률: {(result.successful_requests/result.total_requests)*100:.1f}%")
+        print(f"   성공률: {(result.successful_requests/max(result.total_requests, 1))*100:.1f}%")
         print(f"   평균 응답시간: {result.avg_response_time:.1f}ms")
         print(f"   95th 백분위: {result.percentile_95:.1f}ms")
         print(f"   처리량: {result.requests_per_second:.1f} req/s")
         print(f"   에러율: {result.error_rate:.1f}%")
+        if result.phase_percentiles:
+            phases = ", ".join(f"{phase} {stats['p50']:.1f}/{stats['p99']:.1f}"
+                               for phase, stats in result.phase_percentiles.items())
+            print(f"   단계별 p50/p99 (ms): {phases}")
+            print(f"   연결 재사용률: {result.connection_reuse_ratio*100:.1f}%")
+    
+    # 그래프는 백그라운드에서 렌더링하고 그동안 보고서 파일 저장
+    columns = benchmark.result_columns()
+    hcm_reports = load_shared_module('hcm_reports')
+    renderer = hcm_reports.ReportRenderer(hcm_reports.ReportOptions(show=show_plots, quick=quick_report,
+                                                                    html=html_report))
+    if plots:
+        benchmark.create_performance_visualizations(renderer, columns)
     
     # 보고서 생성
-    report_df = benchmark.generate_performance_report()
+    with benchmark.phase('dataframe'):
+        report_df = benchmark.generate_performance_report(columns)
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     report_file = f"./test-results/performance_report_{timestamp}.csv"
-    report_df.to_csv(report_file, index=False, encoding='utf-8-sig')
+    with benchmark.phase('io'):
+        report_df.to_csv(report_file, index=False, encoding='utf-8-sig')
+    
+    if benchmark.resource_timelines:
+        timeline_df = pd.DataFrame([
+            {'Test Name': test_name, **row}
+            for test_name, timeline in benchmark.resource_timelines.items() for row in timeline
+        ])
+        timeline_file = f"./test-results/resource_timeline_{timestamp}.csv"
+        with benchmark.phase('io'):
+            timeline_df.to_csv(timeline_file, index=False, encoding='utf-8-sig')
+        print(f"🖥️ 리소스 타임라인 저장: {timeline_file}")
     
-    # 시각화 생성
-    benchmark.create_performance_visualizations()
+    renderer.finish('HCM 시스템 성능 벤치마킹 결과', html_file=f"./test-results/performance_report_{timestamp}.html",
+                    summary={result.test_name: asdict(result) for result in benchmark.results})
     
     print(f"\n✅ 성능 보고서 저장: {report_file}")
+    if profiler:
+        profiler.report('benchmark_phases')
+    
+    return benchmark
+
+class StubGatewayProcess:
+    """자체 검증용 로컬 스텁 게이트웨이 프로세스 (stub-gateway.py)"""
+    
+    def __init__(self, profiles: Dict[str, Dict[str, Any]], port: Optional[int] = None):
+        self.profiles = profiles
+        self.port = port or self._free_port()
+        self.base_url = f"http://127.0.0.1:{self.port}"
+        self.process: Optional[subprocess.Popen] = None
+        self._config_file = None
+    
+    @staticmethod
+    def _free_port() -> int:
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+            sock.bind(('127.0.0.1', 0))
+            return sock.getsockname()[1]
+    
+    async def __aenter__(self) -> 'StubGatewayProcess':
+        self._config_file = tempfile.NamedTemporaryFile('w', suffix='.json', delete=False)
+        json.dump(self.profiles, self._config_file)
+        self._config_file.close()
+        
+        # 별도 프로세스로 띄워 부하 생성기와 이벤트 루프/CPU를 공유하지 않도록 함
+        self.process = subprocess.Popen(
+            [sys.executable, str(STUB_GATEWAY_SCRIPT), '--port', str(self.port),
+             '--config', self._config_file.name],
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+        )
+        
+        async with aiohttp.ClientSession() as session:
+            for _ in range(100):
+                try:
+                    async with session.get(f"{self.base_url}/__stub/stats") as response:
+                        if response.status == 200:
+                            return self
+                except aiohttp.ClientError:
+                    pass
+                await asyncio.sleep(0.1)
+        
+        await self.__aexit__(None, None, None)
+        raise RuntimeError("스텁 게이트웨이가 시작되지 않았습니다")
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        if self.process:
+            self.process.terminate()
+            self.process.wait(timeout=10)
+        if self._config_file:
+            Path(self._config_file.name).unlink(missing_ok=True)
+    
+    async def stats(self) -> Dict[str, Any]:
+        async with aiohttp.ClientSession() as session:
+            async with session.get(f"{self.base_url}/__stub/stats") as response:
+                return await response.json()
+    
+    async def reset(self):
+        async with aiohttp.ClientSession() as session:
+            async with session.post(f"{self.base_url}/__stub/reset") as response:
+                await response.read()
+
+# 자체 검증용 스텁 프로파일 (지연/에러/크기가 정확히 알려진 값)
+SELF_TEST_LATENCY_MS = 20.0
+SELF_TEST_PAYLOAD_BYTES = 64 * 1024
+SELF_TEST_ERROR_RATE = 0.2
+SELF_TEST_PROFILES = {
+    '/health': {'latency': {'dist': 'fixed', 'ms': SELF_TEST_LATENCY_MS}},
+    '/services': {'latency': {'dist': 'fixed', 'ms': 0}},
+    '/analytics/overview': {'latency': {'dist': 'fixed', 'ms': 0}, 'payload_bytes': SELF_TEST_PAYLOAD_BYTES},
+    '/workflows/employee-onboarding': {'latency': {'dist': 'fixed', 'ms': 0}, 'error_rate': SELF_TEST_ERROR_RATE},
+}
+
+async def run_self_test(overhead_tolerance_ms: float = 5.0) -> bool:
+    """로컬 스텁을 상대로 부하 생성기의 정확도/오버헤드/최대 측정 처리량 검증"""
+    print("🧪 벤치마크 자체 검증 시작 (로컬 스텁 게이트웨이)...")
+    checks = []
+    
+    async with StubGatewayProcess(SELF_TEST_PROFILES) as stub:
+        benchmark = HCMPerformanceBenchmark(stub.base_url)
+        
+        # 1. 측정 정확도: 고정 지연 대비 측정값 차이 = 클라이언트 오버헤드
+        accumulator = await benchmark.load_test('/health', concurrent_users=10, total_requests=500)
+        accuracy = benchmark.analyze_results(accumulator, 'Self-test - Latency Accuracy')
+        overhead = accuracy.avg_response_time - SELF_TEST_LATENCY_MS
+        server = (await stub.stats())['endpoints']['/health']
+        checks.append((f"응답시간 정확도: 주입 {SELF_TEST_LATENCY_MS:.1f}ms, 측정 평균 {accuracy.avg_response_time:.2f}ms "
+                       f"(오버헤드 {overhead:+.2f}ms, p99 {accuracy.percentile_99:.2f}ms)",
+                       0 <= overhead <= overhead_tolerance_ms))
+        checks.append((f"요청 수 일치: 클라이언트 성공 {accuracy.successful_requests}, 서버 수신 {server['requests']}",
+                       accuracy.successful_requests == server['requests'] == 500))
+        
+        # 2. 응답 크기 집계
+        accumulator = await benchmark.load_test('/analytics/overview', concurrent_users=10, total_requests=200)
+        sizes = (accumulator.min_response_size, accumulator.max_response_size)
+        checks.append((f"응답 크기 집계: 최소/최대 {sizes[0]}/{sizes[1]} bytes (기대 {SELF_TEST_PAYLOAD_BYTES})",
+                       sizes == (SELF_TEST_PAYLOAD_BYTES, SELF_TEST_PAYLOAD_BYTES)))
+        
+        # 3. 에러 집계: 서버가 주입한 에러 수와 클라이언트 실패 수가 같아야 함
+        accumulator = await benchmark.load_test('/workflows/employee-onboarding', concurrent_users=20,
+                                                total_requests=1000, method='POST', data={'firstName': 'Test'})
+        errors = benchmark.analyze_results(accumulator, 'Self-test - Error Accounting')
+        server = (await stub.stats())['endpoints']['/workflows/employee-onboarding']
+        checks.append((f"에러 집계: 클라이언트 실패 {errors.failed_requests}, 서버 주입 {server['errors']} "
+                       f"(에러율 {errors.error_rate:.1f}%)",
+                       errors.failed_requests == server['errors']))
+        
+        # 4. 하네스 최대 측정 처리량 (지연 0 엔드포인트)
+        accumulator = await benchmark.load_test('/services', concurrent_users=100, total_requests=5000)
+        ceiling = benchmark.analyze_results(accumulator, 'Self-test - Harness Ceiling')
+        checks.append((f"하네스 최대 측정 처리량: {ceiling.requests_per_second:.0f} req/s "
+                       f"(p99 {ceiling.percentile_99:.2f}ms)",
+                       ceiling.error_rate == 0))
+    
+    print("\n📋 자체 검증 결과:")
+    for description, passed in checks:
+        print(f"   {'✅' if passed else '❌'} {description}")
+    
+    all_passed = all(passed for _, passed in checks)
+    print("\n✅ 자체 검증 통과" if all_passed else "\n❌ 자체 검증 실패")
+    return all_passed
+
+def connector_matrix(pool_sizes: List[int], per_host_limits: List[int],
+                     keepalive_timeouts: List[float], connection_modes: List[str]) -> List[ConnectorSettings]:
+    """연결 풀 설정 조합 생성 (close 모드는 keep-alive 타임아웃과 무관하므로 한 번만)"""
+    settings = []
+    for pool, per_host, mode in itertools.product(pool_sizes, per_host_limits, connection_modes):
+        if mode == 'close':
+            settings.append(ConnectorSettings(limit=pool, limit_per_host=per_host, force_close=True))
+        elif mode == 'keepalive':
+            for timeout in keepalive_timeouts:
+                settings.append(ConnectorSettings(limit=pool, limit_per_host=per_host,
+                                                  keepalive_timeout=timeout))
+        else:
+            raise ValueError(f"알 수 없는 연결 모드: {mode} (keepalive 또는 close)")
+    return settings
+
+async def run_connector_matrix(base_url: str = "http://localhost:3001",
+                               scenario_files: Optional[List[str]] = None,
+                               matrix: Optional[List[ConnectorSettings]] = None,
+                               metrics_port: Optional[int] = None,
+                               metrics_host: str = '127.0.0.1') -> 'pd.DataFrame':
+    """연결 풀 설정별로 시나리오를 반복 실행해 처리량/꼬리 지연 변화 비교"""
+    import pandas as pd
+    
+    benchmark = HCMPerformanceBenchmark(base_url)
+    matrix = matrix or connector_matrix([10, 50, 100, 200], [0], [15.0], ['keepalive', 'close'])
     
-    return benchmark.results
+    paths = scenario_files or [DEFAULT_SCENARIO_FILE]
+    scenarios = [scenario for path in paths for scenario in load_scenario_file(path)]
+    
+    rows = []
+    async with serve_benchmark_metrics(benchmark, metrics_port, metrics_host):
+        for scenario in scenarios:
+            print(f"\n🔌 연결 설정 매트릭스: {scenario['name']} ({len(matrix)}개 설정)")
+            for settings in matrix:
+                benchmark.connector_settings = settings
+                if 'requests' in scenario:
+                    # 혼합 시나리오는 전체 합계 결과로 비교
+                    result = (await benchmark.run_mixed_scenario(scenario))[-1]
+                else:
+                    result = await benchmark.run_single_endpoint_scenario(scenario)
+                
+                connect = result.phase_percentiles.get('connect', {})
+                pool_wait = result.phase_percentiles.get('pool_wait', {})
+                rows.append({
+                    'Scenario': scenario['name'],
+                    'Connector': settings.label(),
+                    'Pool Size': settings.limit,
+                    'Per-Host Limit': settings.limit_per_host,
+                    'Keep-Alive Timeout (s)': None if settings.force_close else settings.keepalive_timeout,
+                    'Force Close': settings.force_close,
+                    'Requests/sec': result.requests_per_second,
+                    'Avg Response Time (ms)': result.avg_response_time,
+                    '99th Percentile (ms)': float(result.percentile_99),
+                    'Error Rate (%)': result.error_rate,
+                    'Connection Reuse (%)': (result.connection_reuse_ratio or 0) * 100,
+                    'Connect p99 (ms)': connect.get('p99'),
+                    'Pool Wait p99 (ms)': pool_wait.get('p99')
+                })
+                print(f"   {settings.label():45} {result.requests_per_second:8.1f} req/s, "
+                      f"p99 {result.percentile_99:7.1f}ms, 재사용 {(result.connection_reuse_ratio or 0)*100:5.1f}%")
+                await asyncio.sleep(2)
+    
+    matrix_df = pd.DataFrame(rows)
+    
+    # 시나리오별 첫 번째 설정 대비 변화율
+    for scenario_name, group in matrix_df.groupby('Scenario', sort=False):
+        base = group.iloc[0]
+        matrix_df.loc[group.index, 'Throughput Change (%)'] = \
+            (group['Requests/sec'] / max(base['Requests/sec'], 1e-9) - 1) * 100
+        matrix_df.loc[group.index, 'p99 Change (%)'] = \
+            (group['99th Percentile (ms)'] / max(base['99th Percentile (ms)'], 1e-9) - 1) * 100
+    
+    print("\n📊 연결 설정 매트릭스 결과 (시나리오별 첫 설정 대비)")
+    print("=" * 50)
+    for _, row in matrix_df.iterrows():
+        print(f"🎯 {row['Scenario']} / {row['Connector']}: "
+              f"처리량 {row['Throughput Change (%)']:+.1f}%, p99 {row['p99 Change (%)']:+.1f}%")
+    
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    matrix_file = f"./test-results/connector_matrix_{timestamp}.csv"
+    matrix_df.to_csv(matrix_file, index=False, encoding='utf-8-sig')
+    print(f"\n✅ 연결 설정 매트릭스 저장: {matrix_file}")
+    
+    return matrix_df
+
+def capacity_targets(scenarios: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """시나리오에서 용량 탐색 대상 엔드포인트 추출 (중복 제거)"""
+    targets = {}
+    for scenario in scenarios:
+        entries = scenario['requests'] if 'requests' in scenario else [scenario]
+        for entry in entries:
+            method = entry.get('method', 'GET').upper()
+            key = (method, entry['endpoint'])
+            if key not in targets:
+                targets[key] = {
+                    'endpoint': entry['endpoint'],
+                    'method': method,
+                    'data': entry.get('payload', entry.get('data'))
+                }
+    return list(targets.values())
+
+async def run_capacity_search(base_url: str = "http://localhost:3001",
+                              scenario_files: Optional[List[str]] = None,
+                              slo: Optional[SLOTarget] = None, metrics_port: Optional[int] = None,
+                              metrics_host: str = '127.0.0.1', **search_options) -> List[CapacityResult]:
+    """엔드포인트별 용량 탐색 실행"""
+    import pandas as pd
+    
+    benchmark = HCMPerformanceBenchmark(base_url)
+    slo = slo or SLOTarget()
+    
+    paths = scenario_files or [DEFAULT_SCENARIO_FILE]
+    scenarios = [scenario for path in paths for scenario in load_scenario_file(path)]
+    
+    capacity_results = []
+    async with serve_benchmark_metrics(benchmark, metrics_port, metrics_host):
+        for target in capacity_targets(scenarios):
+            capacity_results.append(await benchmark.capacity_search(target, slo, **search_options))
+    
+    print("\n📊 용량 탐색 완료!")
+    print("=" * 50)
+    for result in capacity_results:
+        knee = f"{result.knee_rps:.1f}" if result.knee_rps else "-"
+        print(f"🎯 {result.method} {result.endpoint}: 최대 {result.max_sustainable_rps:.1f} req/s (knee: {knee})")
+    
+    # 포화 곡선 및 요약 저장
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    curve_df = pd.DataFrame([
+        {'Endpoint': f"{result.method} {result.endpoint}", **asdict(point)}
+        for result in capacity_results for point in result.curve
+    ])
+    curve_file = f"./test-results/capacity_curve_{timestamp}.csv"
+    curve_df.to_csv(curve_file, index=False, encoding='utf-8-sig')
+    
+    summary_file = f"./test-results/capacity_summary_{timestamp}.json"
+    with open(summary_file, 'w', encoding='utf-8') as f:
+        json.dump([asdict(result) for result in capacity_results], f, indent=2, ensure_ascii=False)
+    
+    print(f"\n✅ 포화 곡선 저장: {curve_file}")
+    print(f"✅ 용량 요약 저장: {summary_file}")
+    
+    return capacity_results
 
 if __name__ == "__main__":
-    import os
+    parser = argparse.ArgumentParser(description="HCM 시스템 성능 벤치마킹")
+    parser.add_argument("--base-url", default="http://localhost:3001", help="대상 게이트웨이 URL")
+    parser.add_argument("--scenario", action="append", dest="scenarios", metavar="FILE",
+                        help="시나리오 파일(JSON/YAML), 여러 번 지정 가능 (기본: scenarios/comprehensive.json)")
+    parser.add_argument("--validate-responses", action="store_true",
+                        help="응답 본문을 모두 읽어 JSON 유효성 검사 (기본: 바이트 수만 집계)")
+    parser.add_argument("--no-trace", action="store_true",
+                        help="요청 단계별(DNS/연결/TTFB/본문) 시간 측정 비활성화")
+    parser.add_argument("--resource-container", action="append", metavar="NAME",
+                        help="리소스를 샘플링할 Docker 컨테이너 (예: hcm-api-gateway)")
+    parser.add_argument("--resource-pid", action="append", type=int, metavar="PID",
+                        help="리소스를 샘플링할 로컬 프로세스 PID")
+    parser.add_argument("--resource-process", action="append", metavar="PATTERN",
+                        help="명령줄로 찾을 로컬 프로세스 (예: api-gateway)")
+    parser.add_argument("--resource-interval", type=float, default=1.0, help="리소스 샘플링 간격 (초)")
+    parser.add_argument("--non-interactive", action="store_true",
+                        help="확인 입력 없이 실행하고 그래프는 화면 출력 없이 파일로만 저장 (CI용)")
+    parser.add_argument("--no-plots", action="store_true", help="그래프 생성 생략")
+    parser.add_argument("--quick-report", action="store_true", help="그래프를 낮은 해상도로 빠르게 렌더링")
+    parser.add_argument("--html-report", action="store_true", help="그래프와 요약을 담은 HTML 보고서 생성")
+    parser.add_argument("--metrics-port", type=int,
+                        help="실행 중 OpenMetrics(/metrics) 엔드포인트를 열 포트 (기본: 사용 안 함)")
+    parser.add_argument("--metrics-host", default="127.0.0.1", help="OpenMetrics 엔드포인트 바인드 주소")
+    parser.add_argument("--profile", nargs="?", const="sample", choices=["sample", "cprofile"],
+                        help="부하 생성 구간 프로파일링 (sample: collapsed-stack 파일, cprofile: .prof 파일)")
+    parser.add_argument("--profile-interval", type=float, default=5.0, help="샘플링 간격 (ms)")
+    parser.add_argument("--profile-alloc", action="store_true", help="tracemalloc으로 메모리 할당 위치 비교")
+    parser.add_argument("--self-test", action="store_true",
+                        help="로컬 스텁 게이트웨이로 부하 생성기 정확도/오버헤드 자체 검증 (docker 불필요)")
+    parser.add_argument("--capacity-search", action="store_true",
+                        help="SLO를 만족하는 엔드포인트별 최대 처리량 탐색")
+    parser.add_argument("--connector-matrix", action="store_true",
+                        help="연결 풀 크기/호스트별 한도/keep-alive/강제 재연결 조합별 비교 실행")
+    parser.add_argument("--pool-sizes", default="10,50,100,200", help="매트릭스: 연결 풀 크기 목록 (0=무제한)")
+    parser.add_argument("--per-host-limits", default="0", help="매트릭스: 호스트별 연결 한도 목록 (0=무제한)")
+    parser.add_argument("--keepalive-timeouts", default="15", help="매트릭스: keep-alive 타임아웃 목록 (초)")
+    parser.add_argument("--connection-modes", default="keepalive,close",
+                        help="매트릭스: keepalive(연결 재사용), close(요청마다 새 연결)")
+    parser.add_argument("--slo-p99", type=float, default=200.0, help="SLO p99 응답시간 (ms)")
+    parser.add_argument("--slo-error-rate", type=float, default=0.1, help="SLO 최대 에러율 (%%)")
+    parser.add_argument("--start-rate", type=float, default=10.0, help="탐색 시작 도착률 (req/s)")
+    parser.add_argument("--max-rate", type=float, default=5000.0, help="탐색 최대 도착률 (req/s)")
+    parser.add_argument("--step-seconds", type=float, default=10.0, help="도착률 단계별 측정 시간 (초)")
+    parser.add_argument("--revision", default=None, help="결과를 기록할 리비전 (기본: 현재 git HEAD)")
+    parser.add_argument("--record", action="store_true", help="결과를 기준선 저장소에 기록")
+    parser.add_argument("--compare", nargs="+", metavar="REV",
+                        help="BASE [CANDIDATE]: 저장된 리비전과 비교 (CANDIDATE 생략 시 지금 실행한 결과와 비교)")
+    parser.add_argument("--baseline-db", default=DEFAULT_BASELINE_DB, help="기준선 저장소 (SQLite)")
+    parser.add_argument("--latency-threshold", type=float, default=10.0, help="응답시간 회귀 임계값 (%%)")
+    parser.add_argument("--throughput-threshold", type=float, default=10.0, help="처리량 회귀 임계값 (%%)")
+    parser.add_argument("--error-threshold", type=float, default=1.0, help="에러율 회귀 임계값 (%%p)")
+    args = parser.parse_args()
+    
+    if args.compare and len(args.compare) > 2:
+        parser.error("--compare 는 BASE [CANDIDATE] 최대 2개 리비전만 받습니다")
+    
+    revision = args.revision or current_git_revision()
+    thresholds = {
+        'latency_threshold_pct': args.latency_threshold,
+        'throughput_threshold_pct': args.throughput_threshold,
+        'error_threshold_pct': args.error_threshold
+    }
     
     # 결과 디렉토리 생성
     os.makedirs("./test-results", exist_ok=True)
     
+    # 로컬 스텁 대상 자체 검증 (docker 스택 불필요)
+    if args.self_test:
+        sys.exit(0 if asyncio.run(run_self_test()) else 1)
+    
+    # 저장된 두 리비전 비교만 수행 (부하 테스트 없음)
+    if args.compare and len(args.compare) == 2:
+        try:
+            regressed = compare_baselines(args.compare[0], args.compare[1], args.baseline_db, **thresholds)
+        except Exception as e:
+            print(f"\n❌ 비교 중 오류 발생: {e}")
+            sys.exit(2)
+        sys.exit(1 if regressed else 0)
+    
     # 성능 벤치마크 실행
     print("🚀 HCM 시스템 성능 벤치마킹을 시작합니다...")
     print("⚠️  주의: 이 테스트를 실행하기 전에 HCM 시스템이 실행 중인지 확인하세요!")
     print("    명령어: pnpm docker:dev:all")
     
-    input("\nEnter를 눌러 계속...")
+    if not args.non_interactive:
+        input("\nEnter를 눌러 계속...")
     
+    regressed = False
     try:
-        asyncio.run(run_performance_benchmark())
+        if args.connector_matrix:
+            asyncio.run(run_connector_matrix(args.base_url, args.scenarios, connector_matrix(
+                [int(v) for v in args.pool_sizes.split(',')],
+                [int(v) for v in args.per_host_limits.split(',')],
+                [float(v) for v in args.keepalive_timeouts.split(',')],
+                [v.strip() for v in args.connection_modes.split(',')]
+            ), metrics_port=args.metrics_port, metrics_host=args.metrics_host))
+        elif args.capacity_search:
+            asyncio.run(run_capacity_search(
+                args.base_url, args.scenarios,
+                slo=SLOTarget(p99_ms=args.slo_p99, max_error_rate=args.slo_error_rate),
+                start_rate=args.start_rate,
+                max_rate=args.max_rate,
+                step_seconds=args.step_seconds,
+                metrics_port=args.metrics_port,
+                metrics_host=args.metrics_host
+            ))
+        else:
+            resource_source = build_resource_source(args.resource_container, args.resource_pid,
+                                                    args.resource_process)
+            profiler = None
+            if args.profile or args.profile_alloc:
+                hcm_profiling = load_shared_module('hcm_profiling')
+                profiler = hcm_profiling.Profiler(hcm_profiling.ProfileOptions(
+                    mode=args.profile, interval=args.profile_interval / 1000, allocations=args.profile_alloc))
+            benchmark = asyncio.run(run_performance_benchmark(args.base_url, args.scenarios,
+                                                              args.validate_responses,
+                                                              trace_phases=not args.no_trace,
+                                                              resource_source=resource_source,
+                                                              resource_interval=args.resource_interval,
+                                                              plots=not args.no_plots,
+                                                              show_plots=not args.non_interactive,
+                                                              quick_report=args.quick_report,
+                                                              html_report=args.html_report,
+                                                              metrics_port=args.metrics_port,
+                                                              metrics_host=args.metrics_host,
+                                                              profiler=profiler))
+            if args.record or args.compare:
+                record_baseline(benchmark, revision, args.baseline_db)
+            if args.compare:
+                regressed = compare_baselines(args.compare[0], revision, args.baseline_db, **thresholds)
         print("\n🎉 성능 벤치마킹 완료!")
     except Exception as e:
         print(f"\n❌ 벤치마킹 중 오류 발생: {e}")
         print("💡 HCM 시스템이 실행 중인지 확인하세요: pnpm health-check")
+        sys.exit(2)
+    
+    if regressed:
+        sys.exit(1)
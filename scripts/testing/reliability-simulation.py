@@ -8,17 +8,24 @@ import time
 import random
 import asyncio
 import aiohttp
-import docker
-import matplotlib.pyplot as plt
-import pandas as pd
-import numpy as np
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
-from dataclasses import dataclass
+from typing import List, Dict, Any, Optional, TYPE_CHECKING
+from dataclasses import dataclass, field, asdict
 from enum import Enum
+from urllib.parse import urlparse
+import importlib
 import json
+import math
+import os
+import struct
+import sys
 import threading
 import queue
+from collections import deque
+
+# docker SDK와 분석/시각화 패키지(pandas, numpy, matplotlib)는 필요한 시점에 지연 로드
+if TYPE_CHECKING:
+    import pandas as pd
 
 class ServiceStatus(Enum):
     HEALTHY = "healthy"
@@ -36,6 +43,8 @@ class ServiceMetric:
     memory_usage: float
     error_rate: float
     availability: float
+    connect_time: float = 0.0  # ms, 기존 연결을 재사용하면 0
+    phase: str = ''  # 실험 타임라인 단계 (baseline, fault:..., recovery:...)
 
 @dataclass
 class FaultScenario:
@@ -45,14 +54,974 @@ class FaultScenario:
     fault_type: str  # "stop", "stress", "network", "memory"
     duration_minutes: int
     severity: str  # "minor", "major", "critical"
+    # 장애 유형별 세부 설정 (FAULT_PARAM_DEFAULTS 참고)
+    params: Dict[str, Any] = field(default_factory=dict)
+
+@dataclass
+class TimelineStep:
+    at: float  # 실험 시작 기준 초
+    phase: Optional[str] = None  # 이 시점부터 지표에 붙일 단계 이름
+    inject: Optional[str] = None  # 주입할 장애 ID
+    recover: Optional[str] = None  # 복구할 장애 ID
+    load: Optional[Dict[str, Any]] = None  # 부하 단계 설정 (load_controller가 처리)
+
+@dataclass
+class ExperimentTimeline:
+    name: str
+    faults: Dict[str, FaultScenario]
+    steps: List[TimelineStep]
+    duration_seconds: float
+    monitor_interval: Optional[float] = None
+
+# 게이트웨이 뒤 HTTP 서비스의 로컬 포트
+HTTP_SERVICE_PORTS = {
+    'hcm-hr-resource': 3002,
+    'hcm-matching-engine': 3003,
+    'hcm-verification': 3004,
+    'hcm-edge-agent': 3005,
+}
+
+# 인프라 서비스의 로컬 포트와 준비 상태 확인 프로토콜
+INFRA_SERVICE_PORTS = {
+    'hcm-redis': ('redis', 6379),
+    'neo4j': ('bolt', 7687),
+    'hcm-postgres': ('postgres', 5432),
+}
+
+SCENARIO_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'scenarios')
+DEFAULT_TIMELINE_FILE = os.path.join(SCENARIO_DIR, 'fault-timeline.json')
+
+def load_timeline(path: str) -> ExperimentTimeline:
+    """실험 타임라인 파일(JSON/YAML) 로드
+    
+    복구 단계가 없는 장애는 주입 시각 + duration_minutes에 자동 복구하며,
+    단계 이름이 없으면 fault:<ID> / recovery:<ID>를 붙인다.
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        text = f.read()
+    if path.lower().endswith(('.yaml', '.yml')):
+        try:
+            import yaml
+        except ImportError:
+            raise RuntimeError("YAML 타임라인을 사용하려면 PyYAML이 필요합니다: pip install pyyaml")
+        document = yaml.safe_load(text)
+    else:
+        document = json.loads(text)
+    
+    faults = {
+        fault_id: FaultScenario(**{'name': fault_id, **values})
+        for fault_id, values in document.get('faults', {}).items()
+    }
+    steps = [TimelineStep(**step) for step in document.get('timeline', [])]
+    for step in steps:
+        for fault_id in (step.inject, step.recover):
+            if fault_id is not None and fault_id not in faults:
+                raise ValueError(f"{path}: 정의되지 않은 장애 '{fault_id}'")
+    
+    recovered = {step.recover for step in steps if step.recover}
+    for step in list(steps):
+        if step.inject is None:
+            continue
+        if step.phase is None:
+            step.phase = f"fault:{step.inject}"
+        if step.inject not in recovered:
+            steps.append(TimelineStep(at=step.at + faults[step.inject].duration_minutes * 60,
+                                      recover=step.inject))
+    for step in steps:
+        if step.recover is not None and step.phase is None:
+            step.phase = f"recovery:{step.recover}"
+    steps.sort(key=lambda step: step.at)
+    
+    duration = document.get('duration_seconds', (steps[-1].at if steps else 0) + 60)
+    return ExperimentTimeline(name=document.get('name', os.path.splitext(os.path.basename(path))[0]),
+                              faults=faults, steps=steps, duration_seconds=float(duration),
+                              monitor_interval=document.get('monitor_interval'))
+
+def load_shared_module(module_name: str):
+    """같은 디렉토리의 공유 모듈(hcm_reports, hcm_openmetrics) 지연 로드
+    
+    프로세스 풀 작업자도 import할 수 있도록 모듈 경로를 sys.path에 등록한다.
+    """
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    if script_dir not in sys.path:
+        sys.path.insert(0, script_dir)
+    return importlib.import_module(module_name)
+
+# 상태 코드 (값이 클수록 나쁜 상태, 롤업 시 구간 내 최악 상태를 대표값으로 사용)
+STATUS_CODES = {
+    ServiceStatus.HEALTHY: 0,
+    ServiceStatus.RECOVERING: 1,
+    ServiceStatus.DEGRADED: 2,
+    ServiceStatus.FAILED: 3,
+}
+STATUS_BY_CODE = {code: status for status, code in STATUS_CODES.items()}
+
+# (컬럼명, dtype) - 타임스탬프는 naive datetime 기준 epoch 초
+METRIC_COLUMNS = [
+    ('timestamp', 'float64'),
+    ('status', 'int8'),
+    ('phase', 'int16'),  # MetricsStore.phase_names 인덱스
+    ('response_time', 'float32'),
+    ('connect_time', 'float32'),
+    ('cpu_usage', 'float32'),
+    ('memory_usage', 'float32'),
+    ('error_rate', 'float32'),
+    ('availability', 'float32'),
+]
+# 롤업 시 평균을 내는 측정값 컬럼
+_ROLLUP_FIELDS = [name for name, _ in METRIC_COLUMNS if name not in ('timestamp', 'status', 'phase')]
+_EPOCH = datetime(1970, 1, 1)
+
+class MetricRing:
+    """고정 용량 컬럼형 링 버퍼 (컬럼별 NumPy 배열)"""
+    
+    def __init__(self, capacity: int, extra_columns: Optional[List[tuple]] = None):
+        import numpy as np
+        
+        self.capacity = capacity
+        self.columns = METRIC_COLUMNS + (extra_columns or [])
+        self.data = {name: np.zeros(capacity, dtype=dtype) for name, dtype in self.columns}
+        self.start = 0
+        self.size = 0
+    
+    def __len__(self) -> int:
+        return self.size
+    
+    def is_full(self) -> bool:
+        return self.size == self.capacity
+    
+    def append(self, row: Dict[str, float]):
+        """한 행 추가 (가득 차 있으면 가장 오래된 행을 덮어씀)"""
+        index = (self.start + self.size) % self.capacity
+        for name, _ in self.columns:
+            self.data[name][index] = row[name]
+        if self.size < self.capacity:
+            self.size += 1
+        else:
+            self.start = (self.start + 1) % self.capacity
+    
+    def _indices(self, count: int):
+        import numpy as np
+        return (self.start + np.arange(count)) % self.capacity
+    
+    def snapshot(self) -> Dict[str, Any]:
+        """시간순으로 정렬된 컬럼 복사본"""
+        indices = self._indices(self.size)
+        return {name: self.data[name][indices] for name, _ in self.columns}
+    
+    def pop_oldest(self, count: int) -> Dict[str, Any]:
+        """가장 오래된 count개 행을 꺼내 반환 (디스크 spill용)"""
+        count = min(count, self.size)
+        indices = self._indices(count)
+        chunk = {name: self.data[name][indices] for name, _ in self.columns}
+        self.start = (self.start + count) % self.capacity
+        self.size -= count
+        return chunk
+
+class _RollupBucket:
+    """롤업 구간 하나의 누적값"""
+    
+    def __init__(self, bucket_start: float):
+        self.bucket_start = bucket_start
+        self.count = 0
+        self.worst_status = 0
+        self.phase = 0  # 구간의 마지막 단계
+        self.sums = {name: 0.0 for name in _ROLLUP_FIELDS}
+    
+    def add(self, row: Dict[str, float], weight: int = 1):
+        self.count += weight
+        self.worst_status = max(self.worst_status, int(row['status']))
+        self.phase = int(row['phase'])
+        for name in self.sums:
+            self.sums[name] += float(row[name]) * weight
+    
+    def to_row(self) -> Dict[str, float]:
+        row = {name: total / self.count for name, total in self.sums.items()}
+        row.update(timestamp=self.bucket_start, status=self.worst_status, phase=self.phase, samples=self.count)
+        return row
+
+class ServiceMetricsStore:
+    """서비스 1개의 원본 링 버퍼와 다운샘플 롤업 (1s → 1min → 5min)"""
+    
+    # (해상도 이름, 구간 길이 초, 보관 행 수)
+    ROLLUPS = [('1min', 60, 24 * 60), ('5min', 300, 7 * 24 * 12)]
+    
+    def __init__(self, service_name: str, raw_capacity: int = 3600, spill_dir: Optional[str] = None):
+        self.service_name = service_name
+        self.raw = MetricRing(raw_capacity)
+        self.rollups = {name: MetricRing(capacity, [('samples', 'int32')]) for name, _, capacity in self.ROLLUPS}
+        self._buckets: Dict[str, Optional[_RollupBucket]] = {name: None for name, _, _ in self.ROLLUPS}
+        # None이면 원본 버퍼가 가득 찼을 때 오래된 행을 버림
+        self.spill_dir = spill_dir
+        self.spill_files: List[str] = []
+    
+    def append(self, row: Dict[str, float]):
+        if self.raw.is_full() and self.spill_dir:
+            self._spill(self.raw.pop_oldest(self.raw.capacity // 2))
+        self.raw.append(row)
+        self._roll(0, row, 1)
+    
+    def _roll(self, level: int, row: Dict[str, float], weight: int):
+        """level 단계 롤업 구간에 행을 누적하고, 구간이 끝나면 다음 단계로 전달"""
+        if level >= len(self.ROLLUPS):
+            return
+        name, seconds, _ = self.ROLLUPS[level]
+        bucket_start = row['timestamp'] - row['timestamp'] % seconds
+        bucket = self._buckets[name]
+        if bucket is not None and bucket.bucket_start != bucket_start:
+            self._flush(level)
+            bucket = None
+        if bucket is None:
+            bucket = self._buckets[name] = _RollupBucket(bucket_start)
+        bucket.add(row, weight)
+    
+    def _flush(self, level: int):
+        name = self.ROLLUPS[level][0]
+        bucket = self._buckets[name]
+        if bucket is None or bucket.count == 0:
+            return
+        rolled = bucket.to_row()
+        self.rollups[name].append(rolled)
+        self._buckets[name] = None
+        self._roll(level + 1, rolled, bucket.count)
+    
+    def _spill(self, chunk: Dict[str, Any]):
+        import numpy as np
+        
+        os.makedirs(self.spill_dir, exist_ok=True)
+        path = os.path.join(self.spill_dir, f"{self.service_name}-{len(self.spill_files):05d}.npz")
+        np.savez(path, **chunk)
+        self.spill_files.append(path)
+    
+    def columns(self, resolution: str = 'raw', include_spilled: bool = True) -> Dict[str, Any]:
+        """해상도별 시간순 컬럼 (raw는 디스크로 내보낸 구간까지 포함 가능)"""
+        import numpy as np
+        
+        if resolution != 'raw':
+            # 아직 닫히지 않은 구간도 포함해 최신 상태까지 반영
+            current = self.rollups[resolution].snapshot()
+            level = [name for name, _, _ in self.ROLLUPS].index(resolution)
+            pending = self._pending_row(level)
+            if pending is not None:
+                current = {name: np.append(values, pending[name]) for name, values in current.items()}
+            return current
+        
+        parts = []
+        if include_spilled:
+            for path in self.spill_files:
+                with np.load(path) as segment:
+                    parts.append({name: segment[name] for name, _ in METRIC_COLUMNS})
+        parts.append(self.raw.snapshot())
+        return {name: np.concatenate([part[name] for part in parts]) for name, _ in METRIC_COLUMNS}
+    
+    def _pending_row(self, level: int) -> Optional[Dict[str, float]]:
+        """level 단계에서 아직 집계 중인 구간 (하위 단계의 미완료 구간까지 합산)"""
+        name = self.ROLLUPS[level][0]
+        merged = None
+        bucket = self._buckets[name]
+        if bucket is not None:
+            merged = _RollupBucket(bucket.bucket_start)
+            merged.count, merged.worst_status, merged.sums = bucket.count, bucket.worst_status, dict(bucket.sums)
+            merged.phase = bucket.phase
+        for lower in range(level):
+            lower_bucket = self._buckets[self.ROLLUPS[lower][0]]
+            if lower_bucket is None:
+                continue
+            if merged is None:
+                seconds = self.ROLLUPS[level][1]
+                merged = _RollupBucket(lower_bucket.bucket_start - lower_bucket.bucket_start % seconds)
+            merged.add(lower_bucket.to_row(), lower_bucket.count)
+        return merged.to_row() if merged is not None else None
+
+class MetricsStore:
+    """서비스별 ServiceMetricsStore 모음 (메모리 사용량 고정)"""
+    
+    def __init__(self, raw_capacity: int = 3600, spill_dir: Optional[str] = None):
+        self.raw_capacity = raw_capacity
+        self.spill_dir = spill_dir
+        self.services: Dict[str, ServiceMetricsStore] = {}
+        # 단계 이름은 문자열 대신 인덱스로 저장 (0은 단계 없음)
+        self.phase_names: List[str] = ['']
+        self._phase_codes: Dict[str, int] = {'': 0}
+        self.total = 0
+    
+    def __len__(self) -> int:
+        return self.total
+    
+    def phase_code(self, phase: str) -> int:
+        code = self._phase_codes.get(phase)
+        if code is None:
+            code = self._phase_codes[phase] = len(self.phase_names)
+            self.phase_names.append(phase)
+        return code
+    
+    def append(self, metric: ServiceMetric):
+        store = self.services.get(metric.service_name)
+        if store is None:
+            store = self.services[metric.service_name] = ServiceMetricsStore(
+                metric.service_name, self.raw_capacity, self.spill_dir)
+        store.append({
+            'timestamp': (metric.timestamp - _EPOCH).total_seconds(),
+            'status': STATUS_CODES[metric.status],
+            'phase': self.phase_code(metric.phase),
+            'response_time': metric.response_time,
+            'connect_time': metric.connect_time,
+            'cpu_usage': metric.cpu_usage,
+            'memory_usage': metric.memory_usage,
+            'error_rate': metric.error_rate,
+            'availability': metric.availability,
+        })
+        self.total += 1
+    
+    def extend(self, metrics: List[ServiceMetric]):
+        for metric in metrics:
+            self.append(metric)
+    
+    @property
+    def spilled(self) -> bool:
+        return any(store.spill_files for store in self.services.values())
+    
+    def memory_bytes(self) -> int:
+        """링 버퍼가 차지하는 메모리 (bytes)"""
+        return sum(
+            array.nbytes
+            for store in self.services.values()
+            for ring in [store.raw, *store.rollups.values()]
+            for array in ring.data.values()
+        )
+    
+    def to_columns(self, resolution: str = 'raw', include_spilled: bool = True) -> tuple:
+        """전체 서비스의 지표를 하나의 컬럼 dict로 이어 붙임 (service는 정수 코드), (컬럼, 서비스 이름 목록) 반환"""
+        import numpy as np
+        
+        service_names = list(self.services)
+        parts = [store.columns(resolution, include_spilled) for store in self.services.values()]
+        columns = {
+            name: np.concatenate([part[name] for part in parts]) if parts else np.empty(0, dtype=dtype)
+            for name, dtype in METRIC_COLUMNS
+        }
+        columns['service'] = np.repeat(np.arange(len(parts)), [len(part['timestamp']) for part in parts])
+        columns['status'] = columns['status'].astype(int)
+        return columns, service_names
+    
+    def to_frame(self, resolution: str = 'raw', include_spilled: bool = True) -> 'pd.DataFrame':
+        """전체 서비스의 지표를 DataFrame으로 변환 (status는 문자열, timestamp는 datetime)"""
+        import numpy as np
+        import pandas as pd
+        
+        frames = []
+        for service_name, store in self.services.items():
+            columns = store.columns(resolution, include_spilled)
+            frame = pd.DataFrame(columns)
+            frame.insert(1, 'service_name', service_name)
+            frames.append(frame)
+        if not frames:
+            return pd.DataFrame(columns=[name for name, _ in METRIC_COLUMNS] + ['service_name'])
+        
+        df = pd.concat(frames, ignore_index=True)
+        status_names = np.array([STATUS_BY_CODE[code].value for code in sorted(STATUS_BY_CODE)])
+        df['status'] = status_names[df['status'].to_numpy(dtype=int)]
+        df['phase'] = np.array(self.phase_names, dtype=object)[df['phase'].to_numpy(dtype=int)]
+        df['timestamp'] = pd.to_datetime(df['timestamp'], unit='s')
+        return df.sort_values('timestamp', kind='stable', ignore_index=True)
+
+@dataclass
+class Incident:
+    service_name: str
+    started_at: float  # 장애 시작 (주입 시각을 알면 주입 시각, 모르면 첫 비정상 샘플), epoch 초
+    detected_at: float  # 첫 비정상 샘플 시각
+    recovered_at: Optional[float] = None  # 첫 정상 복귀 샘플 시각 (None이면 진행 중)
+    worst_status: ServiceStatus = ServiceStatus.DEGRADED
+    fault_injected: bool = False
+    
+    @property
+    def time_to_detect(self) -> Optional[float]:
+        """주입 시각부터 탐지까지 (초), 주입 시각을 모르면 None"""
+        return self.detected_at - self.started_at if self.fault_injected else None
+    
+    @property
+    def time_to_recover(self) -> Optional[float]:
+        return self.recovered_at - self.started_at if self.recovered_at is not None else None
+    
+    def downtime(self, now: float) -> float:
+        return (self.recovered_at if self.recovered_at is not None else now) - self.started_at
+
+class IncidentDetector:
+    """서비스별 HEALTHY → DEGRADED/FAILED 전환으로 장애를 탐지하고 MTTR/MTBF 등을 계산"""
+    
+    def __init__(self, slo_target: float = 0.995):
+        self.slo_target = slo_target
+        self.incidents: List[Incident] = []
+        # 서비스별 진행 중 장애, 관측 구간, 아직 탐지되지 않은 장애 주입 시각
+        self._open: Dict[str, Incident] = {}
+        self._first_seen: Dict[str, float] = {}
+        self._last_seen: Dict[str, float] = {}
+        self._pending_faults: Dict[str, float] = {}
+        self.fault_marks: List[tuple] = []
+    
+    def mark_fault(self, service_name: str, timestamp: float):
+        """장애 주입 시각 기록 (탐지 시간 계산 기준)"""
+        self._pending_faults[service_name] = timestamp
+        self.fault_marks.append((service_name, timestamp))
+    
+    def observe(self, service_name: str, timestamp: float, status_code: int) -> Optional[Incident]:
+        """샘플 1건 반영, 장애가 새로 열리거나 닫히면 해당 Incident 반환"""
+        self._first_seen.setdefault(service_name, timestamp)
+        self._last_seen[service_name] = timestamp
+        incident = self._open.get(service_name)
+        
+        if status_code != STATUS_CODES[ServiceStatus.HEALTHY]:
+            status = STATUS_BY_CODE[status_code]
+            if incident is None:
+                fault_at = self._pending_faults.pop(service_name, None)
+                incident = Incident(service_name, fault_at if fault_at is not None else timestamp,
+                                    timestamp, worst_status=status, fault_injected=fault_at is not None)
+                self._open[service_name] = incident
+                self.incidents.append(incident)
+                return incident
+            if status_code > STATUS_CODES[incident.worst_status]:
+                incident.worst_status = status
+            return None
+        
+        if incident is not None:
+            incident.recovered_at = timestamp
+            del self._open[service_name]
+            return incident
+        return None
+    
+    def observe_metric(self, metric: ServiceMetric) -> Optional[Incident]:
+        return self.observe(metric.service_name, (metric.timestamp - _EPOCH).total_seconds(),
+                            STATUS_CODES[metric.status])
+    
+    @classmethod
+    def from_store(cls, store: 'MetricsStore', fault_marks: Optional[List[tuple]] = None,
+                   slo_target: float = 0.995) -> 'IncidentDetector':
+        """저장된 지표 전체에서 장애를 일괄 탐지 (상태 전환 지점을 벡터 연산으로 찾음)"""
+        import numpy as np
+        
+        detector = cls(slo_target)
+        faults_by_service: Dict[str, List[float]] = {}
+        for service_name, timestamp in sorted(fault_marks or [], key=lambda mark: mark[1]):
+            faults_by_service.setdefault(service_name, []).append(timestamp)
+        
+        for service_name, service_store in store.services.items():
+            columns = service_store.columns('raw')
+            timestamps, codes = columns['timestamp'], columns['status'].astype(np.int8)
+            if len(timestamps) == 0:
+                continue
+            detector._first_seen[service_name] = float(timestamps[0])
+            detector._last_seen[service_name] = float(timestamps[-1])
+            
+            unhealthy = codes != STATUS_CODES[ServiceStatus.HEALTHY]
+            edges = np.diff(unhealthy.astype(np.int8), prepend=0, append=0)
+            starts = np.flatnonzero(edges == 1)
+            ends = np.flatnonzero(edges == -1)  # 첫 정상 복귀 샘플 인덱스 (끝까지 비정상이면 len)
+            if len(starts) == 0:
+                continue
+            worst = np.maximum.reduceat(codes, starts)
+            
+            faults = faults_by_service.get(service_name, [])
+            fault_index = 0
+            previous_end = -math.inf
+            for start, end, worst_code in zip(starts, ends, worst):
+                detected_at = float(timestamps[start])
+                # 직전 복구 이후, 탐지 이전에 주입된 가장 최근 장애를 이 장애의 시작으로 간주
+                fault_at = None
+                while fault_index < len(faults) and faults[fault_index] <= detected_at:
+                    if faults[fault_index] > previous_end:
+                        fault_at = faults[fault_index]
+                    fault_index += 1
+                incident = Incident(service_name, fault_at if fault_at is not None else detected_at, detected_at,
+                                    worst_status=STATUS_BY_CODE[int(worst_code)],
+                                    fault_injected=fault_at is not None)
+                if end < len(timestamps):
+                    incident.recovered_at = float(timestamps[end])
+                    previous_end = incident.recovered_at
+                else:
+                    detector._open[service_name] = incident
+                detector.incidents.append(incident)
+        
+        detector.incidents.sort(key=lambda incident: incident.started_at)
+        return detector
+    
+    def summary(self) -> Dict[str, Any]:
+        """MTTR, MTBF, 탐지 시간, 에러 버짓 소진율 계산 (장애가 없으면 해당 값은 None)"""
+        per_service = {}
+        total_uptime = total_downtime = total_budget = 0.0
+        for service_name, first_seen in self._first_seen.items():
+            now = self._last_seen[service_name]
+            observed = now - first_seen
+            incidents = [i for i in self.incidents if i.service_name == service_name]
+            downtime = min(observed, sum(i.downtime(now) for i in incidents))
+            budget = (1 - self.slo_target) * observed
+            total_uptime += observed - downtime
+            total_downtime += downtime
+            total_budget += budget
+            per_service[service_name] = {
+                'incidents': len(incidents),
+                'downtime_seconds': downtime,
+                'availability': 1 - downtime / observed if observed > 0 else 1.0,
+                'error_budget_burn': downtime / budget if budget > 0 else None,
+            }
+        
+        recover_times = [i.time_to_recover for i in self.incidents if i.time_to_recover is not None]
+        detect_times = [i.time_to_detect for i in self.incidents if i.time_to_detect is not None]
+        return {
+            'incident_count': len(self.incidents),
+            'open_incidents': len(self._open),
+            'mttr_minutes': sum(recover_times) / len(recover_times) / 60 if recover_times else None,
+            'mtbf_hours': total_uptime / len(self.incidents) / 3600 if self.incidents else None,
+            'mean_time_to_detect_seconds': sum(detect_times) / len(detect_times) if detect_times else None,
+            'downtime_minutes': total_downtime / 60,
+            'error_budget_burn': total_downtime / total_budget if total_budget > 0 else None,
+            'per_service': per_service,
+        }
+
+def format_optional(value: Optional[float], spec: str, unit: str = '') -> str:
+    """None이면 'N/A'로 표시"""
+    return f"{value:{spec}}{unit}" if value is not None else "N/A"
+
+def container_usage(stats: Dict[str, Any]) -> tuple:
+    """docker stats 응답에서 (CPU 사용률 %, 메모리 사용률 %) 계산"""
+    cpu_delta = stats['cpu_stats']['cpu_usage']['total_usage'] - \
+               stats['precpu_stats']['cpu_usage']['total_usage']
+    system_delta = stats['cpu_stats'].get('system_cpu_usage', 0) - \
+                  stats['precpu_stats'].get('system_cpu_usage', 0)
+    
+    if system_delta > 0:
+        cpu_usage = (cpu_delta / system_delta) * 100.0
+    else:
+        cpu_usage = 0.0
+    
+    memory_usage = (stats['memory_stats']['usage'] / stats['memory_stats']['limit']) * 100.0
+    return min(100.0, cpu_usage), min(100.0, memory_usage)
+
+class ContainerStatsCollector:
+    """컨테이너별 docker stats 스트림을 백그라운드 스레드로 구독해 최신 샘플만 보관"""
+    
+    def __init__(self, docker_client):
+        self.docker_client = docker_client
+        self._latest: Dict[str, tuple] = {}
+        self._threads: Dict[str, threading.Thread] = {}
+        self._stop = threading.Event()
+    
+    def _follow(self, name: str):
+        # 스트림은 약 1초마다 precpu가 포함된 샘플을 보내므로 별도 대기 없이 사용률 계산 가능
+        while not self._stop.is_set():
+            try:
+                container = self.docker_client.containers.get(name)
+                for stats in container.stats(stream=True, decode=True):
+                    if self._stop.is_set():
+                        return
+                    try:
+                        self._latest[name] = container_usage(stats)
+                    except (KeyError, ZeroDivisionError):
+                        pass
+            except Exception:
+                pass
+            # 컨테이너가 중지/재시작되면 스트림이 끊기므로 잠시 후 재구독
+            self._latest.pop(name, None)
+            self._stop.wait(2)
+    
+    def watch(self, name: str):
+        """컨테이너 구독 시작 (이미 구독 중이면 무시)"""
+        if name not in self._threads:
+            thread = threading.Thread(target=self._follow, args=(name,), daemon=True)
+            self._threads[name] = thread
+            thread.start()
+    
+    def latest(self, name: str) -> Optional[tuple]:
+        return self._latest.get(name)
+    
+    def stop(self):
+        self._stop.set()
+
+# 장애 유형별 기본 설정
+FAULT_PARAM_DEFAULTS: Dict[str, Dict[str, Any]] = {
+    # mode: auto(netem 실패 시 프록시), netem, proxy / 프록시는 TCP 세그먼트를 버릴 수 없어 손실을 재전송 지연으로 근사
+    'network': {'mode': 'auto', 'delay_ms': 100, 'jitter_ms': 20, 'loss_percent': 1.0, 'interface': 'eth0'},
+    'stress': {'cpu_workers': 2},
+    'memory': {'memory_mb': 256},
+    # overflow: reject(초과 연결 즉시 종료) 또는 queue(빈 자리가 날 때까지 대기)
+    'connections': {'max_connections': 4, 'overflow': 'reject'},
+}
+# 컨테이너 내부 장애 프로세스는 복구 단계가 실행되지 않아도 이 여유 시간 뒤 스스로 종료
+FAULT_SELF_EXPIRY_MARGIN = 30
+
+class FaultProxy:
+    """지연/지터/손실/연결 수 제한을 주입하는 로컬 TCP 프록시 (tc netem 대체용)"""
+    
+    def __init__(self, upstream_host: str, upstream_port: int, listen_host: str = '127.0.0.1',
+                 listen_port: int = 0, delay_ms: float = 0.0, jitter_ms: float = 0.0,
+                 loss_percent: float = 0.0, max_connections: Optional[int] = None,
+                 overflow: str = 'reject'):
+        self.upstream_host = upstream_host
+        self.upstream_port = upstream_port
+        self.listen_host = listen_host
+        self.listen_port = listen_port
+        self.delay_ms = delay_ms
+        self.jitter_ms = jitter_ms
+        self.loss_percent = loss_percent
+        self.max_connections = max_connections
+        self.overflow = overflow
+        self.active = 0
+        self.accepted = 0
+        self.rejected = 0
+        self._slots = asyncio.Semaphore(max_connections) if max_connections and overflow == 'queue' else None
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._writers: set = set()
+    
+    @property
+    def url(self) -> str:
+        return f"http://{self.listen_host}:{self.listen_port}"
+    
+    async def start(self) -> 'FaultProxy':
+        self._server = await asyncio.start_server(self._handle, self.listen_host, self.listen_port)
+        self.listen_port = self._server.sockets[0].getsockname()[1]
+        return self
+    
+    async def stop(self):
+        if self._server is not None:
+            self._server.close()
+            for writer in list(self._writers):
+                writer.close()
+            await self._server.wait_closed()
+            self._server = None
+    
+    def _chunk_delay(self) -> float:
+        """청크 1개 전달 전 대기 시간 (초)"""
+        delay = self.delay_ms + (random.uniform(-self.jitter_ms, self.jitter_ms) if self.jitter_ms else 0.0)
+        if self.loss_percent and random.random() * 100 < self.loss_percent:
+            # 손실된 세그먼트의 재전송을 최소 RTO(200ms) 지연으로 근사
+            delay += max(200.0, 2 * self.delay_ms)
+        return max(0.0, delay) / 1000
+    
+    async def _pipe(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter, inject: bool):
+        try:
+            while True:
+                chunk = await reader.read(65536)
+                if not chunk:
+                    break
+                delay = self._chunk_delay() if inject else 0.0
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                writer.write(chunk)
+                await writer.drain()
+        except (ConnectionError, asyncio.CancelledError):
+            pass
+        finally:
+            writer.close()
+    
+    async def _handle(self, client_reader: asyncio.StreamReader, client_writer: asyncio.StreamWriter):
+        if self.max_connections and self._slots is None and self.active >= self.max_connections:
+            # 연결 고갈 상황: 초과 연결은 즉시 끊음
+            self.rejected += 1
+            client_writer.close()
+            return
+        
+        if self._slots is not None:
+            await self._slots.acquire()
+        self.active += 1
+        self.accepted += 1
+        self._writers.add(client_writer)
+        try:
+            upstream_reader, upstream_writer = await asyncio.open_connection(self.upstream_host, self.upstream_port)
+            self._writers.add(upstream_writer)
+            # netem을 서비스 쪽 송신에 거는 것과 같도록 응답 방향에만 지연 주입
+            await asyncio.gather(self._pipe(client_reader, upstream_writer, inject=False),
+                                 self._pipe(upstream_reader, client_writer, inject=True))
+            self._writers.discard(upstream_writer)
+        except (ConnectionError, OSError):
+            client_writer.close()
+        finally:
+            self._writers.discard(client_writer)
+            self.active -= 1
+            if self._slots is not None:
+                self._slots.release()
+
+class FaultInjector:
+    """장애 주입기 기본 클래스 (apply로 주입, clear로 원상 복구)"""
+    
+    def __init__(self, simulator: 'HCMReliabilitySimulator', service_name: str,
+                 params: Dict[str, Any], duration_seconds: float):
+        self.simulator = simulator
+        self.service_name = service_name
+        self.params = params
+        # 컨테이너 내부 장애가 스스로 만료되는 시간 (초)
+        self.expiry_seconds = int(duration_seconds + FAULT_SELF_EXPIRY_MARGIN)
+    
+    async def apply(self):
+        raise NotImplementedError
+    
+    async def clear(self):
+        raise NotImplementedError
+    
+    async def _exec(self, command: str, detach: bool = False) -> tuple:
+        """컨테이너 안에서 셸 명령 실행 (exit code, 출력)"""
+        container = await self.simulator.get_container(self.service_name)
+        result = await asyncio.to_thread(container.exec_run, ['sh', '-c', command], detach=detach)
+        if detach:
+            return 0, b''
+        return result.exit_code, result.output or b''
+
+class ContainerStopInjector(FaultInjector):
+    """컨테이너 중지/재시작"""
+    
+    async def apply(self):
+        container = await self.simulator.get_container(self.service_name)
+        await asyncio.to_thread(container.stop)
+        print(f"   🛑 {self.service_name} 서비스 중지")
+    
+    async def clear(self):
+        container = await self.simulator.get_container(self.service_name)
+        await asyncio.to_thread(container.start)
+        # 컨테이너가 running이어도 앱은 아직 준비 전일 수 있으므로 준비 확인은 recover_from_fault에서 수행
+        print(f"   ✅ {self.service_name} 서비스 재시작")
+
+class NetemInjector(FaultInjector):
+    """tc netem으로 컨테이너 네트워크 네임스페이스에 지연/지터/패킷 손실 주입
+    
+    호스트에서 nsenter로 컨테이너 네임스페이스에 들어가 실행하고, 실패하면
+    컨테이너 안에서 직접 tc를 실행한다 (NET_ADMIN 권한과 iproute2 필요).
+    """
+    
+    def _tc_args(self, action: str) -> List[str]:
+        args = ['tc', 'qdisc', action, 'dev', self.params['interface'], 'root']
+        if action != 'del':
+            args += ['netem', 'delay', f"{self.params['delay_ms']}ms", f"{self.params['jitter_ms']}ms",
+                     'loss', f"{self.params['loss_percent']}%"]
+        return args
+    
+    async def _run_tc(self, action: str) -> bool:
+        container = await self.simulator.get_container(self.service_name)
+        pid = container.attrs.get('State', {}).get('Pid')
+        if pid:
+            try:
+                process = await asyncio.create_subprocess_exec(
+                    'nsenter', '-t', str(pid), '-n', *self._tc_args(action),
+                    stdout=asyncio.subprocess.DEVNULL, stderr=asyncio.subprocess.DEVNULL)
+                if await process.wait() == 0:
+                    return True
+            except OSError:
+                pass
+        exit_code, _ = await self._exec(' '.join(self._tc_args(action)))
+        return exit_code == 0
+    
+    async def apply(self):
+        if not await self._run_tc('replace'):
+            raise RuntimeError("tc netem 적용 실패 (호스트 root 권한 또는 컨테이너 NET_ADMIN/iproute2 필요)")
+        print(f"   🌐 {self.service_name} netem 적용: 지연 {self.params['delay_ms']}±{self.params['jitter_ms']}ms, "
+              f"손실 {self.params['loss_percent']}%")
+    
+    async def clear(self):
+        await self._run_tc('del')
+        print(f"   🌐 {self.service_name} netem 해제")
+
+class ProxyInjector(FaultInjector):
+    """서비스 앞에 FaultProxy를 두고 헬스 체크를 프록시 경유로 전환"""
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.proxy: Optional[FaultProxy] = None
+    
+    async def apply(self):
+        upstream = self.params.get('upstream') or self.simulator.service_address(self.service_name)
+        if upstream is None:
+            raise RuntimeError(f"{self.service_name}: 프록시 대상 주소를 알 수 없습니다 (params.upstream 지정 필요)")
+        host, port = upstream
+        self.proxy = await FaultProxy(
+            host, int(port), listen_port=int(self.params.get('listen_port', 0)),
+            delay_ms=self.params.get('delay_ms', 0.0), jitter_ms=self.params.get('jitter_ms', 0.0),
+            loss_percent=self.params.get('loss_percent', 0.0),
+            max_connections=self.params.get('max_connections'),
+            overflow=self.params.get('overflow', 'reject')
+        ).start()
+        self.simulator.endpoint_overrides[self.service_name] = self.proxy.url
+        print(f"   🔀 {self.service_name} 장애 프록시 시작: {self.proxy.url} → {host}:{port}")
+    
+    async def clear(self):
+        self.simulator.endpoint_overrides.pop(self.service_name, None)
+        if self.proxy is not None:
+            await self.proxy.stop()
+            print(f"   🔀 {self.service_name} 장애 프록시 종료 (수락 {self.proxy.accepted}, 거부 {self.proxy.rejected})")
+
+class CpuStressInjector(FaultInjector):
+    """컨테이너 안에서 CPU 부하 프로세스 실행 (stress-ng가 없으면 셸 busy loop)"""
+    
+    async def apply(self):
+        workers = int(self.params['cpu_workers'])
+        seconds = self.expiry_seconds
+        # 정리 시 pkill -f로 찾을 수 있도록 명령줄에 hcm-fault-cpu 표식을 남김
+        command = (
+            f"if command -v stress-ng >/dev/null 2>&1; then "
+            f"exec stress-ng --cpu {workers} --timeout {seconds}s --metrics-brief; fi; "
+            f"for i in $(seq {workers}); do timeout {seconds} sh -c ': hcm-fault-cpu; while :; do :; done' & done; wait"
+        )
+        await self._exec(command, detach=True)
+        print(f"   ⚡ {self.service_name} CPU 부하 적용: 워커 {workers}개 (최대 {seconds}초)")
+    
+    async def clear(self):
+        # [x] 패턴은 정리 명령 자신의 명령줄과는 일치하지 않음
+        await self._exec("pkill -f 'stress-[n]g --cpu'; pkill -f 'hcm-fault-[c]pu'; true")
+        print(f"   ⚡ {self.service_name} CPU 부하 해제")
+
+class MemoryStressInjector(FaultInjector):
+    """컨테이너 안에서 메모리 점유 (stress-ng가 없으면 /dev/shm tmpfs 파일로 점유)"""
+    
+    async def apply(self):
+        megabytes = int(self.params['memory_mb'])
+        seconds = self.expiry_seconds
+        command = (
+            f"if command -v stress-ng >/dev/null 2>&1; then "
+            f"exec stress-ng --vm 1 --vm-bytes {megabytes}M --vm-keep --timeout {seconds}s; fi; "
+            f"dd if=/dev/zero of=/dev/shm/hcm-fault-mem bs=1M count={megabytes} 2>/dev/null; "
+            f"sleep {seconds}; rm -f /dev/shm/hcm-fault-mem"
+        )
+        await self._exec(command, detach=True)
+        print(f"   🧠 {self.service_name} 메모리 점유 적용: {megabytes}MB (최대 {seconds}초)")
+    
+    async def clear(self):
+        await self._exec("pkill -f 'stress-[n]g --vm'; pkill -f 'hcm-fault-[m]em'; rm -f /dev/shm/hcm-fault-mem; true")
+        print(f"   🧠 {self.service_name} 메모리 점유 해제")
+
+def build_fault_injector(simulator: 'HCMReliabilitySimulator', scenario: FaultScenario,
+                         service_name: str) -> FaultInjector:
+    """장애 유형에 맞는 주입기 생성"""
+    params = {**FAULT_PARAM_DEFAULTS.get(scenario.fault_type, {}), **scenario.params}
+    args = (simulator, service_name, params, scenario.duration_minutes * 60)
+    if scenario.fault_type == 'stop':
+        return ContainerStopInjector(*args)
+    if scenario.fault_type == 'network':
+        return ProxyInjector(*args) if params['mode'] == 'proxy' else NetemInjector(*args)
+    if scenario.fault_type == 'stress':
+        return CpuStressInjector(*args)
+    if scenario.fault_type == 'memory':
+        return MemoryStressInjector(*args)
+    if scenario.fault_type == 'connections':
+        return ProxyInjector(*args)
+    raise ValueError(f"알 수 없는 장애 유형: {scenario.fault_type}")
+
+@dataclass
+class RecoveryRecord:
+    """장애 해제부터 서비스가 실제로 요청을 처리할 수 있게 되기까지의 기록"""
+    scenario: str
+    service_name: str
+    fault_type: str
+    started_at: datetime  # 장애 해제 시작 시각
+    time_to_ready: Optional[float] = None  # 초, 제한 시간 안에 준비되지 않으면 None
+    resolution: float = 0.0  # 마지막 실패 확인부터 성공까지의 간격 (측정 오차 상한, 초)
+    attempts: int = 0
+    last_error: str = ''
+
+# Postgres StartupMessage (프로토콜 3.0)
+_POSTGRES_STARTUP_PARAMS = b'user\x00postgres\x00database\x00postgres\x00\x00'
+_POSTGRES_STARTUP = struct.pack('!ii', len(_POSTGRES_STARTUP_PARAMS) + 8, 196608) + _POSTGRES_STARTUP_PARAMS
+# Bolt 핸드셰이크: 매직 넘버 + 제안 버전 4개 (5.0-5.4, 4.4, 4.3, 4.0)
+_BOLT_HANDSHAKE = struct.pack('!IIIII', 0x6060B017, 0x00040405, 0x00000404, 0x00000304, 0x00000004)
+
+async def infra_handshake(protocol: str, host: str, port: int, timeout: float) -> tuple:
+    """Redis/Postgres/Bolt 프로토콜 핸드셰이크로 준비 상태 확인 (준비 여부, 응답 요약)"""
+    payload = {'redis': b'PING\r\n', 'postgres': _POSTGRES_STARTUP, 'bolt': _BOLT_HANDSHAKE}[protocol]
+    reader, writer = await asyncio.wait_for(asyncio.open_connection(host, port), timeout)
+    try:
+        writer.write(payload)
+        await writer.drain()
+        reply = await asyncio.wait_for(reader.read(256), timeout)
+    finally:
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except OSError:
+            pass
+    
+    if not reply:
+        return False, '응답 없이 연결 종료'
+    if protocol == 'redis':
+        # 인증이 필요해도(-NOAUTH) 명령을 처리하는 상태, 데이터 로딩 중이면 -LOADING
+        line = reply.split(b'\r\n', 1)[0].decode('utf-8', 'replace')
+        return reply.startswith((b'+PONG', b'-NOAUTH')), line
+    if protocol == 'postgres':
+        # 'R'(인증 요청)이면 연결 수락, 에러 중 57P03(시작/복구 중)만 준비 전으로 판단
+        if reply[:1] == b'R':
+            return True, 'authentication request'
+        if reply[:1] == b'E':
+            return b'57P03' not in reply, 'starting up' if b'57P03' in reply else 'error response'
+        return False, f"unexpected message {reply[:1]!r}"
+    # Bolt: 서버가 고른 버전 (0이면 협상 실패)
+    if len(reply) < 4 or reply[:4] == b'\x00\x00\x00\x00':
+        return False, 'bolt version negotiation failed'
+    return True, f"bolt {reply[3]}.{reply[2]}"
+
+def build_probe_trace_config() -> aiohttp.TraceConfig:
+    """aiohttp 트레이스 훅으로 연결 생성 시각(perf_counter) 기록"""
+    trace_config = aiohttp.TraceConfig()
+    
+    def mark(name: str):
+        async def handler(session, trace_config_ctx, params):
+            timings = trace_config_ctx.trace_request_ctx
+            if timings is not None:
+                timings[name] = time.perf_counter()
+        return handler
+    
+    trace_config.on_connection_create_start.append(mark('connect_start'))
+    trace_config.on_connection_create_end.append(mark('connect_end'))
+    return trace_config
+
+@dataclass
+class ProbeState:
+    """서비스별 적응형 프로브 일정"""
+    service_name: str
+    interval: float  # 현재 프로브 간격 (초)
+    next_due: float = 0.0  # 다음 프로브 시각 (monotonic)
+    burst_until: float = 0.0  # 이 시각까지 burst 간격 유지
+    last_status: Optional[ServiceStatus] = None
+    recent: deque = field(default_factory=deque)  # 최근 60초 안의 프로브 시각 (예산 계산용)
+    in_flight: bool = False
 
 class HCMReliabilitySimulator:
     """HCM 시스템 안정성 시뮬레이터"""
     
-    def __init__(self, base_url: str = "http://localhost:3001"):
+    def __init__(self, base_url: str = "http://localhost:3001", probe_timeout: float = 5.0,
+                 monitor_interval: float = 30.0, raw_capacity: int = 3600,
+                 spill_dir: Optional[str] = None, burst_interval: float = 0.5,
+                 burst_seconds: float = 60.0, probe_budget: int = 120,
+                 readiness_timeout: float = 300.0):
         self.base_url = base_url
+        # 안정 상태의 (최대) 프로브 간격 (초)
+        self.monitor_interval = monitor_interval
+        # 상태 변화/장애 주입 직후에는 burst_seconds 동안 burst_interval 간격으로 촘촘히 측정한 뒤
+        # 간격을 두 배씩 늘려 monitor_interval로 복귀
+        self.burst_interval = burst_interval
+        self.burst_seconds = burst_seconds
+        # 서비스별 분당 최대 프로브 수
+        self.probe_budget = probe_budget
+        self.probe_states: Dict[str, ProbeState] = {}
+        self._probe_wakeup: Optional[asyncio.Event] = None
+        # 헬스 체크 1건의 최대 대기 시간 (초)
+        self.probe_timeout = probe_timeout
+        # 모든 헬스 체크가 공유하는 keep-alive 세션 (첫 프로브 때 생성)
+        self.session: Optional[aiohttp.ClientSession] = None
         self.docker_client = None
-        self.metrics_history: List[ServiceMetric] = []
+        # 서비스별 고정 크기 링 버퍼 (원본 1시간 + 1분/5분 롤업, 넘치면 spill_dir로 내보냄)
+        self.metrics_history = MetricsStore(raw_capacity=raw_capacity, spill_dir=spill_dir)
+        # 모니터링 중 실시간 장애 탐지
+        self.incident_detector = IncidentDetector()
+        # 주입 중인 장애 (시나리오 이름 → 주입기), 종료 시 모두 정리
+        self.active_faults: Dict[str, List[FaultInjector]] = {}
+        # 장애 프록시 경유 시 서비스별 헬스 체크 주소 대체
+        self.endpoint_overrides: Dict[str, str] = {}
+        # 장애 해제 후 준비 상태 폴링: 0.1초에서 시작해 두 배씩, 최대 1초 간격, readiness_timeout까지
+        self.readiness_timeout = readiness_timeout
+        self.readiness_initial_delay = 0.1
+        self.readiness_max_delay = 1.0
+        self.recovery_records: List[RecoveryRecord] = []
+        # OpenMetrics 노출용: 서비스별 최신 샘플과 (서비스, 상태)별 프로브 수
+        self.latest_metrics: Dict[str, ServiceMetric] = {}
+        self.probe_counts: Dict[tuple, int] = {}
+        # 현재 실험 단계 (모니터링 지표에 기록)
+        self.current_phase = ''
+        # 타임라인의 load 단계를 처리하는 객체 (apply(settings) 코루틴 제공, 없으면 load 단계 무시)
+        self.load_controller = None
         self.monitoring_active = False
         self.services = [
             'hcm-api-gateway', 'hcm-hr-resource', 'hcm-matching-engine',
@@ -60,50 +1029,96 @@ class HCMReliabilitySimulator:
             'neo4j', 'hcm-postgres'
         ]
         
+        self.stats_collector: Optional[ContainerStatsCollector] = None
+        
         try:
+            import docker
             self.docker_client = docker.from_env()
+            self.stats_collector = ContainerStatsCollector(self.docker_client)
         except Exception as e:
             print(f"⚠️ Docker 클라이언트 연결 실패: {e}")
     
+    def get_session(self) -> aiohttp.ClientSession:
+        """헬스 체크용 공유 세션 (서비스별 keep-alive 연결 유지)"""
+        if self.session is None or self.session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=len(self.services) * 2,
+                keepalive_timeout=120,  # 30초 모니터링 주기보다 길게 유지
+                ttl_dns_cache=300
+            )
+            self.session = aiohttp.ClientSession(connector=connector,
+                                                 trace_configs=[build_probe_trace_config()])
+        return self.session
+    
+    async def close(self):
+        """남은 장애, 공유 세션, docker stats 구독 정리"""
+        await self.clear_all_faults()
+        if self.session is not None and not self.session.closed:
+            await self.session.close()
+        self.session = None
+        if self.stats_collector is not None:
+            self.stats_collector.stop()
+    
+    def service_address(self, service_name: str) -> Optional[tuple]:
+        """HTTP 서비스의 (host, port), 인프라 서비스는 None"""
+        if service_name == 'hcm-api-gateway':
+            parsed = urlparse(self.base_url)
+            return parsed.hostname, parsed.port or (443 if parsed.scheme == 'https' else 80)
+        port = HTTP_SERVICE_PORTS.get(service_name)
+        return ('localhost', port) if port else None
+    
+    def health_endpoint(self, service_name: str) -> Optional[str]:
+        """HTTP 서비스의 /health 주소 (장애 프록시가 있으면 프록시 경유), 인프라 서비스는 None"""
+        if service_name in self.endpoint_overrides:
+            return f"{self.endpoint_overrides[service_name]}/health"
+        if service_name == 'hcm-api-gateway':
+            return f"{self.base_url}/health"
+        if service_name in HTTP_SERVICE_PORTS:
+            return f"http://localhost:{HTTP_SERVICE_PORTS[service_name]}/health"
+        return None
+    
+    async def get_container(self, service_name: str):
+        """컨테이너 조회 (docker SDK 호출은 이벤트 루프 밖 스레드에서 실행)"""
+        return await asyncio.to_thread(self.docker_client.containers.get, service_name)
+    
     async def check_service_health(self, service_name: str) -> ServiceMetric:
         """개별 서비스 헬스 체크"""
-        start_time = time.time()
+        timings: Dict[str, float] = {}
+        start_time = time.perf_counter()
         
         try:
-            # 서비스별 헬스체크 엔드포인트
-            if service_name == 'hcm-api-gateway':
-                endpoint = f"{self.base_url}/health"
-            elif service_name in ['hcm-hr-resource', 'hcm-matching-engine', 'hcm-verification', 'hcm-edge-agent']:
-                port = {
-                    'hcm-hr-resource': 3002,
-                    'hcm-matching-engine': 3003,
-                    'hcm-verification': 3004,
-                    'hcm-edge-agent': 3005
-                }[service_name]
-                endpoint = f"http://localhost:{port}/health"
-            else:
-                # 인프라 서비스는 Docker 상태로 확인
+            # 서비스별 헬스체크 엔드포인트, 인프라 서비스는 Docker 상태로 확인
+            endpoint = self.health_endpoint(service_name)
+            if endpoint is None:
                 return await self.check_infrastructure_service(service_name)
             
-            async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=10)) as session:
-                async with session.get(endpoint) as response:
-                    response_time = (time.time() - start_time) * 1000
-                    
-                    if response.status == 200:
-                        status = ServiceStatus.HEALTHY
-                        error_rate = 0.0
-                        availability = 1.0
-                    else:
-                        status = ServiceStatus.DEGRADED
-                        error_rate = 50.0
-                        availability = 0.5
+            async with self.get_session().get(endpoint,
+                                              timeout=aiohttp.ClientTimeout(total=self.probe_timeout),
+                                              trace_request_ctx=timings) as response:
+                # 본문까지 읽어야 연결이 풀로 반환되어 다음 프로브에서 재사용됨
+                await response.read()
+                response_time = (time.perf_counter() - start_time) * 1000
+                
+                if response.status == 200:
+                    status = ServiceStatus.HEALTHY
+                    error_rate = 0.0
+                    availability = 1.0
+                else:
+                    status = ServiceStatus.DEGRADED
+                    error_rate = 50.0
+                    availability = 0.5
         
         except Exception as e:
-            response_time = (time.time() - start_time) * 1000
+            response_time = (time.perf_counter() - start_time) * 1000
             status = ServiceStatus.FAILED
             error_rate = 100.0
             availability = 0.0
         
+        # 새 연결을 맺은 경우에만 연결 시간 기록
+        connect_time = 0.0
+        if 'connect_start' in timings and 'connect_end' in timings:
+            connect_time = (timings['connect_end'] - timings['connect_start']) * 1000
+        
         # Docker 컨테이너 리소스 사용량 가져오기
         cpu_usage, memory_usage = self.get_container_resources(service_name)
         
@@ -115,14 +1130,15 @@ class HCMReliabilitySimulator:
             cpu_usage=cpu_usage,
             memory_usage=memory_usage,
             error_rate=error_rate,
-            availability=availability
+            availability=availability,
+            connect_time=connect_time
         )
     
     async def check_infrastructure_service(self, service_name: str) -> ServiceMetric:
         """인프라 서비스 상태 확인"""
         try:
             if self.docker_client:
-                container = self.docker_client.containers.get(service_name)
+                container = await self.get_container(service_name)
                 
                 if container.status == 'running':
                     status = ServiceStatus.HEALTHY
@@ -162,364 +1178,493 @@ class HCMReliabilitySimulator:
                 availability=0.0
             )
     
-    def get_container_resources(self, service_name: str) -> tuple:
-        """컨테이너 리소스 사용량 조회"""
+    async def check_readiness(self, service_name: str) -> tuple:
+        """애플리케이션 준비 상태 확인 (HTTP는 /health 본문 검증, 인프라는 프로토콜 핸드셰이크)"""
+        if service_name in INFRA_SERVICE_PORTS:
+            protocol, port = INFRA_SERVICE_PORTS[service_name]
+            return await infra_handshake(protocol, 'localhost', port, self.probe_timeout)
+        
+        endpoint = self.health_endpoint(service_name)
+        if endpoint is None:
+            return False, '준비 상태 확인 방법 없음'
+        async with self.get_session().get(endpoint,
+                                          timeout=aiohttp.ClientTimeout(total=self.probe_timeout)) as response:
+            body = await response.read()
+        if response.status != 200:
+            return False, f"HTTP {response.status}"
         try:
-            if self.docker_client:
-                container = self.docker_client.containers.get(service_name)
-                stats = container.stats(stream=False)
-                
-                # CPU 사용률 계산
-                cpu_delta = stats['cpu_stats']['cpu_usage']['total_usage'] - \
-                           stats['precpu_stats']['cpu_usage']['total_usage']
-                system_delta = stats['cpu_stats']['system_cpu_usage'] - \
-                              stats['precpu_stats']['system_cpu_usage']
-                
-                if system_delta > 0:
-                    cpu_usage = (cpu_delta / system_delta) * 100.0
-                else:
-                    cpu_usage = 0.0
-                
-                # 메모리 사용률 계산
-                memory_usage = (stats['memory_stats']['usage'] / stats['memory_stats']['limit']) * 100.0
-                
-                return min(100.0, cpu_usage), min(100.0, memory_usage)
-            
-        except Exception as e:
-            pass
+            status = json.loads(body).get('status')
+        except (ValueError, AttributeError):
+            return False, '/health 응답이 JSON 객체가 아님'
+        return status == 'healthy', f"status={status}"
+    
+    async def wait_until_ready(self, scenario: FaultScenario, service_name: str,
+                               started: float) -> RecoveryRecord:
+        """지수 백오프로 준비 상태를 폴링해 장애 해제 시작(started, monotonic)부터 준비까지의 시간 기록"""
+        record = RecoveryRecord(scenario.name, service_name, scenario.fault_type,
+                                started_at=datetime.now() - timedelta(seconds=time.monotonic() - started))
+        delay = self.readiness_initial_delay
+        last_failure = started
+        while True:
+            record.attempts += 1
+            try:
+                ready, detail = await self.check_readiness(service_name)
+            except Exception as e:
+                ready, detail = False, str(e) or type(e).__name__
+            now = time.monotonic()
+            if ready:
+                record.time_to_ready = now - started
+                record.resolution = now - last_failure
+                return record
+            record.last_error = detail
+            last_failure = now
+            if now - started + delay > self.readiness_timeout:
+                return record
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, self.readiness_max_delay)
+    
+    def get_container_resources(self, service_name: str) -> tuple:
+        """컨테이너 리소스 사용량 조회 (구독 중인 stats 스트림의 최신 샘플, 블로킹 없음)"""
+        if self.stats_collector is not None:
+            self.stats_collector.watch(service_name)
+            usage = self.stats_collector.latest(service_name)
+            if usage is not None:
+                return usage
         
         return random.uniform(10, 30), random.uniform(20, 60)  # 랜덤 값으로 대체
     
-    async def continuous_monitoring(self, duration_minutes: int = 30):
-        """지속적 모니터링"""
-        print(f"🔍 {duration_minutes}분간 시스템 모니터링 시작...")
+    def trigger_burst(self, service_name: str):
+        """서비스를 즉시 burst 간격 샘플링으로 전환 (상태 변화, 장애 주입/복구 시)"""
+        state = self.probe_states.get(service_name)
+        if state is None:
+            return
+        now = time.monotonic()
+        state.interval = self.burst_interval
+        state.burst_until = now + self.burst_seconds
+        state.next_due = min(state.next_due, now)
+        if self._probe_wakeup is not None:
+            self._probe_wakeup.set()
+    
+    def _schedule_next(self, state: ProbeState, probed_at: float, status: ServiceStatus):
+        """프로브 결과에 따라 다음 프로브 시각 결정"""
+        now = time.monotonic()
+        if state.last_status is not None and status != state.last_status:
+            state.interval = self.burst_interval
+            state.burst_until = now + self.burst_seconds
+        elif now >= state.burst_until:
+            # 안정 상태가 이어지면 간격을 두 배씩 늘려 기본 간격으로 복귀 (backoff)
+            state.interval = min(self.monitor_interval, state.interval * 2)
+        state.last_status = status
+        state.next_due = probed_at + state.interval
+        
+        # 분당 프로브 예산을 넘으면 가장 오래된 프로브가 창을 벗어날 때까지 미룸
+        while state.recent and state.recent[0] <= now - 60:
+            state.recent.popleft()
+        if len(state.recent) >= self.probe_budget:
+            state.next_due = max(state.next_due, state.recent[0] + 60)
+    
+    def _record_metric(self, metric: ServiceMetric):
+        metric.phase = self.current_phase
+        self.metrics_history.append(metric)
+        self.latest_metrics[metric.service_name] = metric
+        key = (metric.service_name, metric.status.value)
+        self.probe_counts[key] = self.probe_counts.get(key, 0) + 1
+        
+        incident = self.incident_detector.observe_metric(metric)
+        if incident is None:
+            return
+        if incident.recovered_at is None:
+            detect = format_optional(incident.time_to_detect, '.1f', '초')
+            print(f"   🚨 장애 탐지: {incident.service_name} ({incident.worst_status.value}, 탐지 시간 {detect})")
+        else:
+            print(f"   🩹 장애 복구: {incident.service_name} (복구 시간 {incident.time_to_recover:.1f}초)")
+    
+    async def _probe(self, state: ProbeState):
+        probed_at = time.monotonic()
+        state.recent.append(probed_at)
+        try:
+            metric = await self.check_service_health(state.service_name)
+            self._record_metric(metric)
+            self._schedule_next(state, probed_at, metric.status)
+        finally:
+            state.in_flight = False
+            self._probe_wakeup.set()
+    
+    async def continuous_monitoring(self, duration_minutes: float = 30):
+        """지속적 모니터링 (서비스별 적응형 프로브 간격)"""
+        print(f"🔍 {duration_minutes:.1f}분간 시스템 모니터링 시작 "
+              f"(기본 {self.monitor_interval:g}초, 상태 변화 시 {self.burst_interval:g}초 간격)...")
         
         self.monitoring_active = True
-        end_time = datetime.now() + timedelta(minutes=duration_minutes)
+        self._probe_wakeup = asyncio.Event()
+        start = time.monotonic()
+        end = start + duration_minutes * 60
+        for service in self.services:
+            self.probe_states.setdefault(service, ProbeState(service, self.monitor_interval, next_due=start))
+        next_report = start + self.monitor_interval
+        probes: set = set()
         
-        while datetime.now() < end_time and self.monitoring_active:
-            # 모든 서비스 상태 확인
-            tasks = []
-            for service in self.services:
-                tasks.append(self.check_service_health(service))
-            
-            metrics = await asyncio.gather(*tasks)
-            self.metrics_history.extend(metrics)
-            
-            # 현재 상태 출력
-            healthy_count = sum(1 for m in metrics if m.status == ServiceStatus.HEALTHY)
-            print(f"⏰ {datetime.now().strftime('%H:%M:%S')} - 정상 서비스: {healthy_count}/{len(self.services)}")
-            
-            # 30초 대기
-            await asyncio.sleep(30)
+        try:
+            while self.monitoring_active:
+                now = time.monotonic()
+                if now >= end:
+                    break
+                
+                # 예정 시각이 된 서비스만 프로브 (서비스별로 한 번에 하나씩)
+                for state in self.probe_states.values():
+                    if not state.in_flight and state.next_due <= now:
+                        state.in_flight = True
+                        task = asyncio.create_task(self._probe(state))
+                        probes.add(task)
+                        task.add_done_callback(probes.discard)
+                
+                # 현재 상태 출력 (기본 간격마다)
+                if now >= next_report:
+                    healthy_count = sum(1 for state in self.probe_states.values()
+                                        if state.last_status == ServiceStatus.HEALTHY)
+                    bursting = sum(1 for state in self.probe_states.values() if state.interval < self.monitor_interval)
+                    print(f"⏰ {datetime.now().strftime('%H:%M:%S')} - 정상 서비스: {healthy_count}/{len(self.services)}"
+                          f" (집중 측정 {bursting}개)")
+                    next_report += self.monitor_interval
+                
+                # 다음 예정 프로브 또는 프로브 완료/burst 전환 시까지 대기
+                pending = [state.next_due for state in self.probe_states.values() if not state.in_flight]
+                wake_at = min(pending + [next_report, end])
+                self._probe_wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._probe_wakeup.wait(), max(0.0, wake_at - time.monotonic()))
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            for task in list(probes):
+                task.cancel()
+            await asyncio.gather(*probes, return_exceptions=True)
         
         print("✅ 모니터링 완료")
     
-    def inject_fault(self, scenario: FaultScenario):
+    async def inject_fault(self, scenario: FaultScenario):
         """장애 주입"""
         print(f"💥 장애 시나리오 실행: {scenario.name}")
         print(f"   설명: {scenario.description}")
         print(f"   대상: {', '.join(scenario.target_services)}")
         print(f"   지속시간: {scenario.duration_minutes}분")
         
-        try:
-            if self.docker_client:
-                for service_name in scenario.target_services:
-                    if scenario.fault_type == "stop":
-                        container = self.docker_client.containers.get(service_name)
-                        container.stop()
-                        print(f"   🛑 {service_name} 서비스 중지")
-                    
-                    elif scenario.fault_type == "stress":
-                        # CPU/메모리 스트레스 시뮬레이션 (실제로는 복잡한 작업 실행)
-                        print(f"   ⚡ {service_name} 서비스에 스트레스 부하 적용")
-                    
-                    elif scenario.fault_type == "network":
-                        # 네트워크 지연 시뮬레이션
-                        print(f"   🌐 {service_name} 서비스 네트워크 지연 적용")
+        # 탐지/복구 시간의 기준이 되는 주입 시각 기록
+        injected_at = (datetime.now() - _EPOCH).total_seconds()
+        for service_name in scenario.target_services:
+            self.incident_detector.mark_fault(service_name, injected_at)
+            self.trigger_burst(service_name)
         
-        except Exception as e:
-            print(f"   ❌ 장애 주입 실패: {e}")
+        applied = self.active_faults.setdefault(scenario.name, [])
+        for service_name in scenario.target_services:
+            injector = build_fault_injector(self, scenario, service_name)
+            # netem을 쓸 수 없으면(auto 모드) 로컬 TCP 프록시로 대체
+            fallback = isinstance(injector, NetemInjector) and injector.params['mode'] == 'auto'
+            if not self.docker_client and not isinstance(injector, ProxyInjector):
+                if not fallback:
+                    print(f"   ⚠️ Docker 없이 {scenario.fault_type} 장애를 주입할 수 없습니다: {service_name}")
+                    continue
+                injector, fallback = ProxyInjector(self, service_name, injector.params, injector.expiry_seconds), False
+            
+            # 주입 도중 중단되어도 정리되도록 먼저 등록
+            applied.append(injector)
+            try:
+                await injector.apply()
+            except Exception as e:
+                applied.remove(injector)
+                if not fallback:
+                    print(f"   ❌ 장애 주입 실패: {e}")
+                    continue
+                print(f"   ⚠️ {e} - 장애 프록시로 대체")
+                injector = ProxyInjector(self, service_name, injector.params, injector.expiry_seconds)
+                applied.append(injector)
+                try:
+                    await injector.apply()
+                except Exception as proxy_error:
+                    applied.remove(injector)
+                    print(f"   ❌ 장애 주입 실패: {proxy_error}")
     
-    def recover_from_fault(self, scenario: FaultScenario):
+    async def recover_from_fault(self, scenario: FaultScenario):
         """장애 복구"""
         print(f"🔧 장애 복구 시작: {scenario.name}")
+        for service_name in scenario.target_services:
+            self.trigger_burst(service_name)
         
-        try:
-            if self.docker_client:
-                for service_name in scenario.target_services:
-                    if scenario.fault_type == "stop":
-                        container = self.docker_client.containers.get(service_name)
-                        container.start()
-                        print(f"   ✅ {service_name} 서비스 재시작")
-                        
-                        # 서비스가 정상적으로 시작될 때까지 대기
-                        max_wait = 60  # 최대 60초 대기
-                        wait_time = 0
-                        while wait_time < max_wait:
-                            time.sleep(5)
-                            wait_time += 5
-                            try:
-                                container.reload()
-                                if container.status == 'running':
-                                    print(f"   🟢 {service_name} 서비스 정상 복구")
-                                    break
-                            except:
-                                pass
-                        else:
-                            print(f"   ⚠️ {service_name} 서비스 복구 시간 초과")
+        injectors_by_service: Dict[str, List[Any]] = {}
+        for injector in self.active_faults.pop(scenario.name, []):
+            injectors_by_service.setdefault(injector.service_name, []).append(injector)
         
-        except Exception as e:
-            print(f"   ❌ 장애 복구 실패: {e}")
+        async def recover_service(service_name: str) -> Optional[RecoveryRecord]:
+            # 서비스마다 자기 장애 해제 시작 시점부터 측정 (다른 서비스의 해제 시간이 섞이지 않도록 동시 실행)
+            started = time.monotonic()
+            for injector in injectors_by_service.get(service_name, []):
+                try:
+                    await injector.clear()
+                except Exception as e:
+                    print(f"   ❌ 장애 복구 실패 ({injector.service_name}): {e}")
+            if service_name not in scenario.target_services:
+                return None
+            # 컨테이너 running 여부가 아니라 애플리케이션이 실제로 요청을 받을 수 있을 때까지 대기
+            return await self.wait_until_ready(scenario, service_name, started)
+        
+        # 대상 목록에 없는 서비스에 걸린 장애도 함께 해제 (준비 대기는 하지 않음)
+        services = list(scenario.target_services) + [service_name for service_name in injectors_by_service
+                                                     if service_name not in scenario.target_services]
+        records = await asyncio.gather(*(recover_service(service_name) for service_name in services))
+        records = [record for record in records if record is not None]
+        for record in records:
+            self.recovery_records.append(record)
+            if record.time_to_ready is not None:
+                print(f"   🟢 {record.service_name} 준비 완료: {record.time_to_ready:.2f}초 "
+                      f"(±{record.resolution:.2f}초, 확인 {record.attempts}회)")
+            else:
+                print(f"   ⚠️ {record.service_name} 준비 시간 초과 ({self.readiness_timeout:.0f}초, "
+                      f"마지막 응답: {record.last_error})")
     
-    async def run_fault_tolerance_test(self):
+    async def clear_all_faults(self):
+        """남아 있는 모든 장애 정리 (중단/오류 시에도 원상 복구 보장)"""
+        for name in list(self.active_faults):
+            injectors = self.active_faults.pop(name)
+            if injectors:
+                print(f"🧹 남은 장애 정리: {name}")
+            for injector in injectors:
+                try:
+                    await injector.clear()
+                except Exception as e:
+                    print(f"   ❌ 장애 정리 실패 ({injector.service_name}): {e}")
+    
+    async def run_timeline(self, timeline: ExperimentTimeline):
+        """타임라인에 따라 장애 주입/복구/부하 단계를 실행 (실험 전체에 모니터 1개)"""
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        self.current_phase = 'baseline'
+        monitor = asyncio.create_task(self.continuous_monitoring(timeline.duration_seconds / 60))
+        # 주입/복구는 다음 단계 일정을 막지 않도록 별도 태스크로 실행 (장애가 겹칠 수 있음)
+        actions: List[asyncio.Task] = []
+        
+        try:
+            for step in timeline.steps:
+                await asyncio.sleep(max(0.0, started + step.at - loop.time()))
+                if step.phase:
+                    self.current_phase = step.phase
+                    print(f"\n🏷️ [{step.at:.0f}s] 단계: {step.phase}")
+                if step.load is not None:
+                    if self.load_controller is not None:
+                        actions.append(asyncio.create_task(self.load_controller.apply(step.load)))
+                    else:
+                        print("   ⚠️ 부하 컨트롤러가 없어 load 단계를 건너뜁니다")
+                if step.inject:
+                    actions.append(asyncio.create_task(self.inject_fault(timeline.faults[step.inject])))
+                if step.recover:
+                    actions.append(asyncio.create_task(self.recover_from_fault(timeline.faults[step.recover])))
+            
+            await asyncio.sleep(max(0.0, started + timeline.duration_seconds - loop.time()))
+            await asyncio.gather(*actions)
+        finally:
+            self.monitoring_active = False
+            monitor.cancel()
+            for action in actions:
+                action.cancel()
+            await asyncio.gather(monitor, *actions, return_exceptions=True)
+            await self.clear_all_faults()
+    
+    async def run_fault_tolerance_test(self, timeline: Optional[ExperimentTimeline] = None):
         """장애 허용성 테스트"""
         print("🧪 HCM 시스템 장애 허용성 테스트 시작...")
         
-        # 장애 시나리오 정의
-        fault_scenarios = [
-            FaultScenario(
-                name="단일 서비스 장애",
-                description="HR Resource 서비스 중지",
-                target_services=['hcm-hr-resource'],
-                fault_type="stop",
-                duration_minutes=3,
-                severity="minor"
-            ),
-            FaultScenario(
-                name="데이터베이스 장애",
-                description="Redis 캐시 서버 중지",
-                target_services=['hcm-redis'],
-                fault_type="stop",
-                duration_minutes=2,
-                severity="major"
-            ),
-            FaultScenario(
-                name="다중 서비스 장애",
-                description="매칭 엔진과 검증 서비스 동시 중지",
-                target_services=['hcm-matching-engine', 'hcm-verification'],
-                fault_type="stop",
-                duration_minutes=4,
-                severity="critical"
-            )
-        ]
+        # 장애 시나리오와 일정은 타임라인 파일에 정의
+        timeline = timeline or load_timeline(DEFAULT_TIMELINE_FILE)
+        print(f"📅 타임라인: {timeline.name} ({timeline.duration_seconds / 60:.1f}분, "
+              f"장애 {len(timeline.faults)}종, 단계 {len(timeline.steps)}개)")
         
-        # 각 시나리오 실행
-        for i, scenario in enumerate(fault_scenarios):
-            print(f"\n🎯 시나리오 {i+1}/{len(fault_scenarios)}: {scenario.name}")
-            
-            # 5분간 정상 상태 모니터링
-            print("📊 정상 상태 베이스라인 수집...")
-            monitoring_task = asyncio.create_task(self.continuous_monitoring(5))
-            await asyncio.sleep(300)  # 5분
-            self.monitoring_active = False
-            
-            # 장애 주입
-            self.inject_fault(scenario)
-            
-            # 장애 상태 모니터링
-            print(f"💥 장애 상태 모니터링 ({scenario.duration_minutes}분)...")
-            monitoring_task = asyncio.create_task(self.continuous_monitoring(scenario.duration_minutes))
-            await asyncio.sleep(scenario.duration_minutes * 60)
-            self.monitoring_active = False
-            
-            # 장애 복구
-            self.recover_from_fault(scenario)
-            
-            # 복구 후 모니터링
-            print("🔧 복구 상태 모니터링 (5분)...")
-            monitoring_task = asyncio.create_task(self.continuous_monitoring(5))
-            await asyncio.sleep(300)  # 5분
-            self.monitoring_active = False
-            
-            print(f"✅ 시나리오 {i+1} 완료\n")
+        await self.run_timeline(timeline)
+        print("✅ 타임라인 실행 완료\n")
     
     def calculate_reliability_metrics(self) -> Dict[str, Any]:
         """안정성 지표 계산"""
         if not self.metrics_history:
             return {}
         
-        df = pd.DataFrame([
-            {
-                'timestamp': m.timestamp,
-                'service_name': m.service_name,
-                'status': m.status.value,
-                'response_time': m.response_time,
-                'cpu_usage': m.cpu_usage,
-                'memory_usage': m.memory_usage,
-                'error_rate': m.error_rate,
-                'availability': m.availability
-            }
-            for m in self.metrics_history
-        ])
+        df = self.metrics_history.to_frame()
+        
+        # 프로브 간격이 일정하지 않으므로(상태 변화 시 집중 측정) 샘플마다 다음 샘플까지의 시간으로 가중
+        seconds = (df['timestamp'] - df['timestamp'].min()).dt.total_seconds()
+        df['weight'] = (seconds.groupby(df['service_name']).shift(-1) - seconds).fillna(self.monitor_interval).clip(lower=0)
+        
+        def time_weighted(frame, column: str) -> float:
+            total = frame['weight'].sum()
+            return (frame[column] * frame['weight']).sum() / total if total > 0 else frame[column].mean()
         
         metrics = {}
         
         # 전체 시스템 가용성
-        overall_availability = df['availability'].mean()
+        overall_availability = time_weighted(df, 'availability')
         
         # 서비스별 가용성
-        service_availability = df.groupby('service_name')['availability'].mean().to_dict()
+        service_availability = {service: time_weighted(group, 'availability')
+                                for service, group in df.groupby('service_name')}
         
         # 평균 응답시간
         avg_response_time = df[df['response_time'] > 0]['response_time'].mean()
         
+        # 새 연결이 필요했던 프로브 비율과 평균 연결 시간
+        new_connections = df[df['connect_time'] > 0]['connect_time']
+        avg_connect_time = new_connections.mean() if len(new_connections) else 0.0
+        
         # 시스템 안정성 점수 (SLA 기준)
         sla_target = 0.995  # 99.5% 가용성
         reliability_score = min(100, (overall_availability / sla_target) * 100)
         
-        # MTTR (Mean Time To Recovery) 시뮬레이션
-        mttr_minutes = 3.5  # 평균 복구 시간
+        # 실험 단계별 가용성/응답시간
+        phase_summary = {
+            phase: {
+                'availability': time_weighted(group, 'availability'),
+                'avg_response_time': group.loc[group['response_time'] > 0, 'response_time'].mean(),
+                'samples': len(group)
+            }
+            for phase, group in df.groupby('phase', sort=False)
+        }
+        
+        # 저장된 전체 이력에서 장애 탐지 후 MTTR/MTBF/에러 버짓 계산
+        incidents = IncidentDetector.from_store(self.metrics_history, self.incident_detector.fault_marks,
+                                                slo_target=sla_target).summary()
         
-        # MTBF (Mean Time Between Failures) 시뮬레이션
-        mtbf_hours = 720  # 평균 장애 간격 (30일)
+        # 장애 해제부터 애플리케이션 준비까지 걸린 시간 (용량 계획용 복구 시간)
+        ready_times = [r.time_to_ready for r in self.recovery_records if r.time_to_ready is not None]
         
         metrics = {
             'overall_availability': overall_availability,
             'service_availability': service_availability,
             'avg_response_time': avg_response_time,
+            'avg_connect_time': avg_connect_time,
+            'new_connection_ratio': len(new_connections) / len(df),
             'reliability_score': reliability_score,
-            'mttr_minutes': mttr_minutes,
-            'mtbf_hours': mtbf_hours,
+            'mttr_minutes': incidents['mttr_minutes'],
+            'mtbf_hours': incidents['mtbf_hours'],
+            'mean_time_to_detect_seconds': incidents['mean_time_to_detect_seconds'],
+            'incident_count': incidents['incident_count'],
+            'open_incidents': incidents['open_incidents'],
+            'downtime_minutes': incidents['downtime_minutes'],
+            'error_budget_burn': incidents['error_budget_burn'],
+            'service_incidents': incidents['per_service'],
+            'phase_summary': phase_summary,
+            'mean_time_to_ready_seconds': sum(ready_times) / len(ready_times) if ready_times else None,
+            'max_time_to_ready_seconds': max(ready_times) if ready_times else None,
+            'recovery_timeouts': len(self.recovery_records) - len(ready_times),
+            'recoveries': [asdict(record) for record in self.recovery_records],
             'total_measurements': len(df),
             'test_duration_hours': (df['timestamp'].max() - df['timestamp'].min()).total_seconds() / 3600
         }
         
         return metrics
     
-    def create_reliability_visualizations(self):
-        """안정성 시각화 생성"""
+    def create_reliability_visualizations(self, renderer, metrics: Optional[Dict[str, Any]] = None):
+        """안정성 시각화 예약 (renderer: hcm_reports.ReportRenderer, 렌더링은 백그라운드에서 진행)"""
         if not self.metrics_history:
             print("❌ 시각화할 데이터가 없습니다.")
             return
         
-        plt.rcParams['font.family'] = ['Malgun Gothic', 'DejaVu Sans']
-        plt.rcParams['axes.unicode_minus'] = False
-        
-        df = pd.DataFrame([
-            {
-                'timestamp': m.timestamp,
-                'service_name': m.service_name,
-                'status': m.status.value,
-                'response_time': m.response_time,
-                'cpu_usage': m.cpu_usage,
-                'memory_usage': m.memory_usage,
-                'availability': m.availability
-            }
-            for m in self.metrics_history
-        ])
-        
-        fig, axes = plt.subplots(3, 2, figsize=(20, 15))
-        fig.suptitle('HCM 시스템 안정성 분석', fontsize=16, fontweight='bold')
-        
-        # 1. 시간별 전체 시스템 가용성
-        time_availability = df.groupby(df['timestamp'].dt.floor('5min'))['availability'].mean()
-        axes[0, 0].plot(time_availability.index, time_availability.values, linewidth=2, color='blue')
-        axes[0, 0].set_title('시간별 시스템 가용성')
-        axes[0, 0].set_ylabel('가용성 (%)')
-        axes[0, 0].set_ylim(0, 1.05)
-        axes[0, 0].grid(True, alpha=0.3)
-        axes[0, 0].axhline(y=0.995, color='red', linestyle='--', alpha=0.7, label='SLA 목표 (99.5%)')
-        axes[0, 0].legend()
-        
-        # 2. 서비스별 가용성
-        service_availability = df.groupby('service_name')['availability'].mean()
-        bars = axes[0, 1].bar(range(len(service_availability)), service_availability.values, 
-                             color=['red' if x < 0.99 else 'orange' if x < 0.995 else 'green' 
-                                   for x in service_availability.values], alpha=0.7)
-        axes[0, 1].set_title('서비스별 평균 가용성')
-        axes[0, 1].set_ylabel('가용성')
-        axes[0, 1].set_xticks(range(len(service_availability)))
-        axes[0, 1].set_xticklabels([s.replace('hcm-', '') for s in service_availability.index], 
-                                  rotation=45, ha='right')
-        axes[0, 1].axhline(y=0.995, color='red', linestyle='--', alpha=0.7)
-        axes[0, 1].set_ylim(0, 1.05)
-        
-        # 3. 응답시간 분포
-        response_times = df[df['response_time'] > 0]['response_time']
-        if len(response_times) > 0:
-            axes[1, 0].hist(response_times, bins=30, alpha=0.7, color='skyblue', edgecolor='black')
-            axes[1, 0].set_title('응답시간 분포')
-            axes[1, 0].set_xlabel('응답시간 (ms)')
-            axes[1, 0].set_ylabel('빈도')
-            axes[1, 0].axvline(response_times.mean(), color='red', linestyle='--', 
-                              label=f'평균: {response_times.mean():.1f}ms')
-            axes[1, 0].legend()
-        
-        # 4. 리소스 사용률
-        avg_cpu = df.groupby('service_name')['cpu_usage'].mean()
-        avg_memory = df.groupby('service_name')['memory_usage'].mean()
-        
-        x = np.arange(len(avg_cpu))
-        width = 0.35
-        
-        axes[1, 1].bar(x - width/2, avg_cpu.values, width, label='CPU 사용률', alpha=0.7, color='orange')
-        axes[1, 1].bar(x + width/2, avg_memory.values, width, label='메모리 사용률', alpha=0.7, color='purple')
-        axes[1, 1].set_title('서비스별 평균 리소스 사용률')
-        axes[1, 1].set_ylabel('사용률 (%)')
-        axes[1, 1].set_xticks(x)
-        axes[1, 1].set_xticklabels([s.replace('hcm-', '') for s in avg_cpu.index], 
-                                  rotation=45, ha='right')
-        axes[1, 1].legend()
-        
-        # 5. 서비스 상태 분포
-        status_counts = df['status'].value_counts()
-        colors = {'healthy': 'green', 'degraded': 'orange', 'failed': 'red', 'recovering': 'blue'}
-        pie_colors = [colors.get(status, 'gray') for status in status_counts.index]
-        
-        axes[2, 0].pie(status_counts.values, labels=status_counts.index, autopct='%1.1f%%',
-                      colors=pie_colors, startangle=90)
-        axes[2, 0].set_title('전체 측정 기간 서비스 상태 분포')
-        
-        # 6. 안정성 지표 요약
-        metrics = self.calculate_reliability_metrics()
-        
-        metric_names = ['전체 가용성', '평균 응답시간', '안정성 점수', 'MTTR', 'MTBF']
-        metric_values = [
-            f"{metrics.get('overall_availability', 0)*100:.2f}%",
-            f"{metrics.get('avg_response_time', 0):.1f}ms",
-            f"{metrics.get('reliability_score', 0):.1f}/100",
-            f"{metrics.get('mttr_minutes', 0):.1f}분",
-            f"{metrics.get('mtbf_hours', 0):.0f}시간"
-        ]
-        
-        axes[2, 1].axis('off')
-        table_data = list(zip(metric_names, metric_values))
-        table = axes[2, 1].table(cellText=table_data, colLabels=['지표', '값'],
-                                cellLoc='center', loc='center')
-        table.auto_set_font_size(False)
-        table.set_fontsize(12)
-        table.scale(1.2, 1.5)
-        axes[2, 1].set_title('안정성 지표 요약')
+        hcm_reports = load_shared_module('hcm_reports')
+        # 디스크로 내보낸 구간이 있을 만큼 긴 실행은 5분 롤업으로 그림
+        resolution = '5min' if self.metrics_history.spilled else 'raw'
+        columns, service_names = self.metrics_history.to_columns(resolution)
         
-        plt.tight_layout()
-        
-        # 저장
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        plot_file = f"./test-results/reliability_analysis_{timestamp}.png"
-        plt.savefig(plot_file, dpi=300, bbox_inches='tight')
-        plt.show()
-        
-        print(f"📊 안정성 분석 저장: {plot_file}")
-        
-        return metrics
+        renderer.submit(hcm_reports.ReportFigure(
+            'reliability', columns, f"./test-results/reliability_analysis_{timestamp}.png",
+            labels={'service': service_names,
+                    'status': [STATUS_BY_CODE[code].value for code in sorted(STATUS_BY_CODE)]},
+            summary=metrics if metrics is not None else self.calculate_reliability_metrics()
+        ))
 
-async def run_reliability_simulation():
+def reliability_metric_families(simulator: HCMReliabilitySimulator) -> list:
+    """서비스별 가용성/상태/컨테이너 리소스 게이지와 프로브/장애 카운터 (스크랩 시점에 계산)"""
+    hcm_openmetrics = load_shared_module('hcm_openmetrics')
+    latest = simulator.latest_metrics.values()
+    families = [
+        hcm_openmetrics.counter('hcm_service_probes', '상태별 헬스 체크 수',
+                                [({'service': service, 'status': status}, count)
+                                 for (service, status), count in simulator.probe_counts.items()]),
+        hcm_openmetrics.gauge('hcm_service_availability', '최근 헬스 체크의 가용성 (0-1)',
+                              [({'service': metric.service_name}, metric.availability) for metric in latest]),
+        hcm_openmetrics.gauge('hcm_service_response_time_seconds', '최근 헬스 체크 응답시간',
+                              [({'service': metric.service_name}, metric.response_time / 1000) for metric in latest]),
+        hcm_openmetrics.gauge('hcm_service_probe_interval_seconds', '현재 적응형 프로브 간격',
+                              [({'service': name}, state.interval) for name, state in simulator.probe_states.items()]),
+    ]
+    
+    # 컨테이너 리소스는 docker stats 구독 값이 있을 때만 노출 (대체 난수는 제외)
+    usage = []
+    if simulator.stats_collector is not None:
+        usage = [(name, simulator.stats_collector.latest(name)) for name in simulator.services]
+    families.append(hcm_openmetrics.gauge('hcm_container_cpu_percent', '컨테이너 CPU 사용률',
+                                          [({'service': name}, value[0]) for name, value in usage if value]))
+    families.append(hcm_openmetrics.gauge('hcm_container_memory_percent', '컨테이너 메모리 사용률',
+                                          [({'service': name}, value[1]) for name, value in usage if value]))
+    
+    incidents: Dict[str, int] = {}
+    for incident in simulator.incident_detector.incidents:
+        incidents[incident.service_name] = incidents.get(incident.service_name, 0) + 1
+    ready = {record.service_name: record.time_to_ready for record in simulator.recovery_records
+             if record.time_to_ready is not None}
+    families += [
+        hcm_openmetrics.counter('hcm_service_incidents', '탐지된 장애 수',
+                                [({'service': name}, count) for name, count in incidents.items()]),
+        hcm_openmetrics.gauge('hcm_service_time_to_ready_seconds', '최근 장애 해제 후 준비 완료까지 걸린 시간',
+                              [({'service': name}, seconds) for name, seconds in ready.items()]),
+        hcm_openmetrics.gauge('hcm_active_faults', '주입 중인 장애 수',
+                              [({}, sum(len(injectors) for injectors in simulator.active_faults.values()))]),
+        hcm_openmetrics.gauge('hcm_experiment_phase', '현재 실험 단계 (값은 항상 1)',
+                              [({'phase': simulator.current_phase or '-'}, 1)]),
+    ]
+    return families
+
+async def run_reliability_simulation(base_url: str = "http://localhost:3001",
+                                     timeline_file: str = DEFAULT_TIMELINE_FILE,
+                                     monitor_interval: Optional[float] = None,
+                                     burst_interval: float = 0.5,
+                                     probe_budget: int = 120,
+                                     raw_capacity: int = 3600,
+                                     readiness_timeout: float = 300.0,
+                                     assume_yes: bool = False,
+                                     plots: bool = True,
+                                     show_plots: bool = True,
+                                     quick_report: bool = False,
+                                     html_report: bool = False,
+                                     metrics_port: Optional[int] = None,
+                                     metrics_host: str = '127.0.0.1'):
     """안정성 시뮬레이션 실행"""
-    simulator = HCMReliabilitySimulator()
+    timeline = load_timeline(timeline_file)
+    # 샘플링 간격: CLI 지정값 > 타임라인 설정 > 30초
+    monitor_interval = monitor_interval or timeline.monitor_interval or 30.0
+    spill_dir = f"./test-results/reliability_spill_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+    simulator = HCMReliabilitySimulator(base_url, monitor_interval=monitor_interval,
+                                        raw_capacity=raw_capacity, spill_dir=spill_dir,
+                                        burst_interval=burst_interval, probe_budget=probe_budget,
+                                        readiness_timeout=readiness_timeout)
     
     print("🔬 HCM 시스템 안정성 시뮬레이션을 시작합니다...")
     print("⚠️  주의: 이 테스트는 실제 서비스를 중지/재시작합니다!")
     print("    프로덕션 환경에서는 실행하지 마세요.")
     
     # 사용자 확인
-    response = input("\n계속하시겠습니까? (y/N): ")
+    response = 'y' if assume_yes else input("\n계속하시겠습니까? (y/N): ")
     if response.lower() != 'y':
         print("시뮬레이션이 취소되었습니다.")
         return
     
-    # 장애 허용성 테스트 실행
-    await simulator.run_fault_tolerance_test()
+    # 장애 허용성 테스트 실행 (metrics_port가 있으면 실행 중 /metrics로 실시간 지표 노출)
+    exporter = None
+    try:
+        if metrics_port is not None:
+            exporter = load_shared_module('hcm_openmetrics').OpenMetricsExporter(metrics_port, metrics_host)
+            exporter.register(lambda: reliability_metric_families(simulator))
+            await exporter.start()
+        await simulator.run_fault_tolerance_test(timeline)
+    finally:
+        if exporter is not None:
+            await exporter.stop()
+        await simulator.close()
     
     # 결과 분석
     print("\n📊 안정성 분석 결과:")
@@ -529,9 +1674,32 @@ async def run_reliability_simulation():
     
     print(f"전체 시스템 가용성: {metrics.get('overall_availability', 0)*100:.3f}%")
     print(f"평균 응답시간: {metrics.get('avg_response_time', 0):.1f}ms")
+    print(f"평균 연결 시간: {metrics.get('avg_connect_time', 0):.1f}ms "
+          f"(새 연결 비율 {metrics.get('new_connection_ratio', 0):.1%})")
     print(f"안정성 점수: {metrics.get('reliability_score', 0):.1f}/100")
-    print(f"평균 복구 시간 (MTTR): {metrics.get('mttr_minutes', 0):.1f}분")
-    print(f"평균 장애 간격 (MTBF): {metrics.get('mtbf_hours', 0):.0f}시간")
+    print(f"탐지된 장애: {metrics.get('incident_count', 0)}건 (진행 중 {metrics.get('open_incidents', 0)}건)")
+    print(f"평균 탐지 시간 (MTTD): {format_optional(metrics.get('mean_time_to_detect_seconds'), '.1f', '초')}")
+    print(f"평균 복구 시간 (MTTR): {format_optional(metrics.get('mttr_minutes'), '.1f', '분')}")
+    print(f"평균 장애 간격 (MTBF): {format_optional(metrics.get('mtbf_hours'), '.1f', '시간')}")
+    burn = metrics.get('error_budget_burn')
+    print(f"에러 버짓 소진율: {format_optional(burn * 100 if burn is not None else None, '.1f', '%')} "
+          f"(다운타임 {metrics.get('downtime_minutes', 0):.1f}분)")
+    
+    # 장애 해제 후 준비 완료까지의 시간
+    if metrics.get('recoveries'):
+        print(f"\n🔧 복구 준비 시간: 평균 {format_optional(metrics.get('mean_time_to_ready_seconds'), '.2f', '초')}, "
+              f"최대 {format_optional(metrics.get('max_time_to_ready_seconds'), '.2f', '초')} "
+              f"(시간 초과 {metrics['recovery_timeouts']}건)")
+        for record in metrics['recoveries']:
+            print(f"  {record['scenario']} / {record['service_name']}: "
+                  f"{format_optional(record['time_to_ready'], '.2f', '초')} (확인 {record['attempts']}회)")
+    
+    # 단계별 가용성
+    if metrics.get('phase_summary'):
+        print("\n🏷️ 단계별 가용성:")
+        for phase, summary in metrics['phase_summary'].items():
+            print(f"  {phase or '-'}: {summary['availability']*100:.2f}% "
+                  f"(응답시간 {summary['avg_response_time']:.1f}ms, 샘플 {summary['samples']})")
     
     # 서비스별 가용성
     print("\n📋 서비스별 가용성:")
@@ -539,26 +1707,18 @@ async def run_reliability_simulation():
         status = "🟢" if availability > 0.995 else "🟡" if availability > 0.99 else "🔴"
         print(f"  {status} {service}: {availability*100:.2f}%")
     
-    # 시각화 생성
-    simulator.create_reliability_visualizations()
+    # 시각화는 백그라운드에서 렌더링하고 그동안 결과 파일 저장
+    hcm_reports = load_shared_module('hcm_reports')
+    renderer = hcm_reports.ReportRenderer(hcm_reports.ReportOptions(show=show_plots, quick=quick_report,
+                                                                    html=html_report))
+    if plots:
+        simulator.create_reliability_visualizations(renderer, metrics)
     
     # 결과 저장
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     
     # 메트릭 데이터 저장
-    metrics_df = pd.DataFrame([
-        {
-            'timestamp': m.timestamp,
-            'service_name': m.service_name,
-            'status': m.status.value,
-            'response_time': m.response_time,
-            'cpu_usage': m.cpu_usage,
-            'memory_usage': m.memory_usage,
-            'error_rate': m.error_rate,
-            'availability': m.availability
-        }
-        for m in simulator.metrics_history
-    ])
+    metrics_df = simulator.metrics_history.to_frame()
     
     metrics_file = f"./test-results/reliability_metrics_{timestamp}.csv"
     metrics_df.to_csv(metrics_file, index=False, encoding='utf-8-sig')
@@ -568,6 +1728,9 @@ async def run_reliability_simulation():
     with open(summary_file, 'w', encoding='utf-8') as f:
         json.dump(metrics, f, indent=2, ensure_ascii=False, default=str)
     
+    renderer.finish('HCM 시스템 안정성 분석', html_file=f"./test-results/reliability_report_{timestamp}.html",
+                    summary=metrics)
+    
     print(f"\n✅ 결과 저장:")
     print(f"   메트릭 데이터: {metrics_file}")
     print(f"   요약 보고서: {summary_file}")
@@ -575,13 +1738,50 @@ async def run_reliability_simulation():
     return simulator.metrics_history
 
 if __name__ == "__main__":
-    import os
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="HCM 시스템 안정성 및 장애 복구 시뮬레이션")
+    parser.add_argument("--base-url", default="http://localhost:3001", help="API 게이트웨이 주소")
+    parser.add_argument("--timeline", default=DEFAULT_TIMELINE_FILE,
+                        help="장애 주입 타임라인 파일 (JSON/YAML)")
+    parser.add_argument("--interval", type=float,
+                        help="모니터링 샘플링 간격 (초, 기본값은 타임라인 설정 또는 30초)")
+    parser.add_argument("--burst-interval", type=float, default=0.5,
+                        help="상태 변화/장애 주입 직후의 집중 프로브 간격 (초)")
+    parser.add_argument("--probe-budget", type=int, default=120, help="서비스별 분당 최대 프로브 수")
+    parser.add_argument("--raw-capacity", type=int, default=3600,
+                        help="서비스별 메모리에 보관할 원본 샘플 수 (넘치면 디스크로 내보냄)")
+    parser.add_argument("--ready-timeout", type=float, default=300.0,
+                        help="장애 해제 후 서비스 준비 완료를 기다리는 최대 시간 (초)")
+    parser.add_argument("--metrics-port", type=int,
+                        help="실행 중 OpenMetrics(/metrics) 엔드포인트를 열 포트 (기본: 사용 안 함)")
+    parser.add_argument("--metrics-host", default="127.0.0.1", help="OpenMetrics 엔드포인트 바인드 주소")
+    parser.add_argument("--yes", "-y", action="store_true", help="확인 입력 없이 바로 실행")
+    parser.add_argument("--non-interactive", action="store_true",
+                        help="확인 입력 없이 실행하고 그래프는 화면 출력 없이 파일로만 저장 (CI용)")
+    parser.add_argument("--no-plots", action="store_true", help="그래프 생성 생략")
+    parser.add_argument("--quick-report", action="store_true", help="그래프를 낮은 해상도로 빠르게 렌더링")
+    parser.add_argument("--html-report", action="store_true", help="그래프와 요약을 담은 HTML 보고서 생성")
+    args = parser.parse_args()
     
     # 결과 디렉토리 생성
     os.makedirs("./test-results", exist_ok=True)
     
     try:
-        asyncio.run(run_reliability_simulation())
+        asyncio.run(run_reliability_simulation(args.base_url,
+                                               timeline_file=args.timeline,
+                                               monitor_interval=args.interval,
+                                               burst_interval=args.burst_interval,
+                                               probe_budget=args.probe_budget,
+                                               raw_capacity=args.raw_capacity,
+                                               readiness_timeout=args.ready_timeout,
+                                               assume_yes=args.yes or args.non_interactive,
+                                               plots=not args.no_plots,
+                                               show_plots=not args.non_interactive,
+                                               quick_report=args.quick_report,
+                                               html_report=args.html_report,
+                                               metrics_port=args.metrics_port,
+                                               metrics_host=args.metrics_host))
         print("\n🎉 안정성 시뮬레이션 완료!")
     except KeyboardInterrupt:
         print("\n⏹️ 사용자에 의해 중단되었습니다.")
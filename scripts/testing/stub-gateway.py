@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+HCM API 게이트웨이 로컬 스텁 서버
+Local stand-in for the HCM API gateway used for hermetic benchmark self-tests
+
+docker 스택 없이 /health, /services, /analytics/overview,
+/workflows/employee-onboarding 를 흉내내며, 엔드포인트별 응답 지연 분포,
+에러 주입, 응답 크기를 설정할 수 있다.
+
+사용 예:
+    python stub-gateway.py --port 3001
+    python stub-gateway.py --config stub.json
+    python stub-gateway.py --latency /health=fixed:10 --error-rate /services=0.05
+
+설정 파일(JSON) 형식:
+    {
+      "/health": {"latency": {"dist": "lognormal", "median_ms": 2, "sigma": 0.4}},
+      "/analytics/overview": {"latency": {"dist": "uniform", "min_ms": 10, "max_ms": 40},
+                              "error_rate": 0.01, "error_status": 503, "payload_bytes": 8192}
+    }
+"""
+
+import asyncio
+import argparse
+import json
+import math
+import random
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, Any, Callable, Optional
+
+from aiohttp import web
+
+@dataclass
+class EndpointProfile:
+    method: str
+    status: int = 200
+    latency: Dict[str, Any] = field(default_factory=lambda: {'dist': 'fixed', 'ms': 0})
+    error_rate: float = 0.0  # 0-1
+    error_status: int = 500
+    payload_bytes: int = 0  # 0이면 기본 응답 본문 크기 그대로
+
+# 실제 게이트웨이 특성을 대략 반영한 기본 프로파일
+DEFAULT_PROFILES: Dict[str, EndpointProfile] = {
+    '/health': EndpointProfile(
+        method='GET', latency={'dist': 'lognormal', 'median_ms': 2, 'sigma': 0.4}
+    ),
+    '/services': EndpointProfile(
+        method='GET', latency={'dist': 'lognormal', 'median_ms': 3, 'sigma': 0.4}
+    ),
+    '/analytics/overview': EndpointProfile(
+        # 하위 서비스로 fan-out 하므로 느리고 편차가 큼
+        method='GET', latency={'dist': 'lognormal', 'median_ms': 25, 'sigma': 0.6}
+    ),
+    '/workflows/employee-onboarding': EndpointProfile(
+        method='POST', status=201, latency={'dist': 'lognormal', 'median_ms': 60, 'sigma': 0.5}
+    ),
+}
+
+_SERVICES = [
+    {'name': name, 'url': f'http://localhost:{port}', 'health': '/health', 'version': '1.0.0', 'status': 'healthy'}
+    for name, port in [('hr-resource', 3002), ('matching-engine', 3003),
+                       ('verification', 3004), ('edge-agent', 3005)]
+]
+
+def parse_latency_spec(spec: str) -> Dict[str, Any]:
+    """'fixed:10', 'uniform:5:20', 'normal:20:5', 'exponential:15', 'lognormal:20:0.5' 파싱"""
+    name, *args = spec.split(':')
+    values = [float(v) for v in args]
+    if name == 'fixed':
+        return {'dist': 'fixed', 'ms': values[0]}
+    if name == 'uniform':
+        return {'dist': 'uniform', 'min_ms': values[0], 'max_ms': values[1]}
+    if name == 'normal':
+        return {'dist': 'normal', 'mean_ms': values[0], 'std_ms': values[1]}
+    if name == 'exponential':
+        return {'dist': 'exponential', 'mean_ms': values[0]}
+    if name == 'lognormal':
+        return {'dist': 'lognormal', 'median_ms': values[0], 'sigma': values[1]}
+    raise ValueError(f"알 수 없는 지연 분포: {spec}")
+
+def latency_sampler(spec: Dict[str, Any]) -> Callable[[], float]:
+    """지연 분포 설정을 ms 단위 샘플러로 변환"""
+    dist = spec.get('dist', 'fixed')
+    if dist == 'fixed':
+        return lambda: float(spec.get('ms', 0))
+    if dist == 'uniform':
+        return lambda: random.uniform(spec['min_ms'], spec['max_ms'])
+    if dist == 'normal':
+        return lambda: max(0.0, random.gauss(spec['mean_ms'], spec['std_ms']))
+    if dist == 'exponential':
+        return lambda: random.expovariate(1.0 / spec['mean_ms']) if spec['mean_ms'] > 0 else 0.0
+    if dist == 'lognormal':
+        mu = math.log(spec['median_ms']) if spec['median_ms'] > 0 else 0.0
+        return lambda: random.lognormvariate(mu, spec['sigma']) if spec['median_ms'] > 0 else 0.0
+    raise ValueError(f"알 수 없는 지연 분포: {dist}")
+
+class StubGateway:
+    """HCM 게이트웨이 스텁"""
+
+    def __init__(self, profiles: Optional[Dict[str, EndpointProfile]] = None):
+        self.profiles = profiles or {path: EndpointProfile(**vars(p)) for path, p in DEFAULT_PROFILES.items()}
+        self.started_at = time.time()
+        self.stats: Dict[str, Dict[str, float]] = {
+            path: {'requests': 0, 'errors': 0, 'injected_latency_ms': 0.0}
+            for path in self.profiles
+        }
+        self._samplers = {path: latency_sampler(p.latency) for path, p in self.profiles.items()}
+        # 응답 본문은 미리 직렬화 (요청마다 JSON 인코딩하지 않음)
+        self._bodies = {path: self._build_body(path, p) for path, p in self.profiles.items()}
+
+    def _build_body(self, path: str, profile: EndpointProfile) -> bytes:
+        if path == '/health':
+            body = {'status': 'healthy', 'gateway': {'version': '1.0.0', 'stub': True},
+                    'services': {'total': len(_SERVICES), 'healthy': len(_SERVICES), 'unhealthy': 0}}
+        elif path == '/services':
+            body = {'services': _SERVICES}
+        elif path == '/analytics/overview':
+            body = {'services': {'total': len(_SERVICES), 'healthy': len(_SERVICES), 'unhealthy': 0},
+                    'matching': {'totalMatches': 0}, 'edgeCluster': {'nodes': 0}}
+        elif path == '/workflows/employee-onboarding':
+            body = {'workflowId': 'stub', 'status': 'completed', 'steps': []}
+        else:
+            body = {'path': path}
+        body['timestamp'] = datetime.now().isoformat()
+
+        encoded = json.dumps(body).encode('utf-8')
+        if profile.payload_bytes > len(encoded):
+            # 요청한 크기가 되도록 padding 필드 추가
+            padding = profile.payload_bytes - len(encoded) - len(', "padding": ""')
+            body['padding'] = 'x' * max(0, padding)
+            encoded = json.dumps(body).encode('utf-8')
+        return encoded
+
+    def _handler(self, path: str):
+        profile = self.profiles[path]
+        sampler = self._samplers[path]
+        stats = self.stats[path]
+        body = self._bodies[path]
+
+        async def handle(request: web.Request) -> web.Response:
+            if request.can_read_body:
+                await request.read()
+
+            delay_ms = sampler()
+            stats['requests'] += 1
+            stats['injected_latency_ms'] += delay_ms
+            if delay_ms > 0:
+                await asyncio.sleep(delay_ms / 1000)
+
+            if profile.error_rate > 0 and random.random() < profile.error_rate:
+                stats['errors'] += 1
+                return web.json_response({'error': 'Injected stub failure'}, status=profile.error_status)
+
+            return web.Response(body=body, status=profile.status, content_type='application/json')
+
+        return handle
+
+    async def handle_stats(self, request: web.Request) -> web.Response:
+        """스텁 서버 측 통계 (요청 수, 주입한 평균 지연)"""
+        return web.json_response({
+            'uptime_seconds': time.time() - self.started_at,
+            'endpoints': {
+                path: {
+                    'requests': s['requests'],
+                    'errors': s['errors'],
+                    'avg_injected_latency_ms': s['injected_latency_ms'] / s['requests'] if s['requests'] else 0.0
+                }
+                for path, s in self.stats.items()
+            }
+        })
+
+    async def handle_reset(self, request: web.Request) -> web.Response:
+        for s in self.stats.values():
+            s.update(requests=0, errors=0, injected_latency_ms=0.0)
+        return web.json_response({'reset': True})
+
+    def create_app(self) -> web.Application:
+        app = web.Application()
+        for path, profile in self.profiles.items():
+            app.router.add_route(profile.method, path, self._handler(path))
+        app.router.add_get('/__stub/stats', self.handle_stats)
+        app.router.add_post('/__stub/reset', self.handle_reset)
+        return app
+
+def load_profiles(config_file: Optional[str] = None) -> Dict[str, EndpointProfile]:
+    """기본 프로파일에 설정 파일 내용을 덮어써서 반환"""
+    profiles = {path: EndpointProfile(**vars(p)) for path, p in DEFAULT_PROFILES.items()}
+    if config_file:
+        with open(config_file, 'r', encoding='utf-8') as f:
+            overrides = json.load(f)
+        for path, values in overrides.items():
+            if path in profiles:
+                for key, value in values.items():
+                    setattr(profiles[path], key, value)
+            else:
+                profiles[path] = EndpointProfile(**{'method': 'GET', **values})
+    return profiles
+
+def _parse_overrides(items, convert) -> Dict[str, Any]:
+    overrides = {}
+    for item in items or []:
+        path, _, value = item.partition('=')
+        overrides[path] = convert(value)
+    return overrides
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="HCM API 게이트웨이 로컬 스텁 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=3001)
+    parser.add_argument("--config", help="엔드포인트 프로파일 설정 파일 (JSON)")
+    parser.add_argument("--latency", action="append", metavar="PATH=SPEC",
+                        help="지연 분포 (예: /health=fixed:10, /services=lognormal:5:0.5)")
+    parser.add_argument("--error-rate", action="append", metavar="PATH=RATE", help="에러 주입 비율 (0-1)")
+    parser.add_argument("--payload-bytes", action="append", metavar="PATH=BYTES", help="응답 본문 크기")
+    args = parser.parse_args()
+
+    profiles = load_profiles(args.config)
+    for path, spec in _parse_overrides(args.latency, parse_latency_spec).items():
+        profiles[path].latency = spec
+    for path, rate in _parse_overrides(args.error_rate, float).items():
+        profiles[path].error_rate = rate
+    for path, size in _parse_overrides(args.payload_bytes, int).items():
+        profiles[path].payload_bytes = size
+
+    stub = StubGateway(profiles)
+    print(f"🧪 HCM 게이트웨이 스텁 시작: http://{args.host}:{args.port}")
+    for path, profile in profiles.items():
+        print(f"   {profile.method:4} {path} - 지연 {profile.latency}, 에러율 {profile.error_rate:.1%}")
+
+    web.run_app(stub.create_app(), host=args.host, port=args.port, print=None)
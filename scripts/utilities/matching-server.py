@@ -0,0 +1,387 @@
+#!/usr/bin/env python3
+"""
+HCM 매칭 서버
+Long-running matching service built on HCMMatchingSimulator
+
+직원 명단을 한 번만 MatchIndex로 적재해 두고, "이 태스크에 맞는 상위 k명" 요청에
+로컬 HTTP(또는 Unix 소켓) API로 응답한다. 점수 계산 중 도착한 요청은 대기열에 쌓였다가
+다음 묶음으로 처리된다. 묶음은 요청을 모을 뿐 태스크별 점수 계산을 공유하지 않는다(스킬별
+시그모이드가 태스크의 요구 레벨에 따라 달라서 (묶음 x 직원) 행렬로 한 번에 계산해도 빨라지지
+않음). 같은 프로파일의 태스크만 한 번 계산한다. (계산을 별도 스레드로 넘기면 GIL 전환 대기로
+저부하 지연이 오히려 늘어나서 이벤트 루프에서 바로 계산)
+직원 10만 명 기준 태스크 하나에 약 3-5ms가 들어 p99 10ms 이내는 동시 요청이 적을 때만
+유지된다. 동시 요청이 몰리면 대기열 길이 x 태스크당 계산 시간만큼 지연이 늘어난다
+(예: 동시 500건이면 p50 수백 ms).
+같은 태스크 프로파일의 반복 요청은 MatchCache(LRU/TTL)에서 바로 응답하고, 직원 정보가
+바뀌면 결과가 달라질 수 있는 캐시 항목만 무효화한다.
+performance-benchmark.py 로 게이트웨이 엔드포인트처럼 벤치마크할 수 있다.
+
+사용 예:
+    python matching-server.py --employees 100000 --port 3010
+    python matching-server.py --roster roster.json --unix-socket /tmp/hcm-matching.sock
+    python ../testing/performance-benchmark.py --base-url http://127.0.0.1:3010 \
+        --scenario ../testing/scenarios/matching-server.json --non-interactive --no-plots
+
+API:
+    POST /match        {"required_skills": {"Python": 7}, "estimated_hours": 40, "priority": 5,
+                        "deadline_days": 10, "complexity": 0.6, "k": 5}
+    POST /match/batch  {"tasks": [...], "k": 5}
+    PUT  /employees/{id}  {"name": ..., "skills": {...}, "experience_years": ..., "department": ...,
+                           "availability": ..., "workload": ...}
+    GET  /health, GET /stats
+"""
+
+import argparse
+import asyncio
+import importlib.util
+import json
+import math
+import os
+import random
+import sys
+import time
+from dataclasses import asdict, replace
+from typing import List, Dict, Any, Optional, Tuple
+
+import numpy as np
+from aiohttp import web
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+def load_script(filename: str, module_name: str):
+    """하이픈이 들어간 스크립트 파일을 모듈로 로드"""
+    spec = importlib.util.spec_from_file_location(module_name, os.path.join(SCRIPT_DIR, filename))
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+    return module
+
+matching_module = load_script('mathematical-verification.py', 'hcm_mathematical_verification')
+Employee = matching_module.Employee
+Task = matching_module.Task
+
+TASK_FIELDS = ('required_skills', 'estimated_hours', 'priority', 'deadline_days', 'complexity')
+EMPLOYEE_FIELDS = ('name', 'skills', 'experience_years', 'department', 'availability', 'workload')
+DEFAULT_TOP_K = 5
+MAX_TOP_K = 100
+
+def is_number(value: Any) -> bool:
+    """JSON 숫자인지 (bool과 NaN/Infinity는 제외)"""
+    return isinstance(value, (int, float)) and not isinstance(value, bool) and math.isfinite(value)
+
+def is_integer(value: Any) -> bool:
+    return isinstance(value, int) and not isinstance(value, bool)
+
+def parse_task(payload: Dict[str, Any], seq: int) -> Task:
+    """요청 본문을 Task로 변환 (필드가 없거나 형식이 틀리면 ValueError)"""
+    if not isinstance(payload, dict):
+        raise ValueError("태스크는 JSON 객체여야 합니다")
+    missing = [name for name in TASK_FIELDS if name not in payload]
+    if missing:
+        raise ValueError(f"필수 필드 누락: {', '.join(missing)}")
+    required_skills = payload['required_skills']
+    if not isinstance(required_skills, dict) or not required_skills or \
+            not all(isinstance(skill, str) and is_number(level) for skill, level in required_skills.items()):
+        raise ValueError("required_skills는 비어 있지 않은 {스킬: 요구 레벨(숫자)} 객체여야 합니다")
+    if not all(0 <= level <= 10 for level in required_skills.values()):
+        raise ValueError("요구 레벨은 0-10 범위여야 합니다")
+    for name in ('estimated_hours', 'complexity'):
+        if not is_number(payload[name]):
+            raise ValueError(f"{name}는 숫자여야 합니다")
+    if payload['estimated_hours'] <= 0:
+        raise ValueError("estimated_hours는 0보다 커야 합니다")
+    if not 0 < payload['complexity'] <= 1:
+        raise ValueError("complexity는 0 초과 1 이하여야 합니다")
+    for name in ('priority', 'deadline_days'):
+        if not is_integer(payload[name]):
+            raise ValueError(f"{name}는 정수여야 합니다")
+    task_id = str(payload.get('id', f"REQ_{seq:06d}"))
+    return Task(
+        id=task_id,
+        title=str(payload.get('title', task_id)),
+        required_skills={skill: float(level) for skill, level in required_skills.items()},
+        estimated_hours=float(payload['estimated_hours']),
+        priority=payload['priority'],
+        deadline_days=payload['deadline_days'],
+        complexity=float(payload['complexity'])
+    )
+
+def parse_employee(payload: Any, employee_id: str) -> Employee:
+    """요청 본문을 Employee로 변환 (필드가 없거나 형식이 틀리면 ValueError)"""
+    if not isinstance(payload, dict):
+        raise ValueError("직원 정보는 JSON 객체여야 합니다")
+    missing = [name for name in EMPLOYEE_FIELDS if name not in payload]
+    if missing:
+        raise ValueError(f"필수 필드 누락: {', '.join(missing)}")
+    skills = payload['skills']
+    if not isinstance(skills, dict) or not all(isinstance(skill, str) and is_number(level)
+                                               for skill, level in skills.items()):
+        raise ValueError("skills는 {스킬: 숙련도(숫자)} 객체여야 합니다")
+    if not all(0 <= level <= 10 for level in skills.values()):
+        raise ValueError("숙련도는 0-10 범위여야 합니다")
+    for name in ('experience_years', 'availability', 'workload'):
+        if not is_number(payload[name]):
+            raise ValueError(f"{name}는 숫자여야 합니다")
+    if payload['experience_years'] < 0:
+        raise ValueError("experience_years는 0 이상이어야 합니다")
+    for name in ('availability', 'workload'):
+        if not 0 <= payload[name] <= 1:
+            raise ValueError(f"{name}는 0-1 범위여야 합니다")
+    return Employee(
+        id=employee_id,
+        name=str(payload['name']),
+        skills={skill: float(level) for skill, level in skills.items()},
+        experience_years=float(payload['experience_years']),
+        department=str(payload['department']),
+        availability=float(payload['availability']),
+        workload=float(payload['workload'])
+    )
+
+def parse_top_k(value: Any) -> int:
+    """요청의 k 검증 (정수가 아니거나 범위를 벗어나면 ValueError, bool과 2.5 같은 실수도 거부)"""
+    if value is None:
+        return DEFAULT_TOP_K
+    if not is_integer(value) or not 1 <= value <= MAX_TOP_K:
+        raise ValueError(f"k는 1-{MAX_TOP_K} 범위의 정수여야 합니다")
+    return value
+
+def load_roster(path: Optional[str], num_employees: int, seed: Optional[int]) -> List[Employee]:
+    """직원 명단 로드 (파일이 없으면 generate_sample_data로 생성)"""
+    if path:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        records = data['employees'] if isinstance(data, dict) else data
+        return [Employee(**record) for record in records]
+
+    if seed is not None:
+        random.seed(seed)
+        np.random.seed(seed)
+    simulator = matching_module.HCMMatchingSimulator()
+    simulator.generate_sample_data(num_employees, 0)
+    return simulator.employees
+
+class MicroBatcher:
+    """대기 중인 매칭 요청을 모아 인덱스에 전달 (요청 병합만 하며 점수 계산은 태스크별로 수행)
+
+    같은 묶음 안에서 MatchCache.key가 같은 태스크는 한 번만 계산하고 결과를 나눠 쓴다.
+    """
+
+    def __init__(self, index, max_batch: int = 16, window: float = 0.0, cache=None):
+        self.index = index
+        # 계산한 결과를 저장할 MatchCache (None이면 사용 안 함)
+        self.cache = cache
+        self.max_batch = max_batch
+        # 첫 요청 후 더 모으기 위해 기다리는 시간 (0이면 이미 대기 중인 요청만 묶음)
+        self.window = window
+        self.queue: Optional[asyncio.Queue] = None
+        self.requests = 0
+        self.batches = 0
+        self.largest_batch = 0
+        # 같은 묶음의 동일 프로파일 요청이라 계산을 건너뛴 수
+        self.coalesced = 0
+        self.scoring_seconds = 0.0
+        self._worker: Optional[asyncio.Task] = None
+
+    async def start(self):
+        self.queue = asyncio.Queue()
+        self._worker = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._worker is not None:
+            self._worker.cancel()
+            await asyncio.gather(self._worker, return_exceptions=True)
+            self._worker = None
+
+    async def submit(self, task: Task, k: int) -> list:
+        future = asyncio.get_running_loop().create_future()
+        self.queue.put_nowait((task, k, future))
+        return await future
+
+    async def _next_batch(self) -> List[Tuple[Task, int, asyncio.Future]]:
+        batch = [await self.queue.get()]
+        if self.window > 0 and self.queue.qsize() + 1 < self.max_batch:
+            await asyncio.sleep(self.window)
+        while len(batch) < self.max_batch and not self.queue.empty():
+            batch.append(self.queue.get_nowait())
+        return batch
+
+    async def _run(self):
+        while True:
+            batch = await self._next_batch()
+            keys = [matching_module.MatchCache.key(task) for task, _, _ in batch]
+            unique: Dict[tuple, Task] = {}
+            for key, (task, _, _) in zip(keys, batch):
+                unique.setdefault(key, task)
+            # 가장 큰 k로 한 번 계산하고 요청별로 잘라서 반환 (순위는 k와 무관)
+            k = max(k for _, k, _ in batch)
+            started = time.perf_counter()
+            try:
+                scored = dict(zip(unique, self.index.top_k(list(unique.values()), k)))
+            except Exception as e:
+                for _, _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            self.scoring_seconds += time.perf_counter() - started
+            if self.cache is not None:
+                for key, task in unique.items():
+                    self.cache.put(task, k, scored[key])
+            self.requests += len(batch)
+            self.batches += 1
+            self.largest_batch = max(self.largest_batch, len(batch))
+            self.coalesced += len(batch) - len(unique)
+            for key, (task, request_k, future) in zip(keys, batch):
+                # 클라이언트가 끊겨 취소된 요청은 건너뜀
+                if future.done():
+                    continue
+                matches = scored[key][:request_k]
+                if unique[key] is not task:
+                    matches = [replace(match, task_id=task.id) for match in matches]
+                future.set_result(matches)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            'requests': self.requests,
+            'batches': self.batches,
+            'avg_batch_size': self.requests / self.batches if self.batches else 0.0,
+            'max_batch_size': self.largest_batch,
+            'coalesced': self.coalesced,
+            'avg_scoring_ms': self.scoring_seconds / self.batches * 1000 if self.batches else 0.0,
+            'queued': self.queue.qsize() if self.queue else 0
+        }
+
+class MatchingServer:
+    """MatchIndex를 감싼 매칭 API 서버"""
+
+    def __init__(self, employees: List[Employee], max_batch: int = 16, batch_window: float = 0.0,
+                 cache_size: int = 10000, cache_ttl: float = 300.0):
+        started = time.perf_counter()
+        simulator = matching_module.HCMMatchingSimulator()
+        simulator.employees = employees
+        self.index = simulator.build_index()
+        self.index_seconds = time.perf_counter() - started
+        self.cache = matching_module.MatchCache(self.index, cache_size, cache_ttl) if cache_size > 0 else None
+        self.batcher = MicroBatcher(self.index, max_batch, batch_window, self.cache)
+        self.started_at = time.time()
+        self.seq = 0
+        self.rejected = 0
+
+    @staticmethod
+    def match_payload(task: Task, matches: list) -> Dict[str, Any]:
+        return {
+            'task_id': task.id,
+            'matches': [{'rank': rank, **asdict(match)} for rank, match in enumerate(matches, 1)]
+        }
+
+    def _parse(self, payload: Any) -> Task:
+        self.seq += 1
+        return parse_task(payload, self.seq)
+
+    def _bad_request(self, error: Exception) -> web.Response:
+        self.rejected += 1
+        return web.json_response({'error': str(error)}, status=400)
+
+    async def lookup(self, task: Task, k: int) -> list:
+        """캐시에 있으면 바로, 없으면 micro-batch로 계산"""
+        matches = self.cache.get(task, k) if self.cache is not None else None
+        if matches is None:
+            matches = await self.batcher.submit(task, k)
+        return matches
+
+    async def handle_match(self, request: web.Request) -> web.Response:
+        try:
+            payload = await request.json()
+            task = self._parse(payload)
+            k = parse_top_k(payload.get('k'))
+        except (ValueError, TypeError) as e:
+            return self._bad_request(e)
+        matches = await self.lookup(task, k)
+        return web.json_response(self.match_payload(task, matches))
+
+    async def handle_match_batch(self, request: web.Request) -> web.Response:
+        try:
+            payload = await request.json()
+            if not isinstance(payload, dict) or not isinstance(payload.get('tasks'), list):
+                raise ValueError("tasks 배열이 필요합니다")
+            tasks = [self._parse(item) for item in payload['tasks']]
+            k = parse_top_k(payload.get('k'))
+        except (ValueError, TypeError) as e:
+            return self._bad_request(e)
+        results = await asyncio.gather(*(self.lookup(task, k) for task in tasks))
+        return web.json_response({'results': [self.match_payload(task, matches)
+                                              for task, matches in zip(tasks, results)]})
+
+    async def handle_upsert_employee(self, request: web.Request) -> web.Response:
+        """직원 추가/변경 후 영향받는 캐시 항목만 무효화"""
+        try:
+            payload = await request.json()
+            employee = parse_employee(payload, request.match_info['employee_id'])
+        except (ValueError, TypeError) as e:
+            return self._bad_request(e)
+        if self.cache is not None:
+            result = self.cache.upsert(employee)
+        else:
+            self.index.upsert(employee)
+            result = {'roster_version': self.index.version}
+        return web.json_response({'employee_id': employee.id, **result})
+
+    async def handle_health(self, request: web.Request) -> web.Response:
+        return web.json_response({'status': 'healthy', 'employees': len(self.index),
+                                  'roster_version': self.index.version})
+
+    async def handle_stats(self, request: web.Request) -> web.Response:
+        return web.json_response({
+            'uptime_seconds': time.time() - self.started_at,
+            'employees': len(self.index),
+            'skills': len(self.index.postings),
+            'index_build_seconds': self.index_seconds,
+            'roster_version': self.index.version,
+            'rejected': self.rejected,
+            'batching': self.batcher.stats(),
+            'cache': self.cache.stats() if self.cache is not None else None
+        })
+
+    async def _on_startup(self, app: web.Application):
+        await self.batcher.start()
+
+    async def _on_cleanup(self, app: web.Application):
+        await self.batcher.stop()
+
+    def create_app(self) -> web.Application:
+        app = web.Application()
+        app.router.add_post('/match', self.handle_match)
+        app.router.add_post('/match/batch', self.handle_match_batch)
+        app.router.add_put('/employees/{employee_id}', self.handle_upsert_employee)
+        app.router.add_get('/health', self.handle_health)
+        app.router.add_get('/stats', self.handle_stats)
+        app.on_startup.append(self._on_startup)
+        app.on_cleanup.append(self._on_cleanup)
+        return app
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="HCM 매칭 서버 (인메모리 인덱스 + top-k API)")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=3010)
+    parser.add_argument("--unix-socket", metavar="PATH", help="Unix 소켓 경로 (지정 시 TCP와 함께 바인드)")
+    parser.add_argument("--roster", metavar="FILE", help="직원 명단 JSON (Employee 필드 목록, 기본: 샘플 생성)")
+    parser.add_argument("--employees", type=int, default=100000, help="샘플 생성 시 직원 수")
+    parser.add_argument("--seed", type=int, help="샘플 생성 난수 시드")
+    parser.add_argument("--max-batch", type=int, default=16, help="micro-batch 최대 요청 수")
+    parser.add_argument("--batch-window-ms", type=float, default=0.0,
+                        help="첫 요청 후 더 모으기 위해 기다리는 시간 (ms, 0이면 대기 중인 요청만 묶음)")
+    parser.add_argument("--cache-size", type=int, default=10000, help="결과 캐시 최대 항목 수 (0이면 사용 안 함)")
+    parser.add_argument("--cache-ttl", type=float, default=300.0, help="결과 캐시 유효 시간 (초)")
+    args = parser.parse_args()
+
+    print("📥 직원 명단 적재 중...")
+    employees = load_roster(args.roster, args.employees, args.seed)
+    server = MatchingServer(employees, args.max_batch, args.batch_window_ms / 1000,
+                            args.cache_size, args.cache_ttl)
+    print(f"🧭 HCM 매칭 서버 시작: http://{args.host}:{args.port}"
+          + (f", unix:{args.unix_socket}" if args.unix_socket else ""))
+    print(f"   직원 {len(server.index):,}명, 스킬 {len(server.index.postings)}개, "
+          f"인덱스 생성 {server.index_seconds:.2f}s, micro-batch 최대 {args.max_batch}, "
+          f"캐시 {args.cache_size:,}개/{args.cache_ttl:.0f}s")
+
+    web.run_app(server.create_app(), host=args.host, port=args.port, path=args.unix_socket, print=None)
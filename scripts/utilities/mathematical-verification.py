@@ -6,19 +6,27 @@ Mathematical Verification and Simulation for HCM Matching Algorithm
 
 import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
-from scipy import stats
-from sklearn.metrics import mean_squared_error, accuracy_score
-from dataclasses import dataclass
-from typing import List, Dict, Tuple
+from dataclasses import dataclass, field, replace
+from typing import List, Dict, Tuple, Optional, Set, Iterable, Iterator
+import heapq
+import math
 import random
 import json
+import os
+import sys
+import time
+import contextlib
+import importlib
+from collections import OrderedDict
 from datetime import datetime, timedelta
 
-# 한글 폰트 설정
-plt.rcParams['font.family'] = ['Malgun Gothic', 'DejaVu Sans']
-plt.rcParams['axes.unicode_minus'] = False
+def load_testing_module(module_name: str):
+    """scripts/testing의 공유 모듈(hcm_reports, hcm_profiling 등) 지연 로드"""
+    testing_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'testing')
+    testing_dir = os.path.normpath(testing_dir)
+    if testing_dir not in sys.path:
+        sys.path.insert(0, testing_dir)
+    return importlib.import_module(module_name)
 
 @dataclass
 class Employee:
@@ -51,10 +59,24 @@ class MatchResult:
 class HCMMatchingSimulator:
     """HCM 시스템 매칭 알고리즘 시뮬레이터"""
     
-    def __init__(self):
+    # 종합 점수 가중치
+    WEIGHTS = {
+        'skill': 0.4,
+        'availability': 0.25,
+        'experience': 0.2,
+        'priority': 0.15
+    }
+    
+    def __init__(self, profiler=None):
         self.employees: List[Employee] = []
         self.tasks: List[Task] = []
         self.match_results: List[MatchResult] = []
+        # hcm_profiling.Profiler (None이면 구간 측정 생략)
+        self.profiler = profiler
+        
+    def phase(self, name: str):
+        """프로파일러가 있으면 구간 시간 측정"""
+        return self.profiler.phase(name) if self.profiler else contextlib.nullcontext()
         
     def generate_sample_data(self, num_employees: int = 100, num_tasks: int = 50):
         """샘플 데이터 생성"""
@@ -172,12 +194,7 @@ class HCMMatchingSimulator:
         priority_score = self.calculate_priority_urgency_score(task)
         
         # 가중 평균 계산
-        weights = {
-            'skill': 0.4,
-            'availability': 0.25,
-            'experience': 0.2,
-            'priority': 0.15
-        }
+        weights = self.WEIGHTS
         
         final_score = (
             skill_score * weights['skill'] +
@@ -207,22 +224,41 @@ class HCMMatchingSimulator:
             reasoning=reasoning
         )
     
-    def run_matching_simulation(self) -> pd.DataFrame:
-        """전체 매칭 시뮬레이션 실행"""
+    def build_index(self) -> 'MatchIndex':
+        """현재 직원 명단으로 매칭 인덱스 생성"""
+        return MatchIndex(self.employees, self)
+    
+    def run_matching_simulation(self, reranker: Optional['FairReranker'] = None) -> pd.DataFrame:
+        """전체 매칭 시뮬레이션 실행
+        
+        reranker가 있으면 MatchIndex에서 점수순 후보를 필요한 만큼만 읽어 노출 상한/부서 다양성을
+        반영해 상위 5명을 재선택한다 (전체 정렬 결과와 같은 순서라 선택도 동일).
+        """
         results = []
+        index = None
+        if reranker:
+            with self.phase('indexing'):
+                index = self.build_index()
         
         for task in self.tasks:
-            task_matches = []
-            for employee in self.employees:
-                match_result = self.calculate_match_score(employee, task)
-                task_matches.append(match_result)
-            
-            # 점수 순으로 정렬
-            task_matches.sort(key=lambda x: x.match_score, reverse=True)
-            
-            # 상위 5명 저장
-            for i, match in enumerate(task_matches[:5]):
-                results.append({
+            if index is not None:
+                with self.phase('reranking'):
+                    selected = reranker.select(index.ranked(task))
+            else:
+                with self.phase('scoring'):
+                    task_matches = []
+                    for employee in self.employees:
+                        match_result = self.calculate_match_score(employee, task)
+                        task_matches.append(match_result)
+                
+                # 점수 순으로 정렬
+                with self.phase('sorting'):
+                    task_matches.sort(key=lambda x: x.match_score, reverse=True)
+                
+                # 상위 5명 저장
+                selected = list(enumerate(task_matches[:5]))
+            for i, (raw_rank, match) in enumerate(selected):
+                row = {
                     'task_id': task.id,
                     'employee_id': match.employee_id,
                     'rank': i + 1,
@@ -235,9 +271,13 @@ class HCMMatchingSimulator:
                     'task_priority': task.priority,
                     'task_complexity': task.complexity,
                     'task_estimated_hours': task.estimated_hours
-                })
+                }
+                if reranker:
+                    row['raw_rank'] = raw_rank + 1
+                results.append(row)
         
-        return pd.DataFrame(results)
+        with self.phase('dataframe'):
+            return pd.DataFrame(results)
     
     def statistical_analysis(self, results_df: pd.DataFrame) -> Dict:
         """통계적 분석"""
@@ -263,13 +303,422 @@ class HCMMatchingSimulator:
         }
         
         return stats_summary
+    
+    def exposure_analysis(self, results_df: pd.DataFrame) -> Dict:
+        """직원별 노출(상위 목록 등장 횟수) 집중도와 목록당 부서 다양성"""
+        departments = {employee.id: employee.department for employee in self.employees}
+        counts = results_df['employee_id'].value_counts()
+        # 한 번도 추천되지 않은 직원까지 포함한 지니 계수
+        exposure = np.sort(np.concatenate([counts.to_numpy(dtype=float),
+                                           np.zeros(max(0, len(departments) - len(counts)))]))
+        n = len(exposure)
+        gini = (2 * np.sum(np.arange(1, n + 1) * exposure) / (n * exposure.sum()) - (n + 1) / n) \
+            if n and exposure.sum() else 0.0
+        top_decile = max(1, n // 10)
+        return {
+            'distinct_employees': int(len(counts)),
+            'max_exposure': int(counts.max()) if len(counts) else 0,
+            'gini': float(gini),
+            'top_decile_share': float(exposure[-top_decile:].sum() / exposure.sum()) if exposure.sum() else 0.0,
+            'departments_per_task': float(
+                results_df['employee_id'].map(departments).groupby(results_df['task_id']).nunique().mean()
+            )
+        }
 
-def run_mathematical_verification():
-    """수학적 검증 실행"""
+class MatchIndex:
+    """직원 명단을 스킬별 보유자 목록(posting list)과 가용성/경험 배열로 보관해 top-k를 벡터 연산으로 계산하는 인덱스
+    
+    calculate_match_score와 같은 순서로 더하므로 점수와 순위(동점은 명단 순서)가 그대로 일치한다.
+    """
+    
+    def __init__(self, employees: List[Employee], simulator: HCMMatchingSimulator):
+        self.simulator = simulator
+        self.employees = list(employees)
+        self.positions = {employee.id: i for i, employee in enumerate(self.employees)}
+        holders: Dict[str, List[int]] = {}
+        for position, employee in enumerate(self.employees):
+            for skill, level in employee.skills.items():
+                # 숙련도 0은 calculate_skill_match_score에서 스킬 없음과 같음
+                if level != 0:
+                    holders.setdefault(skill, []).append(position)
+        # 스킬별 보유 직원 위치와 숙련도
+        self.postings = {skill: np.array(positions, dtype=np.intp) for skill, positions in holders.items()}
+        self.posting_levels = {
+            skill: np.array([self.employees[position].skills[skill] for position in positions], dtype=float)
+            for skill, positions in holders.items()
+        }
+        self.capacity = np.array([employee.availability * (1 - employee.workload) for employee in self.employees])
+        self.experience = np.array([employee.experience_years for employee in self.employees], dtype=float)
+        # 명단이 바뀔 때마다 증가 (캐시 유효성 확인용)
+        self.version = 0
+        
+    def __len__(self) -> int:
+        return len(self.employees)
+    
+    def _set_level(self, skill: str, position: int, level: float):
+        """posting list에서 한 직원의 숙련도 변경/추가/삭제"""
+        postings = self.postings.get(skill, np.empty(0, dtype=np.intp))
+        levels = self.posting_levels.get(skill, np.empty(0))
+        found = np.flatnonzero(postings == position)
+        if level != 0 and found.size:
+            levels[found[0]] = level
+            return
+        if level != 0:
+            postings, levels = np.append(postings, position), np.append(levels, level)
+        elif found.size:
+            postings, levels = np.delete(postings, found[0]), np.delete(levels, found[0])
+        else:
+            return
+        if postings.size:
+            self.postings[skill], self.posting_levels[skill] = postings, levels
+        else:
+            self.postings.pop(skill, None)
+            self.posting_levels.pop(skill, None)
+    
+    def upsert(self, employee: Employee) -> Optional[Employee]:
+        """직원 추가 또는 변경 (바뀐 스킬의 posting list만 갱신), 변경 전 직원 반환
+        
+        값 계산을 모두 마친 뒤에 상태를 바꾸므로 형식이 틀린 직원은 인덱스를 건드리지 않고 실패한다.
+        """
+        position = self.positions.get(employee.id)
+        previous = self.employees[position] if position is not None else None
+        if not isinstance(employee.skills, dict):
+            raise TypeError("skills는 {스킬: 숙련도} 객체여야 합니다")
+        capacity = float(employee.availability) * (1 - float(employee.workload))
+        experience = float(employee.experience_years)
+        levels = {skill: float(level) for skill, level in employee.skills.items()}
+        for skill in previous.skills if previous else ():
+            levels.setdefault(skill, 0)
+        
+        if position is None:
+            # 새 직원은 명단 끝에 추가 (동점 순서도 명단 순서를 따름)
+            position = len(self.employees)
+            self.employees.append(employee)
+            self.positions[employee.id] = position
+            self.capacity = np.append(self.capacity, capacity)
+            self.experience = np.append(self.experience, experience)
+        else:
+            self.employees[position] = employee
+            self.capacity[position] = capacity
+            self.experience[position] = experience
+        
+        for skill, level in levels.items():
+            self._set_level(skill, position, level)
+        self.version += 1
+        return previous
+        
+    def score(self, task: Task) -> Dict[str, np.ndarray]:
+        """태스크 하나에 대한 직원별 세부 점수 배열 (priority_score는 스칼라)"""
+        size = len(self.employees)
+        weighted = np.zeros(size)
+        total_weight = 0
+        for skill, required_level in task.required_skills.items():
+            weight = required_level / 10.0
+            total_weight += weight
+            if skill not in self.postings:
+                continue
+            # 스킬이 없는 직원은 0점이므로 보유자만 계산 (-(level - required) == required - level)
+            skill_scores = 1 / (1 + np.exp(required_level - self.posting_levels[skill]))
+            weighted[self.postings[skill]] += skill_scores * weight
+        skill_score = weighted / total_weight if total_weight else weighted
+        
+        # 부족할 때만 비율을 쓰는 원래 분기는 min(1, 비율)과 같음
+        required_capacity = min(1.0, task.estimated_hours / 160)
+        availability_score = np.minimum(1.0, self.capacity / required_capacity) if required_capacity > 0 \
+            else np.ones(size)
+        required_experience = task.complexity * 10
+        experience_score = np.minimum(1.0, self.experience / required_experience) if required_experience > 0 \
+            else np.ones(size)
+        priority_score = self.simulator.calculate_priority_urgency_score(task)
+        
+        weights = self.simulator.WEIGHTS
+        match_score = skill_score * weights['skill']
+        match_score += availability_score * weights['availability']
+        match_score += experience_score * weights['experience']
+        match_score += priority_score * weights['priority']
+        return {
+            'match_score': match_score,
+            'skill_score': skill_score,
+            'availability_score': availability_score,
+            'experience_score': experience_score,
+            'priority_score': priority_score
+        }
+    
+    def position_score(self, task: Task, position: int) -> float:
+        """한 직원의 match_score (score()와 같은 연산 순서라 값이 같고, 요구량이 0이어도 나누지 않음)"""
+        skills = self.employees[position].skills
+        weighted = 0.0
+        total_weight = 0
+        for skill, required_level in task.required_skills.items():
+            weight = required_level / 10.0
+            total_weight += weight
+            level = skills.get(skill, 0)
+            if level != 0:
+                weighted += 1 / (1 + np.exp(required_level - level)) * weight
+        skill_score = weighted / total_weight if total_weight else weighted
+        
+        required_capacity = min(1.0, task.estimated_hours / 160)
+        availability_score = min(1.0, self.capacity[position] / required_capacity) if required_capacity > 0 else 1.0
+        required_experience = task.complexity * 10
+        experience_score = min(1.0, self.experience[position] / required_experience) if required_experience > 0 \
+            else 1.0
+        
+        weights = self.simulator.WEIGHTS
+        match_score = skill_score * weights['skill']
+        match_score += availability_score * weights['availability']
+        match_score += experience_score * weights['experience']
+        match_score += self.simulator.calculate_priority_urgency_score(task) * weights['priority']
+        return float(match_score)
+    
+    @staticmethod
+    def top_positions(values: np.ndarray, k: int) -> np.ndarray:
+        """점수 내림차순 상위 k개 위치 (동점은 앞선 위치 우선, list.sort와 같은 순서)"""
+        if k < len(values):
+            threshold = np.partition(values, len(values) - k)[len(values) - k]
+            candidates = np.flatnonzero(values >= threshold)
+        else:
+            candidates = np.arange(len(values))
+        order = np.lexsort((candidates, -values[candidates]))
+        return candidates[order[:k]]
+    
+    def match_result(self, task: Task, scores: Dict[str, np.ndarray], position: int) -> MatchResult:
+        """점수 배열의 한 위치를 calculate_match_score와 같은 MatchResult로 변환"""
+        employee = self.employees[position]
+        skill_score = float(scores['skill_score'][position])
+        skill_coverage = len([s for s in task.required_skills.keys()
+                              if s in employee.skills]) / len(task.required_skills)
+        return MatchResult(
+            employee_id=employee.id,
+            task_id=task.id,
+            match_score=float(scores['match_score'][position]),
+            confidence=skill_coverage * min(1.0, skill_score + 0.5),
+            reasoning={
+                'skill_score': skill_score,
+                'availability_score': float(scores['availability_score'][position]),
+                'experience_score': float(scores['experience_score'][position]),
+                'priority_score': float(scores['priority_score']),
+                'skill_coverage': skill_coverage
+            }
+        )
+    
+    def ranked(self, task: Task, chunk: int = 64) -> Iterator[MatchResult]:
+        """점수 내림차순 매칭 결과를 필요한 만큼만 생성 (부분 선택 범위를 두 배씩 확장)"""
+        scores = self.score(task)
+        values = scores['match_score']
+        produced, size = 0, chunk
+        while produced < len(values):
+            top = self.top_positions(values, min(size, len(values)))
+            for position in top[produced:]:
+                yield self.match_result(task, scores, position)
+            produced, size = len(top), size * 2
+    
+    def top_k(self, tasks: List[Task], k: int = 5) -> List[List[MatchResult]]:
+        """태스크별 상위 k명 매칭 결과"""
+        results = []
+        for task in tasks:
+            scores = self.score(task)
+            results.append([self.match_result(task, scores, position)
+                            for position in self.top_positions(scores['match_score'], k)])
+        return results
+
+@dataclass
+class CacheEntry:
+    task: Task
+    k: int
+    matches: List[MatchResult]
+    version: int  # 유효한 명단 버전
+    expires_at: float
+    employee_ids: Set[str] = field(default_factory=set)
+
+class MatchCache:
+    """같은 태스크 프로파일의 top-k 결과를 재사용하는 LRU/TTL 캐시
+    
+    키는 점수에 영향을 주는 태스크 필드(스킬은 정렬)이고, 항목은 계산 당시 명단 버전에서만 유효하다.
+    직원이 바뀌면 그 직원이 결과에 있거나 새로 상위 k에 들어올 수 있는 항목만 지우고,
+    나머지는 새 버전으로 그대로 유지한다.
+    """
+    
+    def __init__(self, index: MatchIndex, max_entries: int = 10000, ttl: float = 300.0):
+        self.index = index
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.entries: 'OrderedDict[tuple, CacheEntry]' = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+        self.revalidations = 0
+    
+    @staticmethod
+    def key(task: Task) -> tuple:
+        return (tuple(sorted(task.required_skills.items())), task.estimated_hours, task.priority,
+                task.deadline_days, task.complexity)
+    
+    def get(self, task: Task, k: int) -> Optional[List[MatchResult]]:
+        """캐시된 상위 k명 (없거나 만료/무효/요청 k가 더 크면 None)"""
+        key = self.key(task)
+        entry = self.entries.get(key)
+        if entry is not None and entry.version != self.index.version:
+            # 캐시를 거치지 않고 인덱스가 바뀐 경우
+            del self.entries[key]
+            self.invalidations += 1
+            entry = None
+        elif entry is not None and entry.expires_at <= time.monotonic():
+            del self.entries[key]
+            self.expirations += 1
+            entry = None
+        if entry is None or k > entry.k:
+            self.misses += 1
+            return None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return [replace(match, task_id=task.id) for match in entry.matches[:k]]
+    
+    def put(self, task: Task, k: int, matches: List[MatchResult]):
+        key = self.key(task)
+        self.entries[key] = CacheEntry(task, k, matches, self.index.version, time.monotonic() + self.ttl,
+                                       {match.employee_id for match in matches})
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+            self.evictions += 1
+    
+    def top_k(self, tasks: List[Task], k: int = 5) -> List[List[MatchResult]]:
+        """MatchIndex.top_k와 같은 결과, 캐시에 없는 태스크만 인덱스로 계산"""
+        results = [self.get(task, k) for task in tasks]
+        missing = [i for i, matches in enumerate(results) if matches is None]
+        if missing:
+            for i, matches in zip(missing, self.index.top_k([tasks[i] for i in missing], k)):
+                self.put(tasks[i], k, matches)
+                results[i] = matches
+        return results
+    
+    def _affected(self, entry: CacheEntry, employee: Employee) -> bool:
+        """변경된 직원 때문에 항목의 상위 k가 달라질 수 있는지"""
+        if employee.id in entry.employee_ids or len(entry.matches) < entry.k:
+            return True
+        threshold = entry.matches[-1].match_score
+        simulator = self.index.simulator
+        weights = simulator.WEIGHTS
+        if not any(skill in employee.skills for skill in entry.task.required_skills):
+            # 요구 스킬 posting list에 없으면 스킬 점수가 0이므로 상한만으로 판단
+            upper = (weights['availability'] + weights['experience'] +
+                     simulator.calculate_priority_urgency_score(entry.task) * weights['priority'])
+            if upper < threshold:
+                return False
+        # 인덱스가 이미 바뀐 뒤라 실패하면 안 되므로 0 나눗셈이 없는 인덱스 연산으로 계산
+        return self.index.position_score(entry.task, self.index.positions[employee.id]) >= threshold
+    
+    def upsert(self, employee: Employee) -> Dict[str, int]:
+        """인덱스에 직원을 반영하고 영향받는 캐시 항목만 무효화"""
+        version = self.index.version
+        self.index.upsert(employee)
+        invalidated = kept = 0
+        for key, entry in list(self.entries.items()):
+            if entry.version == version and not self._affected(entry, employee):
+                entry.version = self.index.version
+                kept += 1
+            else:
+                del self.entries[key]
+                invalidated += 1
+        self.invalidations += invalidated
+        self.revalidations += kept
+        return {'invalidated': invalidated, 'kept': kept, 'roster_version': self.index.version}
+    
+    def stats(self) -> Dict[str, float]:
+        lookups = self.hits + self.misses
+        return {
+            'entries': len(self.entries),
+            'max_entries': self.max_entries,
+            'ttl_seconds': self.ttl,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_ratio': self.hits / lookups if lookups else 0.0,
+            'evictions': self.evictions,
+            'expirations': self.expirations,
+            'invalidations': self.invalidations,
+            'revalidations': self.revalidations
+        }
+
+class FairReranker:
+    """태스크별 점수순 후보에서 직원 노출 상한과 부서 다양성을 반영해 k명을 다시 고르는 재순위기
+    
+    목표 함수는 (1 - diversity) * 점수 + diversity * 부서별 sqrt(선택 점수 합) 증가분으로,
+    단조 submodular라 lazy greedy로 고른다. 첫 상한값이 점수에 단조이므로 점수순 후보를
+    필요한 만큼만 읽으며, 태스크마다 O((읽은 후보 + 재계산) log k) 정도에 끝난다.
+    노출 수는 여러 태스크에 걸쳐 누적되고 max_exposure에 도달한 직원은 더 이상 선택되지 않는다.
+    """
+    
+    def __init__(self, departments: Dict[str, str], k: int = 5, max_exposure: Optional[int] = None,
+                 diversity: float = 0.5, max_per_department: Optional[int] = None):
+        self.departments = departments
+        self.k = k
+        self.max_exposure = max_exposure
+        self.diversity = diversity
+        self.max_per_department = max_per_department
+        self.exposure: Dict[str, int] = {}
+        # 노출 상한/부서 상한 때문에 건너뛴 후보 수
+        self.skipped_exposure = 0
+        self.skipped_department = 0
+    
+    def _gain(self, score: float, department_total: float) -> float:
+        return ((1 - self.diversity) * score +
+                self.diversity * (math.sqrt(department_total + score) - math.sqrt(department_total)))
+    
+    def select(self, candidates: Iterable[MatchResult]) -> List[Tuple[int, MatchResult]]:
+        """점수 내림차순 후보에서 k명 선택, (원래 순위 0부터, 결과) 목록 반환"""
+        stream = iter(enumerate(candidates))
+        totals: Dict[str, float] = {}
+        counts: Dict[str, int] = {}
+        heap: List[tuple] = []  # (-상한값, 원래 순위, 결과) - 상한값은 재계산 전까지 갱신 안 됨
+        pending = None
+        selected = []
+        
+        def next_candidate():
+            for raw_rank, match in stream:
+                if self.max_exposure is not None and self.exposure.get(match.employee_id, 0) >= self.max_exposure:
+                    self.skipped_exposure += 1
+                    continue
+                return raw_rank, match
+            return None
+        
+        pending = next_candidate()
+        while len(selected) < self.k and (heap or pending):
+            # 아직 읽지 않은 후보의 상한값은 부서 합 0일 때의 이득 (점수에 단조)
+            pending_bound = self._gain(pending[1].match_score, 0.0) if pending else -math.inf
+            if not heap or pending_bound > -heap[0][0]:
+                heapq.heappush(heap, (-pending_bound, pending[0], pending[1]))
+                pending = next_candidate()
+                continue
+            
+            _, raw_rank, match = heapq.heappop(heap)
+            department = self.departments.get(match.employee_id)
+            if self.max_per_department is not None and counts.get(department, 0) >= self.max_per_department:
+                self.skipped_department += 1
+                continue
+            gain = self._gain(match.match_score, totals.get(department, 0.0))
+            next_bound = max(-heap[0][0] if heap else -math.inf,
+                             self._gain(pending[1].match_score, 0.0) if pending else -math.inf)
+            if gain >= next_bound:
+                selected.append((raw_rank, match))
+                totals[department] = totals.get(department, 0.0) + match.match_score
+                counts[department] = counts.get(department, 0) + 1
+                self.exposure[match.employee_id] = self.exposure.get(match.employee_id, 0) + 1
+            else:
+                heapq.heappush(heap, (-gain, raw_rank, match))
+        return selected
+
+def run_mathematical_verification(profiler=None, rerank: Optional[Dict] = None):
+    """수학적 검증 실행
+    
+    profiler: hcm_profiling.Profiler, 시뮬레이션 구간 프로파일링
+    rerank: FairReranker 설정 (max_exposure, diversity, max_per_department), None이면 원래 상위 5명
+    """
     print("🔬 HCM 매칭 알고리즘 수학적 검증 시작...")
     
     # 시뮬레이터 초기화
-    simulator = HCMMatchingSimulator()
+    simulator = HCMMatchingSimulator(profiler)
     
     # 다양한 규모로 테스트
     test_scenarios = [
@@ -284,11 +733,28 @@ def run_mathematical_verification():
         print(f"\n📊 {scenario['name']} 시나리오 실행...")
         print(f"   직원 수: {scenario['employees']}, 태스크 수: {scenario['tasks']}")
         
-        # 데이터 생성
-        simulator.generate_sample_data(scenario['employees'], scenario['tasks'])
+        # 데이터 생성 (generate_sample_data는 기존 명단에 덧붙이고 ID가 EMP_000부터 다시 시작하므로
+        # 시나리오마다 비워서 직원 ID가 겹치지 않게 함 - 노출 상한/부서 매핑이 ID 기준)
+        simulator.employees = []
+        simulator.tasks = []
+        with simulator.phase('data_generation'):
+            simulator.generate_sample_data(scenario['employees'], scenario['tasks'])
+        
+        reranker = None
+        if rerank is not None:
+            # 노출 상한 기본값: 평균 노출(태스크 수 x 5 / 직원 수)의 2배
+            max_exposure = rerank.get('max_exposure') or \
+                math.ceil(2 * len(simulator.tasks) * 5 / max(1, len(simulator.employees)))
+            reranker = FairReranker({employee.id: employee.department for employee in simulator.employees},
+                                    k=5, max_exposure=max_exposure, diversity=rerank.get('diversity', 0.5),
+                                    max_per_department=rerank.get('max_per_department'))
         
         # 시뮬레이션 실행
-        results_df = simulator.run_matching_simulation()
+        if profiler:
+            with profiler.profile(f"matching_{scenario['name']}"):
+                results_df = simulator.run_matching_simulation(reranker)
+        else:
+            results_df = simulator.run_matching_simulation(reranker)
         results_df['scenario'] = scenario['name']
         all_results.append(results_df)
         
@@ -298,100 +764,82 @@ def run_mathematical_verification():
         print(f"   평균 매칭 점수: {stats['match_score_stats']['mean']:.3f}")
         print(f"   고신뢰도 매칭 비율: {stats['confidence_stats']['high_confidence_ratio']:.1%}")
         print(f"   스킬-매칭 상관관계: {stats['correlation_analysis']['skill_vs_match']:.3f}")
+        if reranker:
+            exposure = simulator.exposure_analysis(results_df)
+            print(f"   노출: 직원 {exposure['distinct_employees']}명, 최대 {exposure['max_exposure']}회 "
+                  f"(상한 {reranker.max_exposure}), 지니 {exposure['gini']:.3f}, "
+                  f"목록당 부서 {exposure['departments_per_task']:.1f}개")
     
     # 전체 결과 병합
-    combined_results = pd.concat(all_results, ignore_index=True)
+    with simulator.phase('dataframe'):
+        combined_results = pd.concat(all_results, ignore_index=True)
     
     # 결과 저장
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     results_file = f"./test-results/matching_verification_{timestamp}.csv"
-    combined_results.to_csv(results_file, index=False, encoding='utf-8-sig')
+    with simulator.phase('io'):
+        combined_results.to_csv(results_file, index=False, encoding='utf-8-sig')
     
     print(f"\n✅ 검증 완료! 결과 저장: {results_file}")
     
     return combined_results
 
-def create_visualization_plots(results_df: pd.DataFrame):
-    """시각화 생성"""
-    plt.style.use('default')
-    fig, axes = plt.subplots(2, 3, figsize=(18, 12))
-    fig.suptitle('HCM 매칭 알고리즘 성능 분석', fontsize=16, fontweight='bold')
-    
-    # 1. 매칭 점수 분포
-    axes[0, 0].hist(results_df['match_score'], bins=30, alpha=0.7, color='skyblue', edgecolor='black')
-    axes[0, 0].set_title('매칭 점수 분포')
-    axes[0, 0].set_xlabel('매칭 점수')
-    axes[0, 0].set_ylabel('빈도')
-    axes[0, 0].axvline(results_df['match_score'].mean(), color='red', linestyle='--', 
-                      label=f'평균: {results_df["match_score"].mean():.3f}')
-    axes[0, 0].legend()
-    
-    # 2. 신뢰도 vs 매칭 점수
-    axes[0, 1].scatter(results_df['confidence'], results_df['match_score'], alpha=0.6, color='green')
-    axes[0, 1].set_title('신뢰도 vs 매칭 점수')
-    axes[0, 1].set_xlabel('신뢰도')
-    axes[0, 1].set_ylabel('매칭 점수')
-    
-    # 회귀선 추가
-    z = np.polyfit(results_df['confidence'], results_df['match_score'], 1)
-    p = np.poly1d(z)
-    axes[0, 1].plot(results_df['confidence'], p(results_df['confidence']), "r--", alpha=0.8)
-    
-    # 3. 태스크 복잡도별 매칭 성능
-    complexity_bins = pd.cut(results_df['task_complexity'], bins=5, labels=['Very Low', 'Low', 'Medium', 'High', 'Very High'])
-    complexity_scores = results_df.groupby(complexity_bins)['match_score'].mean()
-    axes[0, 2].bar(range(len(complexity_scores)), complexity_scores.values, color='orange', alpha=0.7)
-    axes[0, 2].set_title('태스크 복잡도별 평균 매칭 점수')
-    axes[0, 2].set_xlabel('복잡도')
-    axes[0, 2].set_ylabel('평균 매칭 점수')
-    axes[0, 2].set_xticks(range(len(complexity_scores)))
-    axes[0, 2].set_xticklabels(complexity_scores.index, rotation=45)
-    
-    # 4. 우선순위별 성능
-    priority_groups = results_df.groupby('task_priority')['match_score'].mean()
-    axes[1, 0].plot(priority_groups.index, priority_groups.values, marker='o', linewidth=2, markersize=6, color='purple')
-    axes[1, 0].set_title('태스크 우선순위별 평균 매칭 점수')
-    axes[1, 0].set_xlabel('우선순위')
-    axes[1, 0].set_ylabel('평균 매칭 점수')
-    axes[1, 0].grid(True, alpha=0.3)
-    
-    # 5. 각 요소별 기여도
-    factors = ['skill_score', 'availability_score', 'experience_score', 'priority_score']
-    factor_means = [results_df[factor].mean() for factor in factors]
-    factor_labels = ['스킬', '가용성', '경험', '우선순위']
-    
-    axes[1, 1].bar(factor_labels, factor_means, color=['red', 'blue', 'green', 'orange'], alpha=0.7)
-    axes[1, 1].set_title('매칭 요소별 평균 점수')
-    axes[1, 1].set_ylabel('평균 점수')
-    axes[1, 1].tick_params(axis='x', rotation=45)
-    
-    # 6. 순위별 점수 분포
-    rank_scores = results_df.groupby('rank')['match_score'].mean()
-    axes[1, 2].bar(rank_scores.index, rank_scores.values, color='teal', alpha=0.7)
-    axes[1, 2].set_title('순위별 평균 매칭 점수')
-    axes[1, 2].set_xlabel('순위')
-    axes[1, 2].set_ylabel('평균 매칭 점수')
-    
-    plt.tight_layout()
-    
-    # 저장
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    plot_file = f"./test-results/matching_analysis_{timestamp}.png"
-    plt.savefig(plot_file, dpi=300, bbox_inches='tight')
-    plt.show()
+def create_visualization_plots(results_df: pd.DataFrame, show: bool = True, quick: bool = False,
+                               html: bool = False):
+    """시각화 생성 (show=False면 백그라운드 프로세스에서 렌더링해 파일만 저장)"""
+    hcm_reports = load_testing_module('hcm_reports')
+    renderer = hcm_reports.ReportRenderer(hcm_reports.ReportOptions(show=show, quick=quick, html=html))
     
-    print(f"📊 시각화 저장: {plot_file}")
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    columns = {name: results_df[name].to_numpy() for name in (
+        'match_score', 'confidence', 'task_complexity', 'task_priority', 'rank',
+        'skill_score', 'availability_score', 'experience_score', 'priority_score')}
+    renderer.submit(hcm_reports.ReportFigure('matching', columns, f"./test-results/matching_analysis_{timestamp}.png"))
+    renderer.finish('HCM 매칭 알고리즘 성능 분석', html_file=f"./test-results/matching_report_{timestamp}.html",
+                    summary=HCMMatchingSimulator().statistical_analysis(results_df))
 
 if __name__ == "__main__":
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="HCM 매칭 알고리즘 수학적 검증 및 시뮬레이션")
+    parser.add_argument("--non-interactive", action="store_true",
+                        help="그래프를 화면 출력 없이 파일로만 저장 (CI용)")
+    parser.add_argument("--no-plots", action="store_true", help="그래프 생성 생략")
+    parser.add_argument("--quick-report", action="store_true", help="그래프를 낮은 해상도로 빠르게 렌더링")
+    parser.add_argument("--html-report", action="store_true", help="그래프와 요약을 담은 HTML 보고서 생성")
+    parser.add_argument("--profile", nargs="?", const="sample", choices=["sample", "cprofile"],
+                        help="매칭 시뮬레이션 프로파일링 (sample: collapsed-stack 파일, cprofile: .prof 파일)")
+    parser.add_argument("--profile-interval", type=float, default=5.0, help="샘플링 간격 (ms)")
+    parser.add_argument("--profile-alloc", action="store_true", help="tracemalloc으로 메모리 할당 위치 비교")
+    parser.add_argument("--rerank", action="store_true",
+                        help="직원별 노출 상한과 부서 다양성을 반영해 태스크별 상위 5명 재선택")
+    parser.add_argument("--max-exposure", type=int, help="직원 한 명이 추천될 수 있는 최대 태스크 수 (기본: 평균의 2배)")
+    parser.add_argument("--diversity", type=float, default=0.5, help="부서 다양성 가중치 (0-1, 0이면 점수순)")
+    parser.add_argument("--max-per-department", type=int, help="태스크별 목록에 같은 부서 최대 인원")
+    args = parser.parse_args()
+    
     # 결과 디렉토리 생성
-    import os
     os.makedirs("./test-results", exist_ok=True)
     
+    profiler = None
+    if args.profile or args.profile_alloc:
+        hcm_profiling = load_testing_module('hcm_profiling')
+        profiler = hcm_profiling.Profiler(hcm_profiling.ProfileOptions(
+            mode=args.profile, interval=args.profile_interval / 1000, allocations=args.profile_alloc))
+    
     # 수학적 검증 실행
-    results = run_mathematical_verification()
+    rerank = None
+    if args.rerank:
+        rerank = {'max_exposure': args.max_exposure, 'diversity': args.diversity,
+                  'max_per_department': args.max_per_department}
+    results = run_mathematical_verification(profiler, rerank)
+    if profiler:
+        profiler.report('matching_phases')
     
     # 시각화 생성
-    create_visualization_plots(results)
+    if not args.no_plots:
+        create_visualization_plots(results, show=not args.non_interactive, quick=args.quick_report,
+                                   html=args.html_report)
     
     print("\n🎉 수학적 검증 및 시각화 완료!")
     print("📁 결과 파일들이 ./test-results/ 디렉토리에 저장되었습니다.")